@@ -12,16 +12,24 @@ from .engine_registry import EngineRegistry
 from .execution_loop import ExecutionLoop
 from .state_centric_execution_loop import StateCentricExecutionLoop
 from .data_flow import DataFlowManager
-from .interfaces import BrainEngine, BrainEngineBase, DataConverter, StateSynchronizer
+from .interfaces import BrainEngine, BrainEngineBase, DataConverter, ConverterRegistry, StateSynchronizer
 from .engine_adapters import EngineAdapter, MockEngineAdapter
-from .global_state import GlobalState
+from .global_state import GlobalState, CompactGlobalState, state_memory_report
 from .execution_modes import ExecutionMode, SelfOrganizingEngine, ControllerEngine
+from .precision import PrecisionPolicy
+from .state_io import serialize_state, deserialize_state
+from .session_pool import SessionPool
+from .batching import CycleBatcher
+from .instrumentation import EngineProfiler, LatencyHistogram
+from .event_sink import EventSink
+from .circuit_breaker import CircuitBreaker, CircuitBreakerSet
 from .engine_wrappers import (
     WellFormationEngineWrapper,
     StateManifoldEngineWrapper,
     NeuralDynamicsCoreWrapper,
     HistoricalDataReconstructorWrapper,
     CingulateCortexEngineWrapper,
+    PhysicsPipelineBridge,
 )
 
 __version__ = "0.2.0"
@@ -35,10 +43,23 @@ __all__ = [
     "BrainEngine",
     "BrainEngineBase",
     "DataConverter",
+    "ConverterRegistry",
     "StateSynchronizer",
     "EngineAdapter",
     "MockEngineAdapter",
     "GlobalState",
+    "CompactGlobalState",
+    "state_memory_report",
+    "PrecisionPolicy",
+    "serialize_state",
+    "deserialize_state",
+    "SessionPool",
+    "CycleBatcher",
+    "EngineProfiler",
+    "LatencyHistogram",
+    "EventSink",
+    "CircuitBreaker",
+    "CircuitBreakerSet",
     "ExecutionMode",
     "SelfOrganizingEngine",
     "ControllerEngine",  # 확장 가능성 (현재 사용 안 함)
@@ -47,5 +68,6 @@ __all__ = [
     "NeuralDynamicsCoreWrapper",
     "HistoricalDataReconstructorWrapper",
     "CingulateCortexEngineWrapper",
+    "PhysicsPipelineBridge",
 ]
 
@@ -0,0 +1,288 @@
+"""
+Batching - run_cycle 요청 마이크로 배칭
+
+동시에 들어오는 작은 run_cycle 요청들을 짧은 시간 창(window) 동안 모아
+한 번의 배치 사이클(BrainCore.run_batch)로 실행한 뒤 결과를 돌려줌
+
+산업용 중심:
+- 처리량 향상 (요청당 사이클/수렴 판정 오버헤드 분산)
+- 추가 지연은 max_wait로 상한
+
+Note:
+    엔진 갱신 자체가 묶여 실행되는 것은 update_batch(states)를 제공하는 엔진뿐.
+    내장 엔진 래퍼는 update_batch가 없으므로 엔진 호출은 상태별로 이루어짐.
+
+배치 구성 규칙:
+- 최대 max_batch_size개 또는 첫 요청 이후 max_wait초까지 수집
+- (max_steps, convergence_threshold, deadline, engine_budgets, shape, dtype)이 같은 요청끼리 묶어 실행
+- deadline/engine_budgets는 묶인 배치 사이클 전체에 적용 (None이면 BrainCore 기본값)
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import Future
+import queue
+import threading
+import time
+import logging
+import numpy as np
+
+from .global_state import GlobalState
+
+__version__ = "0.1.0"
+
+_STOP = object()
+
+
+class CycleBatcher:
+    """run_cycle 요청 결합기 (BrainCore 앞단)
+
+    사용 예시:
+        with CycleBatcher(core, max_batch_size=64, max_wait=0.002) as batcher:
+            result = batcher.run_cycle(state)          # 블로킹
+            future = batcher.submit(other_state)       # 비블로킹
+    """
+
+    def __init__(
+        self,
+        core: Any,
+        max_batch_size: int = 32,
+        max_wait: float = 0.002,
+        enable_logging: bool = True,
+    ):
+        """CycleBatcher 초기화
+
+        Args:
+            core: BrainCore 인스턴스 (run_batch 필요)
+            max_batch_size: 배치 최대 크기
+            max_wait: 첫 요청 이후 추가 요청을 기다리는 최대 시간 (초)
+            enable_logging: 로깅 활성화 여부
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+
+        self.core = core
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._requests: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "requests": 0,
+            "batches": 0,
+            "max_batch_size_seen": 0,
+        }
+
+        if enable_logging:
+            self.logger = logging.getLogger("CycleBatcher")
+        else:
+            self.logger = None
+
+    def start(self):
+        """워커 스레드 시작 (submit 시 자동 시작)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CycleBatcher가 이미 종료되었습니다.")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="CycleBatcher", daemon=True,
+                )
+                self._worker.start()
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 요청을 처리한 뒤 워커 종료
+
+        Args:
+            timeout: 워커 종료 대기 시간 (초)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            if worker is not None:
+                self._requests.put(_STOP)
+        if worker is not None:
+            worker.join(timeout)
+
+    def __enter__(self) -> 'CycleBatcher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(
+        self,
+        initial_state: GlobalState,
+        max_steps: int = 100,
+        convergence_threshold: float = 1e-4,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
+    ) -> Future:
+        """사이클 요청 제출
+
+        Args:
+            initial_state: 초기 상태
+            max_steps: 최대 스텝 수
+            convergence_threshold: 수렴 임계값
+            deadline: 사이클 시간 상한 (초, None이면 BrainCore의 cycle_deadline)
+            engine_budgets: 엔진별 시간 예산 (None이면 BrainCore의 설정값)
+
+        Returns:
+            run_cycle 결과 딕셔너리를 담을 Future
+        """
+        if initial_state is None:
+            raise ValueError("initial_state는 필수입니다.")
+        self.start()
+
+        future: Future = Future()
+        with self._lock:
+            # 종료 신호 이후에는 요청이 큐에 들어가지 않도록 잠금 안에서 확인
+            if self._closed:
+                raise RuntimeError("CycleBatcher가 이미 종료되었습니다.")
+            budgets = None if engine_budgets is None else tuple(sorted(engine_budgets.items()))
+            self._requests.put((initial_state, max_steps, convergence_threshold, deadline, budgets, future))
+        return future
+
+    def run_cycle(
+        self,
+        initial_state: GlobalState,
+        max_steps: int = 100,
+        convergence_threshold: float = 1e-4,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """사이클 실행 (결과가 나올 때까지 블로킹)
+
+        Returns:
+            BrainCore.run_cycle()과 같은 형식의 결과
+        """
+        return self.submit(
+            initial_state, max_steps, convergence_threshold, deadline, engine_budgets,
+        ).result(timeout)
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        try:
+            self._serve()
+        finally:
+            # 예기치 않은 종료 포함: 이후 submit은 거부하고 대기 중인 요청은 실패 처리 (무한 대기 방지)
+            with self._lock:
+                self._closed = True
+            self._fail_queued(RuntimeError("CycleBatcher 워커가 종료되었습니다."))
+
+    def _serve(self):
+        stopping = False
+        while not stopping:
+            first = self._requests.get()
+            if first is _STOP:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._requests.get(timeout=remaining) if remaining > 0 \
+                        else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._execute_safely(batch)
+
+        # 종료 후 남은 요청 처리
+        leftovers = []
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftovers.append(item)
+        for start in range(0, len(leftovers), self.max_batch_size):
+            self._execute_safely(leftovers[start:start + self.max_batch_size])
+
+    def _execute_safely(self, batch: List[Tuple[Any, ...]]):
+        """_execute의 예기치 않은 오류는 아직 끝나지 않은 요청에만 전달 (워커는 계속 실행)"""
+        try:
+            self._execute(batch)
+        except Exception as e:
+            if self.logger:
+                self.logger.error("배치 분배 중 오류 (%d개 요청): %s", len(batch), e)
+            for item in batch:
+                future = item[-1]
+                if not future.done():
+                    future.set_exception(e)
+
+    def _fail_queued(self, error: Exception):
+        """큐에 남은 요청을 모두 실패 처리"""
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item[-1].set_running_or_notify_cancel():
+                item[-1].set_exception(error)
+
+    def _execute(self, batch: List[Tuple[Any, ...]]):
+        """호환되는 요청끼리 묶어 run_batch 실행 후 결과 분배"""
+        groups: Dict[Tuple[Any, ...], List[Tuple[GlobalState, Future]]] = {}
+        for state, max_steps, threshold, deadline, budgets, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                vector = np.asarray(state.state_vector)
+                key = (max_steps, threshold, deadline, budgets, vector.shape, vector.dtype.str)
+                groups.setdefault(key, []).append((state, future))
+            except Exception as e:
+                # 잘못된 요청은 해당 요청만 실패 (같은 배치의 다른 요청은 계속 진행)
+                future.set_exception(e)
+
+        for (max_steps, threshold, deadline, budgets, _, _), items in groups.items():
+            try:
+                results = self.core.run_batch(
+                    [state for state, _ in items],
+                    max_steps=max_steps,
+                    convergence_threshold=threshold,
+                    deadline=deadline,
+                    engine_budgets=None if budgets is None else dict(budgets),
+                )
+                if len(results) != len(items):
+                    raise RuntimeError(f"배치 결과 수 불일치: 요청 {len(items)}개, 결과 {len(results)}개")
+            except Exception as e:
+                if self.logger:
+                    self.logger.error("배치 실행 중 오류 (%d개 요청): %s", len(items), e)
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+            self.stats["batches"] += 1
+            self.stats["requests"] += len(items)
+            self.stats["max_batch_size_seen"] = max(self.stats["max_batch_size_seen"], len(items))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """결합 통계 반환"""
+        stats = dict(self.stats)
+        stats["avg_batch_size"] = (
+            stats["requests"] / stats["batches"] if stats["batches"] else 0.0
+        )
+        return stats
@@ -26,12 +26,19 @@ from __future__ import annotations
 
 from typing import Dict, Any, Optional, List
 import logging
+import numpy as np
 
 from .engine_registry import EngineRegistry
 from .state_centric_execution_loop import StateCentricExecutionLoop
 from .data_flow import DataFlowManager
 from .global_state import GlobalState
 from .engines.cingulate_cortex import CingulateCortexEngine
+from .precision import PrecisionPolicy
+from .state_io import serialize_state, deserialize_state
+from .session_pool import SessionPool
+from .instrumentation import EngineProfiler
+from .event_sink import EventSink
+from .circuit_breaker import CircuitBreakerSet
 
 __version__ = "0.3.0"
 
@@ -51,31 +58,65 @@ class BrainCore:
         self,
         mode: str = "production",
         enable_logging: bool = True,
+        precision: str = "float64",
+        enable_profiling: bool = False,
+        trace_allocations: bool = False,
+        event_sink: Optional[EventSink] = None,
+        failure_threshold: Optional[int] = None,
+        breaker_cooldown: float = 30.0,
+        cycle_deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
     ):
         """BrainCore 초기화
         
         Args:
             mode: "production" (산업용) 또는 "research" (연구용)
             enable_logging: 로깅 활성화 여부
+            precision: 상태 파이프라인 정밀도 ("float64", "float32", "float16")
+            enable_profiling: 엔진별 지연 계측 활성화 여부
+            trace_allocations: 엔진별 tracemalloc 할당 계측 (enable_profiling 필요)
+            event_sink: 구조화 이벤트 싱크 (핫 루프 이벤트를 튜플로 기록)
+            failure_threshold: 엔진 차단 연속 실패 횟수 (None이면 차단기 사용 안 함, 기본값).
+                사용 시 예외를 낸 엔진은 그 사이클에서만 제외되고 사이클은 계속 진행
+            breaker_cooldown: 차단된 엔진 재시험까지 대기 시간 (초)
+            cycle_deadline: 기본 사이클 시간 상한 (초, None이면 제한 없음)
+            engine_budgets: 기본 엔진별 사이클 시간 예산 {엔진 이름: 초}
         
         Note:
             현재는 SELF_ORGANIZING 모드만 사용 (상태 중심 실행)
             필요할 때 CONTROLLER 모드 추가 가능 (ControllerEngine Protocol 유지)
+            
+            차단기는 엔진 이름 단위로 이 BrainCore 전체에서 공유됨. SessionPool/CycleBatcher로
+            여러 세션·테넌트를 실행하면 한 세션의 실패가 다른 세션의 엔진 호출도 차단하므로,
+            세션별 격리가 필요하면 세션마다 별도 BrainCore를 사용할 것.
         """
         self.mode = mode
         self.enable_logging = enable_logging
+        self.precision = PrecisionPolicy(precision)
+        self.cycle_deadline = cycle_deadline
+        self.engine_budgets = dict(engine_budgets or {})
         
         # 컴포넌트 초기화
         self.registry = EngineRegistry()
         self.data_flow = DataFlowManager(mode=mode, enable_logging=enable_logging)
+        self.profiler = (
+            EngineProfiler(trace_allocations=trace_allocations) if enable_profiling else None
+        )
+        self.circuit_breakers = (
+            CircuitBreakerSet(failure_threshold=failure_threshold, cooldown=breaker_cooldown)
+            if failure_threshold is not None else None
+        )
         self.state_centric_loop = StateCentricExecutionLoop(
             enable_logging=enable_logging,
+            profiler=self.profiler,
+            event_sink=event_sink,
+            circuit_breakers=self.circuit_breakers,
         )
         
         # 로깅 설정
         if enable_logging:
             self.logger = logging.getLogger("BrainCore")
-            self.logger.info(f"BrainCore 초기화 완료 (모드: {mode}, 실행 모드: self_organizing)")
+            self.logger.info("BrainCore 초기화 완료 (모드: %s, 실행 모드: self_organizing)", mode)
         else:
             self.logger = None
         
@@ -101,7 +142,7 @@ class BrainCore:
         """
         self.registry.register(name, engine, priority)
         if self.logger:
-            self.logger.info(f"엔진 등록: {name} (우선순위: {priority})")
+            self.logger.info("엔진 등록: %s (우선순위: %d)", name, priority)
     
     def run_cycle(
         self,
@@ -109,6 +150,8 @@ class BrainCore:
         return_intermediate: bool = False,
         max_steps: int = 100,
         convergence_threshold: float = 1e-4,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """실행 사이클
         
@@ -122,6 +165,8 @@ class BrainCore:
             return_intermediate: 중간 결과 반환 여부
             max_steps: 최대 스텝 수
             convergence_threshold: 수렴 임계값
+            deadline: 사이클 시간 상한 (초, None이면 cycle_deadline 사용)
+            engine_budgets: 엔진별 시간 예산 (None이면 생성 시 설정값 사용)
         
         Returns:
             실행 결과:
@@ -129,10 +174,40 @@ class BrainCore:
             - final_state: 최종 상태
             - trajectory: 상태 궤적 (return_intermediate=True일 때)
             - mode: 실행 모드 ("self_organizing")
+            - deadline_exceeded: 시간 상한 초과로 중단되었는지 여부
+            - timings: 사이클 시간 정보 (elapsed, engine_time, over_budget, status, steps)
+            - degraded_engines: 차단(open/half_open) 상태 엔진 이름 (차단기 사용 시)
+        
+        Note:
+            initial_state는 precision 정책의 dtype으로 변환된 뒤 실행됨
         """
+        return self._run_cycle(
+            initial_state,
+            self.precision,
+            return_intermediate=return_intermediate,
+            max_steps=max_steps,
+            convergence_threshold=convergence_threshold,
+            deadline=deadline,
+            engine_budgets=engine_budgets,
+        )
+    
+    def _run_cycle(
+        self,
+        initial_state: GlobalState,
+        precision: PrecisionPolicy,
+        return_intermediate: bool = False,
+        max_steps: int = 100,
+        convergence_threshold: float = 1e-4,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """run_cycle 본체 (정밀도 정책을 인자로 받아 공유 상태를 바꾸지 않음)"""
         if initial_state is None:
             raise ValueError("initial_state는 필수입니다.")
         
+        # 정밀도 정책 적용 (shallow copy → 원본 불변)
+        initial_state = precision.apply(initial_state.copy())
+        
         # 자기조직화 엔진 수집
         self_organizing_engines = [
             engine for engine in self.registry.get_engines().values()
@@ -158,33 +233,195 @@ class BrainCore:
             max_steps=max_steps,
             convergence_threshold=convergence_threshold,
             return_trajectory=return_intermediate,
+            deadline=deadline if deadline is not None else self.cycle_deadline,
+            engine_budgets=engine_budgets if engine_budgets is not None else self.engine_budgets,
         )
+        # 스레드별 정보 (SessionPool/CycleBatcher 등 여러 스레드가 같은 코어를 써도 섞이지 않음)
+        timings = self.state_centric_loop.last_cycle_info
         
         if return_intermediate:
             final_state, trajectory = result
-            return {
+            return self._with_health({
                 "success": True,
                 "final_state": final_state,
                 "trajectory": trajectory,
                 "mode": "self_organizing",
-            }
+                "deadline_exceeded": timings["deadline_exceeded"],
+                "timings": timings,
+            })
         else:
             final_state, _ = result
-            return {
+            return self._with_health({
                 "success": True,
                 "final_state": final_state,
                 "mode": "self_organizing",
-            }
+                "deadline_exceeded": timings["deadline_exceeded"],
+                "timings": timings,
+            })
+    
+    def run_batch(
+        self,
+        initial_states: List[GlobalState],
+        max_steps: int = 100,
+        convergence_threshold: float = 1e-4,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """독립 상태 여러 개를 한 번의 배치 사이클로 실행
+        
+        엔진 갱신이 묶여 실행되는 것은 update_batch를 제공하는 엔진뿐
+        (StateCentricExecutionLoop.run_batch 참조). 내장 래퍼만 등록된 경우
+        절약되는 것은 사이클/수렴 판정 오버헤드뿐.
+        
+        Args:
+            initial_states: 초기 상태 리스트 (state_vector shape 동일)
+            max_steps: 최대 스텝 수
+            convergence_threshold: 수렴 임계값
+            deadline: 배치 사이클 시간 상한 (초, None이면 cycle_deadline 사용)
+            engine_budgets: 엔진별 시간 예산 (None이면 생성 시 설정값 사용)
+        
+        Returns:
+            상태별 실행 결과 리스트 (run_cycle 결과와 같은 형식, 입력 순서 유지)
+            (deadline_exceeded/timings는 배치 전체 기준)
+        """
+        engines = {
+            name: engine for name, engine in self.registry.get_engines().items()
+            if hasattr(engine, 'update')
+        }
+        
+        if not engines:
+            if self.logger:
+                self.logger.warning("등록된 엔진이 없습니다.")
+            return [
+                {"success": False, "final_state": state, "mode": "self_organizing"}
+                for state in initial_states
+            ]
+        
+        final_states = self.state_centric_loop.run_batch(
+            initial_states=[self.precision.apply(state.copy()) for state in initial_states],
+            engines=engines,
+            max_steps=max_steps,
+            convergence_threshold=convergence_threshold,
+            deadline=deadline if deadline is not None else self.cycle_deadline,
+            engine_budgets=engine_budgets if engine_budgets is not None else self.engine_budgets,
+        )
+        timings = self.state_centric_loop.last_cycle_info
+        return [
+            self._with_health({
+                "success": True,
+                "final_state": state,
+                "mode": "self_organizing",
+                "deadline_exceeded": timings["deadline_exceeded"],
+                "timings": dict(timings),
+            })
+            for state in final_states
+        ]
+    
+    def _with_health(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """실행 결과에 차단 엔진 목록 추가 (차단기 사용 시)"""
+        if self.circuit_breakers is not None:
+            result["degraded_engines"] = self.circuit_breakers.degraded()
+        return result
     
     def get_system_state(self) -> Dict[str, Any]:
         """시스템 상태 반환
         
         Returns:
-            시스템 상태 정보
+            시스템 상태 정보 (enable_profiling=True면 "instrumentation" 포함)
         """
-        return {
+        system_state = {
             "mode": self.mode,
             "execution_mode": "self_organizing",
+            "precision": self.precision.precision,
             "registered_count": len(self.registry.get_engines()),
             "engines": list(self.registry.get_engines().keys()),
         }
+        if self.profiler is not None:
+            system_state["instrumentation"] = self.profiler.to_dict()
+        if self.circuit_breakers is not None:
+            system_state["circuit_breakers"] = self.circuit_breakers.to_dict()
+        return system_state
+    
+    def create_session_pool(self, **pool_kwargs) -> SessionPool:
+        """세션 풀 생성 (멀티 테넌트 실행용)
+        
+        Args:
+            **pool_kwargs: SessionPool 인자 (max_sessions, spill_dir 등)
+        
+        Returns:
+            이 BrainCore로 사이클을 실행하는 SessionPool
+        """
+        return SessionPool(self, enable_logging=self.enable_logging, **pool_kwargs)
+    
+    def serialize_state(self, state: GlobalState) -> bytes:
+        """상태 직렬화 (정밀도 정책 적용)
+        
+        Args:
+            state: 상태
+        
+        Returns:
+            바이너리 상태 포맷 (state_io 참조)
+        """
+        return serialize_state(state, precision=self.precision)
+    
+    def deserialize_state(self, data: bytes) -> GlobalState:
+        """상태 역직렬화 (정밀도 정책 적용)
+        
+        Args:
+            data: 바이너리 상태 포맷
+        
+        Returns:
+            복원된 상태
+        """
+        return deserialize_state(data, precision=self.precision)
+    
+    def precision_report(
+        self,
+        initial_state: GlobalState,
+        precisions: Optional[List[str]] = None,
+        **run_kwargs,
+    ) -> Dict[str, Any]:
+        """정밀도별 정확도 보고
+        
+        같은 초기 상태로 float64 기준 사이클과 각 정밀도 사이클을 실행하여
+        최종 에너지와 상태 벡터를 비교.
+        (정밀도 정책은 호출별 인자로 전달 → 다른 스레드의 사이클에 영향 없음)
+        
+        Args:
+            initial_state: 초기 상태
+            precisions: 비교할 정밀도 리스트 (None이면 ["float32", "float16"])
+            **run_kwargs: run_cycle() 인자 (max_steps 등)
+        
+        Returns:
+            {"reference": {...}, precision: {final_energy, abs_error, rel_error,
+             max_state_error, steps}}
+        """
+        if precisions is None:
+            precisions = ["float32", "float16"]
+        
+        reference = self._run_cycle(initial_state, PrecisionPolicy("float64"), **run_kwargs)["final_state"]
+        ref_energy = float(reference.energy)
+        ref_vector = np.asarray(reference.state_vector, dtype=np.float64)
+        
+        report: Dict[str, Any] = {
+            "reference": {
+                "precision": "float64",
+                "final_energy": ref_energy,
+                "steps": reference.step,
+            },
+        }
+        for precision in precisions:
+            final_state = self._run_cycle(initial_state, PrecisionPolicy(precision), **run_kwargs)["final_state"]
+            energy = float(final_state.energy)
+            vector = np.asarray(final_state.state_vector, dtype=np.float64)
+            abs_error = abs(energy - ref_energy)
+            report[precision] = {
+                "final_energy": energy,
+                "abs_error": abs_error,
+                "rel_error": abs_error / max(abs(ref_energy), np.finfo(np.float64).tiny),
+                "max_state_error": float(np.max(np.abs(vector - ref_vector)))
+                if vector.shape == ref_vector.shape else float("nan"),
+                "steps": final_state.step,
+            }
+        
+        return report
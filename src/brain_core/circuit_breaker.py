@@ -0,0 +1,181 @@
+"""
+Circuit Breaker - 엔진별 장애 차단기
+
+계속 실패하는 엔진을 매 스텝 다시 호출하지 않도록 차단
+
+상태 전이:
+    closed ──(연속 실패 failure_threshold회)──▶ open
+    open ──(cooldown 경과)──▶ half_open (시험 호출 1회 허용)
+    half_open ──(성공)──▶ closed
+    half_open ──(실패)──▶ open (cooldown 다시 시작)
+
+산업용 중심:
+- 고장 난 엔진이 매 스텝 CPU를 소모하지 않음 (빠른 실패)
+- 차단된 엔진 목록으로 성능 저하(degraded) 상태를 호출자에게 노출
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Callable, List, Optional
+import time
+
+__version__ = "0.1.0"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """엔진 하나의 차단기"""
+
+    __slots__ = (
+        "failure_threshold", "cooldown", "_clock",
+        "state", "consecutive_failures", "total_failures", "opened_at", "last_error", "times_opened",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CircuitBreaker 초기화
+
+        Args:
+            failure_threshold: open으로 전환할 연속 실패 횟수
+            cooldown: open 이후 시험 호출까지 대기 시간 (초)
+            clock: 시간 함수 (테스트용 교체 가능)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold는 1 이상이어야 합니다.")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (open 상태에서 cooldown이 지나면 half_open으로 전환 후 1회 허용)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and self._clock() - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            return True
+        return False
+
+    def record_success(self):
+        """호출 성공 기록"""
+        self.consecutive_failures = 0
+        self.state = CLOSED
+
+    def record_failure(self, error: Any = None):
+        """호출 실패 기록
+
+        Args:
+            error: 오류 (예외 또는 메시지)
+        """
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        if error is not None:
+            self.last_error = repr(error) if isinstance(error, BaseException) else str(error)
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = self._clock()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "times_opened": self.times_opened,
+            "last_error": self.last_error,
+        }
+
+
+class CircuitBreakerSet:
+    """엔진 이름별 차단기 모음
+
+    StateCentricExecutionLoop(circuit_breakers=...)로 연결하여 사용.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CircuitBreakerSet 초기화
+
+        Args:
+            failure_threshold: 엔진별 open 전환 연속 실패 횟수
+            cooldown: open 이후 시험 호출까지 대기 시간 (초)
+            clock: 시간 함수 (테스트용 교체 가능)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """엔진 차단기 반환 (없으면 생성)"""
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            breaker = self.breakers[name] = CircuitBreaker(
+                self.failure_threshold, self.cooldown, self._clock,
+            )
+        return breaker
+
+    def allow(self, name: str) -> bool:
+        """엔진 호출 허용 여부"""
+        breaker = self.breakers.get(name)
+        return breaker is None or breaker.allow()
+
+    def probing(self, name: str) -> bool:
+        """엔진이 half_open(시험 호출 1회 허용) 상태인지 여부"""
+        breaker = self.breakers.get(name)
+        return breaker is not None and breaker.state == HALF_OPEN
+
+    def record_success(self, name: str):
+        """엔진 호출 성공 기록"""
+        breaker = self.breakers.get(name)
+        if breaker is not None:
+            breaker.record_success()
+
+    def record_failure(self, name: str, error: Any = None):
+        """엔진 호출 실패 기록"""
+        self.get(name).record_failure(error)
+
+    def degraded(self) -> List[str]:
+        """차단(open/half_open) 상태 엔진 이름 리스트"""
+        return [name for name, breaker in self.breakers.items() if breaker.state != CLOSED]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """차단기 상태 반환"""
+        return {
+            "failure_threshold": self.failure_threshold,
+            "cooldown": self.cooldown,
+            "engines": {name: breaker.to_dict() for name, breaker in self.breakers.items()},
+            "degraded": self.degraded(),
+        }
+
+    def reset(self, name: Optional[str] = None):
+        """차단기 초기화
+
+        Args:
+            name: 엔진 이름 (None이면 전체)
+        """
+        if name is None:
+            self.breakers.clear()
+        else:
+            self.breakers.pop(name, None)
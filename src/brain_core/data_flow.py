@@ -18,15 +18,72 @@ Version: 0.1.0
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import deque
+import sys
+import threading
 import time
 import logging
+import numpy as np
 
-from .interfaces import DataConverter, StateSynchronizer
+from .interfaces import DataConverter, ConverterRegistry, StateSynchronizer, SchemaValidator, Converter
+from .instrumentation import LatencyHistogram
 
 __version__ = "0.1.0"
 
 
+def estimate_size(data: Any) -> int:
+    """데이터 크기 근사 (바이트, 문자열 직렬화 없음)
+    
+    - ndarray: nbytes
+    - bytes/str: 길이
+    - dict/list/tuple: 컨테이너 크기 + 1단계 값들의 크기 (재귀하지 않음)
+    - 기타: sys.getsizeof
+    
+    Args:
+        data: 측정할 데이터
+    
+    Returns:
+        근사 크기 (바이트)
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (bytes, bytearray, str)):
+        return len(data)
+    if isinstance(data, dict):
+        values = data.values()
+    elif isinstance(data, (list, tuple)):
+        values = data
+    else:
+        return sys.getsizeof(data)
+    
+    size = sys.getsizeof(data)
+    for value in values:
+        size += value.nbytes if isinstance(value, np.ndarray) else sys.getsizeof(value)
+    return size
+
+
+class _EdgeStats:
+    """엔진 쌍(edge)별 누적 통계 (상수 메모리)"""
+    
+    __slots__ = ("count", "total_time", "total_bytes", "latency")
+    
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.total_bytes = 0
+        self.latency = LatencyHistogram()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_time": self.total_time,
+            "avg_time": self.total_time / self.count if self.count else 0.0,
+            "total_bytes": self.total_bytes,
+            "latency": self.latency.to_dict(),
+        }
+
+
 class DataFlowManager:
     """데이터 흐름 관리자
     
@@ -37,20 +94,38 @@ class DataFlowManager:
         self,
         mode: str = "production",
         enable_logging: bool = True,
+        history_size: int = 1000,
+        sync_record: str = "copy",
     ):
         """DataFlowManager 초기화
         
         Args:
             mode: "production" (산업용) 또는 "research" (연구용)
             enable_logging: 로깅 활성화 여부
+            history_size: 데이터 흐름 이력 최대 보관 수 (연구용)
+            sync_record: 상태 동기화 기록 방식 ("copy" 또는 "reference")
         """
         self.mode = mode
         self.enable_logging = enable_logging
         self.converter = DataConverter()
-        self.synchronizer = StateSynchronizer()
+        self.synchronizer = StateSynchronizer(record=sync_record)
+        
+        # 엔진 쌍별 변환 함수 (체인 해석 결과 캐시)
+        self.converters = ConverterRegistry()
+        
+        # 엔진 쌍별 컴파일된 스키마 {(source, target): validator}
+        self._validators: Dict[Tuple[str, str], SchemaValidator] = {}
+        
+        # 데이터 흐름 이력 (연구용, 최근 history_size개)
+        self.flow_history: deque = deque(maxlen=history_size)
         
-        # 데이터 흐름 이력 (연구용)
-        self.flow_history: List[Dict[str, Any]] = []
+        # 누적 통계 (연구용, 전달마다 갱신 → 조회 시 재집계 없음)
+        self._edge_stats: Dict[str, _EdgeStats] = {}
+        self._total_transfers = 0
+        self._total_time = 0.0
+        
+        # 스트리밍 실행 시 여러 단계 스레드가 공유하는 기록 보호
+        self._lock = threading.Lock()
         
         # 로깅 설정
         if enable_logging:
@@ -65,6 +140,7 @@ class DataFlowManager:
         source_engine: str,
         target_engine: str,
         validate: bool = True,
+        copy: bool = True,
     ) -> Dict[str, Any]:
         """데이터 전달
         
@@ -73,6 +149,7 @@ class DataFlowManager:
             source_engine: 소스 엔진 이름
             target_engine: 목표 엔진 이름
             validate: 유효성 검사 여부
+            copy: False면 복사 없이 전달 (zero-copy 모드, 읽기 전용 페이로드 권장)
         
         Returns:
             변환된 데이터
@@ -84,48 +161,103 @@ class DataFlowManager:
             source_data=source_data,
             source_engine=source_engine,
             target_engine=target_engine,
+            copy=copy,
+            plan=self.converters.resolve(source_engine, target_engine),
         )
         
-        # 유효성 검사
-        if validate:
-            is_valid, error_msg = self.converter.validate(converted_data)
+        # 유효성 검사 (등록된 엔진 쌍 스키마가 있을 때만 의미 있음)
+        validator = self._validators.get((source_engine, target_engine)) if validate else None
+        if validator is not None:
+            is_valid, error_msg = validator(converted_data)
             if not is_valid:
                 if self.logger:
                     self.logger.warning(
-                        f"데이터 유효성 검사 실패 ({source_engine} → {target_engine}): {error_msg}"
+                        "데이터 유효성 검사 실패 (%s → %s): %s", source_engine, target_engine, error_msg
                     )
                 # 산업용: 오류 발생 시 원본 데이터 반환
                 if self.mode == "production":
                     return source_data
                 else:
-                    # 연구용: 오류 정보 포함
+                    # 연구용: 오류 정보 포함 (zero-copy 모드면 이때만 복사)
+                    if not copy:
+                        converted_data = dict(converted_data)
                     converted_data["_validation_error"] = error_msg
         
         elapsed_time = time.time() - start_time
         
         # 데이터 흐름 이력 기록 (연구용)
         if self.mode == "research":
-            flow_record = {
+            data_size = estimate_size(converted_data)
+            self.flow_history.append({
                 "timestamp": time.time(),
                 "source": source_engine,
                 "target": target_engine,
-                "data_size": len(str(converted_data)),
+                "data_size": data_size,
                 "elapsed_time": elapsed_time,
                 "validated": validate,
-            }
-            self.flow_history.append(flow_record)
-            # 최근 1000개만 유지
-            if len(self.flow_history) > 1000:
-                self.flow_history = self.flow_history[-1000:]
+            })
+            
+            # 엔진 쌍별 통계 증분 갱신
+            key = f"{source_engine}→{target_engine}"
+            with self._lock:
+                edge = self._edge_stats.get(key)
+                if edge is None:
+                    edge = self._edge_stats[key] = _EdgeStats()
+                edge.count += 1
+                edge.total_time += elapsed_time
+                edge.total_bytes += data_size
+                edge.latency.record(elapsed_time)
+                self._total_transfers += 1
+                self._total_time += elapsed_time
         
-        if self.logger and self.mode == "research":
+        if self.logger and self.mode == "research" and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"데이터 전달: {source_engine} → {target_engine} "
-                f"({elapsed_time*1000:.2f}ms)"
+                "데이터 전달: %s → %s (%.2fms)", source_engine, target_engine, elapsed_time * 1000
             )
         
         return converted_data
     
+    def register_converter(
+        self,
+        source_engine: str,
+        target_engine: str,
+        converter: Converter,
+    ):
+        """엔진 쌍 변환 함수 등록
+        
+        등록된 변환들로 이어지는 엔진 쌍은 최단 체인으로 자동 변환됨.
+        
+        Args:
+            source_engine: 소스 엔진 이름
+            target_engine: 목표 엔진 이름
+            converter: 변환 함수 (입력을 수정하지 않고 새 딕셔너리 반환)
+        """
+        self.converters.register(source_engine, target_engine, converter)
+    
+    def register_schema(
+        self,
+        source_engine: str,
+        target_engine: str,
+        expected_keys: Optional[list] = None,
+        value_ranges: Optional[Dict[str, tuple]] = None,
+    ):
+        """엔진 쌍(edge) 스키마 등록 (한 번 컴파일하여 재사용)
+        
+        Args:
+            source_engine: 소스 엔진 이름
+            target_engine: 목표 엔진 이름
+            expected_keys: 예상 키 리스트
+            value_ranges: 값 범위 딕셔너리 {key: (min, max)} (배열 값은 벡터화 검사)
+        """
+        self._validators[(source_engine, target_engine)] = DataConverter.compile_schema(
+            expected_keys=expected_keys,
+            value_ranges=value_ranges,
+        )
+    
+    def has_schema(self, source_engine: str, target_engine: str) -> bool:
+        """엔진 쌍 스키마 등록 여부"""
+        return (source_engine, target_engine) in self._validators
+    
     def synchronize_state(
         self,
         engine_name: str,
@@ -137,48 +269,32 @@ class DataFlowManager:
             engine_name: 엔진 이름
             state: 상태 정보
         """
-        self.synchronizer.update_state(engine_name, state)
+        with self._lock:
+            self.synchronizer.update_state(engine_name, state)
         
-        if self.logger and self.mode == "research":
-            self.logger.debug(f"상태 동기화: {engine_name}")
+        if self.logger and self.mode == "research" and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("상태 동기화: %s", engine_name)
     
     def get_flow_statistics(self) -> Dict[str, Any]:
         """데이터 흐름 통계 반환 (연구용)
         
+        통계는 전체 전달에 대한 누적값 (flow_history 보관 한도와 무관).
+        
         Returns:
             통계 정보
         """
         if self.mode != "research":
             return {"mode": "production", "statistics_disabled": True}
         
-        if not self.flow_history:
+        if self._total_transfers == 0:
             return {"total_transfers": 0}
         
-        # 통계 계산
-        total_transfers = len(self.flow_history)
-        total_time = sum(record["elapsed_time"] for record in self.flow_history)
-        avg_time = total_time / total_transfers if total_transfers > 0 else 0.0
-        
-        # 엔진별 통계
-        engine_stats = {}
-        for record in self.flow_history:
-            source = record["source"]
-            target = record["target"]
-            key = f"{source}→{target}"
-            if key not in engine_stats:
-                engine_stats[key] = {"count": 0, "total_time": 0.0}
-            engine_stats[key]["count"] += 1
-            engine_stats[key]["total_time"] += record["elapsed_time"]
-        
-        # 평균 시간 계산
-        for key, stats in engine_stats.items():
-            stats["avg_time"] = stats["total_time"] / stats["count"]
-        
+        # 누적 카운터에서 바로 구성 (이력 재집계 없음)
         return {
-            "total_transfers": total_transfers,
-            "total_time": total_time,
-            "avg_time": avg_time,
-            "engine_stats": engine_stats,
+            "total_transfers": self._total_transfers,
+            "total_time": self._total_time,
+            "avg_time": self._total_time / self._total_transfers,
+            "engine_stats": {key: edge.to_dict() for key, edge in self._edge_stats.items()},
         }
     
     def get_state(self) -> Dict[str, Any]:
@@ -187,12 +303,16 @@ class DataFlowManager:
             "mode": self.mode,
             "flow_history_count": len(self.flow_history),
             "synchronized_engines": list(self.synchronizer.engine_states.keys()),
+            "converters": self.converters.get_state(),
             "statistics": self.get_flow_statistics(),
         }
     
     def reset(self):
         """상태 리셋"""
         self.flow_history.clear()
+        self._edge_stats.clear()
+        self._total_transfers = 0
+        self._total_time = 0.0
         self.synchronizer.reset()
         
         if self.logger:
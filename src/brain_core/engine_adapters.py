@@ -9,7 +9,7 @@ Version: 0.1.0
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
 from .interfaces import BrainEngineBase
@@ -21,8 +21,14 @@ class EngineAdapter(BrainEngineBase):
     """엔진 어댑터 기본 클래스
     
     기존 엔진을 BrainEngine 인터페이스에 맞추는 어댑터
+    
+    원본 엔진의 처리 메서드는 생성 시 한 번 해석됨.
+    (생성 후 engine을 교체했다면 _resolve_methods()를 다시 호출)
     """
     
+    # 원본 엔진의 배치 처리 메서드 후보 (우선순위 순)
+    BATCH_METHODS = ("process_many", "process_batch")
+    
     def __init__(
         self,
         engine: Any,
@@ -46,6 +52,8 @@ class EngineAdapter(BrainEngineBase):
             self.logger = logging.getLogger(f"EngineAdapter.{name}")
         else:
             self.logger = None
+        
+        self._resolve_methods()
     
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """입력 처리
@@ -58,38 +66,105 @@ class EngineAdapter(BrainEngineBase):
         Returns:
             처리 결과
         """
-        # 원본 엔진의 process 메서드 호출
-        if hasattr(self.engine, "process"):
-            try:
-                output = self.engine.process(input_data)
-                return output
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"엔진 {self.name} 처리 중 오류: {e}")
-                # 산업용: 오류 발생 시 기본값 반환
-                if self.mode == "production":
-                    return {"error": True, "error_message": str(e)}
-                else:
-                    raise
-        
-        # process 메서드가 없으면 다른 메서드 시도
-        elif hasattr(self.engine, "run"):
-            try:
-                output = self.engine.run(input_data)
-                return output if isinstance(output, dict) else {"output": output}
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"엔진 {self.name} 실행 중 오류: {e}")
-                if self.mode == "production":
-                    return {"error": True, "error_message": str(e)}
-                else:
-                    raise
-        
-        else:
+        if self._process_impl is None:
             # 처리 메서드가 없으면 입력 그대로 반환
             if self.logger:
-                self.logger.warning(f"엔진 {self.name}에 처리 메서드가 없습니다.")
+                self.logger.warning("엔진 %s에 처리 메서드가 없습니다.", self.name)
             return input_data
+        
+        try:
+            return self._process_impl(input_data)
+        except Exception as e:
+            return self._handle_error(e)
+    
+    def process_many(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 입력 일괄 처리
+        
+        원본 엔진에 배치 메서드(process_many / process_batch)가 있으면 한 번에 전달,
+        없으면 단건 처리 메서드를 반복 호출.
+        
+        산업용: 배치 호출이 실패하면 모든 입력에 오류 결과 반환
+            (실패 전에 일부 입력이 이미 적용되었을 수 있으므로 건별 재처리하지 않음 →
+            상태를 가진 엔진에 같은 입력이 두 번 적용되는 것 방지)
+        연구용: 오류 즉시 전파
+        
+        Args:
+            inputs: 입력 데이터 리스트
+        
+        Returns:
+            처리 결과 리스트 (입력 순서 유지)
+        """
+        inputs = list(inputs)
+        if self._batch_impl is None:
+            if self._process_impl is None:
+                return self._passthrough_many(inputs)
+            return self._process_each(inputs)
+        
+        try:
+            outputs = list(self._batch_impl(inputs))
+            if len(outputs) != len(inputs):
+                raise ValueError(
+                    f"배치 결과 수 불일치: 입력 {len(inputs)}개, 결과 {len(outputs)}개"
+                )
+            return outputs
+        except Exception as e:
+            if self.mode != "production":
+                raise
+            error_output = self._handle_error(e)
+            return [dict(error_output) for _ in inputs]
+    
+    # ------------------------------------------------------------------
+    # 내부: 메서드 해석 / 오류 처리
+    # ------------------------------------------------------------------
+    
+    def _resolve_methods(self):
+        """원본 엔진의 처리 메서드를 한 번만 해석 (호출마다 hasattr 반복 방지)"""
+        engine = self.engine
+        if hasattr(engine, "process"):
+            self._process_impl = engine.process
+        elif hasattr(engine, "run"):
+            run = engine.run
+            
+            def run_as_dict(input_data: Dict[str, Any]) -> Dict[str, Any]:
+                output = run(input_data)
+                return output if isinstance(output, dict) else {"output": output}
+            
+            self._process_impl = run_as_dict
+        else:
+            self._process_impl = None
+        
+        self._batch_impl = None
+        for method_name in self.BATCH_METHODS:
+            method = getattr(engine, method_name, None)
+            if callable(method):
+                self._batch_impl = method
+                break
+    
+    def _process_each(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """단건 처리 메서드 반복 호출 (예외 처리는 실패한 입력에만 적용)"""
+        impl = self._process_impl
+        outputs = []
+        append = outputs.append
+        for input_data in inputs:
+            try:
+                append(impl(input_data))
+            except Exception as e:
+                append(self._handle_error(e))
+        return outputs
+    
+    def _passthrough_many(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.logger:
+            self.logger.warning("엔진 %s에 처리 메서드가 없습니다.", self.name)
+        return inputs
+    
+    def _handle_error(self, error: Exception) -> Dict[str, Any]:
+        """처리 오류 기록 (산업용: 오류 딕셔너리 반환, 연구용: 예외 전파)"""
+        if self.logger:
+            self.logger.error("엔진 %s 처리 중 오류: %s", self.name, error)
+        # 산업용: 오류 발생 시 기본값 반환
+        if self.mode == "production":
+            return {"error": True, "error_message": str(error)}
+        raise error
     
     def get_state(self) -> Dict[str, Any]:
         """현재 상태 반환"""
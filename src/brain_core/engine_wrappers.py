@@ -19,12 +19,16 @@ Version: 0.2.0
 from __future__ import annotations
 
 from typing import Dict, Any, Optional, List
+import itertools
+import threading
+import time as _time
 import numpy as np
 import sys
 from pathlib import Path
 
 from .global_state import GlobalState
 from .execution_modes import SelfOrganizingEngine
+from .precision import float_dtype_of, hopfield_energy
 
 __version__ = "0.2.0"
 
@@ -83,11 +87,12 @@ class WellFormationEngineWrapper(SelfOrganizingEngine):
                 # Hebbian 학습으로 W, b 생성
                 well_result = self.engine.generate_well(episodes)
                 
-                # L0 extension에 저장
+                # L0 extension에 저장 (state_vector와 같은 정밀도)
                 # 수식: E(x) = -(1/2) Σ_ij w_ij x_i x_j - Σ_i b_i x_i
+                dtype = float_dtype_of(state.state_vector)
                 state.set_extension("L0", {
-                    "weights": np.array(well_result.W),  # W 행렬
-                    "bias": np.array(well_result.b),     # b 벡터
+                    "weights": np.array(well_result.W, dtype=dtype),  # W 행렬
+                    "bias": np.array(well_result.b, dtype=dtype),     # b 벡터
                     "converged": False,                   # 수렴 여부
                     "analysis": well_result.analysis,     # 형성 원인 분석
                 })
@@ -241,6 +246,7 @@ class NeuralDynamicsCoreWrapper(SelfOrganizingEngine):
         """
         self.core = neural_dynamics_core
         self.name = "neural_dynamics"
+        self.last_error: Optional[Exception] = None  # 마지막 update의 내부 오류 (성공 시 None)
     
     def update(self, state: GlobalState) -> GlobalState:
         """동역학 실행 (state_vector, energy 업데이트)
@@ -256,6 +262,7 @@ class NeuralDynamicsCoreWrapper(SelfOrganizingEngine):
         Returns:
             업데이트된 상태 (state.state_vector, state.energy 업데이트)
         """
+        self.last_error = None
         # L0 가중치 확인
         l0_data = state.get_extension("L0")
         if l0_data:
@@ -272,22 +279,26 @@ class NeuralDynamicsCoreWrapper(SelfOrganizingEngine):
                         b=b.tolist() if isinstance(b, np.ndarray) else b,
                     )
                     
-                    # 상태 업데이트
+                    # 상태 업데이트 (정밀도 유지)
+                    dtype = float_dtype_of(state.state_vector)
                     if isinstance(x_trajectory, list) and len(x_trajectory) > 0:
-                        state.state_vector = np.array(x_trajectory[-1])
+                        state.state_vector = np.array(x_trajectory[-1], dtype=dtype)
                     
                     # 에너지 계산
                     # 수식: E(x) = -(1/2) Σ_ij w_ij x_i x_j - Σ_i b_i x_i
                     if hasattr(self.core, 'hopfield_energy'):
-                        state.energy = self.core.hopfield_energy(state.state_vector)
+                        state.energy = float(self.core.hopfield_energy(state.state_vector))
+                    else:
+                        state.energy = hopfield_energy(state.state_vector, W, b, dtype=dtype)
                     
                     # 수렴 여부 업데이트
-                    state.update_extension("L0", {
-                        "converged": len(x_trajectory) < 100,  # 간단한 수렴 체크
-                    })
+                    state.update_extension(
+                        "L0",
+                        converged=len(x_trajectory) < 100,  # 간단한 수렴 체크
+                    )
                 except Exception as e:
-                    # 오류 발생 시 상태 유지
-                    pass
+                    # 오류 발생 시 상태 유지 (실패는 last_error로 노출 → 루프 차단기가 집계)
+                    self.last_error = e
         
         return state
     
@@ -308,7 +319,7 @@ class NeuralDynamicsCoreWrapper(SelfOrganizingEngine):
     
     def reset(self):
         """상태 리셋"""
-        pass
+        self.last_error = None
 
 
 class HistoricalDataReconstructorWrapper(SelfOrganizingEngine):
@@ -338,6 +349,7 @@ class HistoricalDataReconstructorWrapper(SelfOrganizingEngine):
         """
         self.reconstructor = historical_reconstructor
         self.name = "historical"
+        self.last_error: Optional[Exception] = None  # 마지막 update의 내부 오류 (성공 시 None)
     
     def update(self, state: GlobalState) -> GlobalState:
         """상태 기록 (causal_links 기록)
@@ -353,6 +365,7 @@ class HistoricalDataReconstructorWrapper(SelfOrganizingEngine):
         Returns:
             업데이트된 상태 (state.extensions["L2"]에 causal_links 기록)
         """
+        self.last_error = None
         # 현재 상태를 DataFragment로 변환
         try:
             fragment = self.reconstructor.collect_fragment(
@@ -375,8 +388,8 @@ class HistoricalDataReconstructorWrapper(SelfOrganizingEngine):
                 "storyline": l2_data.get("storyline", []),
             })
         except Exception as e:
-            # 오류 발생 시 상태 유지
-            pass
+            # 오류 발생 시 상태 유지 (실패는 last_error로 노출 → 루프 차단기가 집계)
+            self.last_error = e
         
         return state
     
@@ -397,7 +410,7 @@ class HistoricalDataReconstructorWrapper(SelfOrganizingEngine):
     
     def reset(self):
         """상태 리셋"""
-        pass
+        self.last_error = None
 
 
 class CingulateCortexEngineWrapper(SelfOrganizingEngine):
@@ -428,6 +441,7 @@ class CingulateCortexEngineWrapper(SelfOrganizingEngine):
         """
         self.cingulate = cingulate_cortex
         self.name = "cingulate"
+        self.last_error: Optional[Exception] = None  # 마지막 update의 내부 오류 (성공 시 None)
     
     def update(self, state: GlobalState) -> GlobalState:
         """안정성 모니터링 (risk, health 체크)
@@ -443,6 +457,7 @@ class CingulateCortexEngineWrapper(SelfOrganizingEngine):
         Returns:
             업데이트된 상태 (state.risk, state.metadata["monitoring"] 업데이트)
         """
+        self.last_error = None
         # 모니터링
         try:
             monitoring = self.cingulate.monitor({
@@ -472,8 +487,8 @@ class CingulateCortexEngineWrapper(SelfOrganizingEngine):
                             f"{engine_name}: None 값 발견"
                         )
         except Exception as e:
-            # 오류 발생 시 상태 유지
-            pass
+            # 오류 발생 시 상태 유지 (실패는 last_error로 노출 → 루프 차단기가 집계)
+            self.last_error = e
         
         return state
     
@@ -494,4 +509,240 @@ class CingulateCortexEngineWrapper(SelfOrganizingEngine):
     
     def reset(self):
         """상태 리셋"""
-        pass
+        self.last_error = None
+
+
+class PhysicsPipelineBridge(SelfOrganizingEngine):
+    """PhysicsPipeline → L1 브릿지 엔진
+    
+    역할: 백그라운드 스레드에서 PhysicsPipeline을 실행하고,
+    가장 최근 결과의 risk_map/failure_atlas를 L1에 게시
+    
+    동작:
+    - 백그라운드: times 순서대로 pipeline.process(parameters, t) 실행 → 스냅샷 교체
+      (스냅샷은 불변 복사본이며 참조 교체로 게시되므로 update()는 잠금 없이 읽음)
+    - update(): 새 스냅샷이 있을 때만 L1 갱신 (파이프라인 재계산 없음, 대기 없음)
+    
+    L1 게시 형식:
+        risk_map: 기존 L1 risk_map (prefix로 시작하지 않는 항목) + {prefix + 서명: 위험도}
+        failure_atlas: {"collapse_zones": [...], "stable_regions": [...], ...}
+        physics: {"time", "version", "risk_indicators"}
+    
+    파이프라인에 atlas_builder가 없으면 risk_indicators를 위험 지형으로 사용.
+    백그라운드 오류(파이프라인, times 이터레이터)는 다음 update()의 last_error로 한 번 노출
+    (루프 차단기가 집계). times 이터레이터 오류 시 백그라운드 스레드는 종료.
+    """
+    
+    def __init__(
+        self,
+        pipeline: Any,
+        parameters: Optional[Dict[str, Any]] = None,
+        times: Optional[Any] = None,
+        interval: Optional[float] = None,
+        prefix: str = "physics:",
+        autostart: bool = True,
+    ):
+        """PhysicsPipelineBridge 초기화
+        
+        Args:
+            pipeline: PhysicsPipeline 인스턴스
+            parameters: 시뮬레이션 파라미터
+            times: 시간 이터러블 (None이면 0, 1, 2, ... 무한)
+            interval: 파이프라인 실행 사이 대기 시간 (초). None이면 times가 None일 때 1.0,
+                아니면 0.0 (무한 시간열은 양수여야 함)
+            prefix: L1 risk_map에 게시할 서명 접두사
+            autostart: 첫 update()에서 백그라운드 스레드 자동 시작
+        """
+        if interval is None:
+            interval = 1.0 if times is None else 0.0
+        if times is None and interval <= 0:
+            # 무한 시간열을 대기 없이 돌리면 백그라운드 스레드가 CPU를 계속 점유
+            raise ValueError("times가 None이면 interval은 양수여야 합니다.")
+        self.pipeline = pipeline
+        self.parameters = parameters or {}
+        self.times = times
+        self.interval = interval
+        self.prefix = prefix
+        self.autostart = autostart
+        self.name = "physics_bridge"
+        self.last_error: Optional[Exception] = None  # 마지막 update의 오류 (성공 시 None)
+        
+        self._latest: Optional[Dict[str, Any]] = None  # 최신 스냅샷 (참조 교체로 게시)
+        self._background_error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.runs = 0
+        self.errors = 0
+    
+    # ------------------------------------------------------------------
+    # 백그라운드 실행
+    # ------------------------------------------------------------------
+    
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PhysicsPipelineBridge", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None):
+        """백그라운드 스레드 정지 (진행 중인 파이프라인 실행은 끝까지 수행)
+        
+        Args:
+            timeout: 대기 시간 (초, None이면 끝날 때까지)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    @property
+    def running(self) -> bool:
+        """백그라운드 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def wait_for_result(self, timeout: Optional[float] = None) -> bool:
+        """첫 스냅샷이 준비될 때까지 대기 (초기화/테스트용)
+        
+        Returns:
+            스냅샷 준비 여부
+        """
+        deadline = None if timeout is None else _time.monotonic() + timeout
+        while self._latest is None and self.running:
+            if deadline is not None and _time.monotonic() >= deadline:
+                break
+            _time.sleep(0.005)
+        return self._latest is not None
+    
+    def _run(self):
+        version = 0 if self._latest is None else self._latest["version"]
+        try:
+            times = iter(self.times) if self.times is not None else itertools.count()
+        except Exception as e:
+            self._background_error = e
+            self.errors += 1
+            return
+        while not self._stop.is_set():
+            try:
+                t = next(times)
+            except StopIteration:
+                break
+            except Exception as e:
+                # 시간 이터레이터 오류도 다음 update()의 last_error로 노출 후 종료
+                self._background_error = e
+                self.errors += 1
+                break
+            try:
+                result = self.pipeline.process(self.parameters, t)
+                version += 1
+                self._latest = self._snapshot(result, float(t), version)
+                self.runs += 1
+            except Exception as e:
+                self._background_error = e
+                self.errors += 1
+            if self.interval > 0 and self._stop.wait(self.interval):
+                break
+    
+    def _snapshot(self, result: Dict[str, Any], t: float, version: int) -> Dict[str, Any]:
+        """파이프라인 결과의 불변 복사본 (증분 빌더면 빌더의 snapshot()에서 전체 지형을 가져옴)"""
+        risk_indicators = dict(result.get("risk_indicators") or {})
+        risk_map = result.get("risk_map")
+        atlas = result.get("failure_atlas") or {}
+        atlas_builder = getattr(self.pipeline, "atlas_builder", None)
+        if "risk_update" in result and hasattr(atlas_builder, "snapshot"):
+            built = atlas_builder.snapshot()
+            risk_map, atlas = built["risk_map"], built["failure_atlas"]
+        risk_map = dict(risk_map) if risk_map is not None else risk_indicators
+        return {
+            "time": t,
+            "version": version,
+            "risk_map": {self.prefix + str(k): float(v) for k, v in risk_map.items()},
+            "failure_atlas": {
+                k: (v if isinstance(v, (int, float, str)) else list(v)) for k, v in atlas.items()
+            },
+            "risk_indicators": risk_indicators,
+        }
+    
+    # ------------------------------------------------------------------
+    # SelfOrganizingEngine
+    # ------------------------------------------------------------------
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        """최신 물리 위험 지형을 L1에 게시 (새 스냅샷이 있을 때만)
+        
+        수식:
+        - 입력: 백그라운드 최신 스냅샷
+        - 출력: state.extensions["L1"] (risk_map, failure_atlas, physics)
+        - 과정: 버전 비교 → (변경 시) 기존 물리 항목 교체
+        
+        Args:
+            state: 현재 상태
+        
+        Returns:
+            업데이트된 상태
+        """
+        self.last_error = None
+        if self.autostart and self._thread is None:
+            self.start()
+        
+        error, self._background_error = self._background_error, None
+        if error is not None:
+            self.last_error = error
+        
+        snapshot = self._latest
+        if snapshot is None:
+            return state
+        
+        l1 = state.get_extension("L1")
+        l1 = l1 if isinstance(l1, dict) else {}
+        physics = l1.get("physics")
+        if physics is not None and physics.get("version") == snapshot["version"]:
+            return state
+        
+        # 공유 참조를 건드리지 않도록 새 dict로 교체
+        risk_map = {k: v for k, v in (l1.get("risk_map") or {}).items() if not str(k).startswith(self.prefix)}
+        risk_map.update(snapshot["risk_map"])
+        state.set_extension("L1", {
+            **l1,
+            "risk_map": risk_map,
+            "failure_atlas": snapshot["failure_atlas"],
+            "physics": {
+                "time": snapshot["time"],
+                "version": snapshot["version"],
+                "risk_indicators": snapshot["risk_indicators"],
+            },
+        })
+        return state
+    
+    def get_energy(self, state: GlobalState) -> float:
+        """상태의 에너지 반환
+        
+        Args:
+            state: 상태
+        
+        Returns:
+            에너지
+        """
+        return state.energy
+    
+    def get_state(self) -> Dict[str, Any]:
+        """엔진 내부 상태 반환"""
+        snapshot = self._latest
+        return {
+            "name": self.name,
+            "running": self.running,
+            "runs": self.runs,
+            "errors": self.errors,
+            "version": snapshot["version"] if snapshot else 0,
+            "time": snapshot["time"] if snapshot else None,
+        }
+    
+    def reset(self):
+        """상태 리셋 (백그라운드 정지, 스냅샷 폐기)"""
+        self.stop()
+        self._thread = None
+        self._latest = None
+        self._background_error = None
+        self.last_error = None
+        self.runs = 0
+        self.errors = 0
@@ -193,11 +193,11 @@ class CingulateCortexEngine:
         if self.logger:
             if needs_stabilization:
                 self.logger.warning(
-                    f"안정화 필요: 건강 점수 {health.overall_score:.2f}, "
-                    f"갈등 {len(conflicts)}개, 오류 {len(errors)}개"
+                    "안정화 필요: 건강 점수 %.2f, 갈등 %d개, 오류 %d개",
+                    health.overall_score, len(conflicts), len(errors),
                 )
-            elif self.mode == "research":
-                self.logger.debug(f"시스템 건강 점수: {health.overall_score:.2f}")
+            elif self.mode == "research" and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("시스템 건강 점수: %.2f", health.overall_score)
         
         return result
     
@@ -0,0 +1,135 @@
+"""
+Event Sink - 구조화 이벤트 링 버퍼
+
+핫 루프에서 문자열 포맷 없이 이벤트를 튜플로 기록하고,
+별도 스레드에서 모아서 처리(flush)
+
+산업용 중심:
+- emit()은 deque.append 한 번 (포맷/IO 없음)
+- 버퍼가 가득 차면 가장 오래된 이벤트부터 덮어씀 (메모리 상한)
+- 포맷/출력은 백그라운드 스레드에서 수행
+
+이벤트 형식:
+    (timestamp, source, event, fields)
+    예: (1700000000.0, "StateCentricExecutionLoop", "engine_update", (3, "cingulate", 0.12, -0.5))
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Tuple
+from collections import deque
+import logging
+import threading
+import time
+
+__version__ = "0.1.0"
+
+Event = Tuple[float, str, str, Tuple[Any, ...]]
+
+
+class EventSink:
+    """구조화 이벤트 싱크 (링 버퍼 + 백그라운드 flush)"""
+
+    def __init__(
+        self,
+        capacity: int = 8192,
+        flush_interval: float = 0.5,
+        handler: Optional[Callable[[List[Event]], None]] = None,
+        logger_name: str = "BrainCore.events",
+    ):
+        """EventSink 초기화
+
+        Args:
+            capacity: 링 버퍼 크기 (초과 시 오래된 이벤트 덮어씀)
+            flush_interval: 백그라운드 flush 주기 (초)
+            handler: 이벤트 배치 처리 함수 (None이면 logger에 DEBUG로 기록)
+            logger_name: 기본 handler가 사용할 logger 이름
+        """
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.handler = handler or self._log_events
+        self._logger = logging.getLogger(logger_name)
+        self._buffer: deque = deque(maxlen=capacity)
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self.emitted = 0
+        self.flushed = 0
+
+    def emit(self, source: str, event: str, *fields: Any):
+        """이벤트 기록 (핫 패스용, 포맷 없음)
+
+        Args:
+            source: 이벤트 발생 컴포넌트
+            event: 이벤트 이름
+            *fields: 이벤트 필드 (원시 값 그대로 보관)
+        """
+        self._buffer.append((time.time(), source, event, fields))
+        self.emitted += 1
+
+    def start(self) -> 'EventSink':
+        """백그라운드 flush 스레드 시작"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="EventSink", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """flush 스레드 정지 후 남은 이벤트 처리"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 handler로 전달
+
+        Returns:
+            처리한 이벤트 수
+        """
+        with self._flush_lock:
+            batch = []
+            buffer = self._buffer
+            while True:
+                try:
+                    batch.append(buffer.popleft())
+                except IndexError:
+                    break
+            if batch:
+                self.handler(batch)
+                self.flushed += len(batch)
+            return len(batch)
+
+    @property
+    def dropped(self) -> int:
+        """버퍼 초과로 덮어쓴 이벤트 수 (근사)"""
+        return max(0, self.emitted - self.flushed - len(self._buffer))
+
+    def snapshot(self) -> List[Event]:
+        """버퍼 내용 복사 (flush하지 않음)"""
+        return list(self._buffer)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                self._logger.exception("EventSink flush 실패")
+
+    def _log_events(self, events: List[Event]):
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        for timestamp, source, event, fields in events:
+            self._logger.debug("%.6f %s %s %r", timestamp, source, event, fields)
+
+    def __enter__(self) -> 'EventSink':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
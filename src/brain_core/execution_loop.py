@@ -9,10 +9,15 @@ Version: 0.1.0
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator, Callable
+from collections.abc import Mapping
+from types import MappingProxyType
 import logging
 
 from .data_flow import DataFlowManager
+from .event_sink import EventSink
+from .interfaces import freeze_payload, thaw_payload
+from .streaming import run_stages
 
 __version__ = "0.1.0"
 
@@ -28,6 +33,9 @@ class ExecutionLoop:
         mode: str = "production",
         enable_logging: bool = True,
         data_flow: Optional[DataFlowManager] = None,
+        event_sink: Optional[EventSink] = None,
+        schemas: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+        handoff: str = "copy",
     ):
         """ExecutionLoop 초기화
         
@@ -35,16 +43,66 @@ class ExecutionLoop:
             mode: "production" (산업용) 또는 "research" (연구용)
             enable_logging: 로깅 활성화 여부
             data_flow: 데이터 흐름 관리자 (None이면 자동 생성)
+            event_sink: 구조화 이벤트 싱크 (None이면 이벤트 기록 안 함)
+            schemas: 엔진 쌍별 스키마 {(source, target): {"expected_keys": [...], "value_ranges": {...}}}
+            handoff: 엔진 간 데이터 전달 방식
+                - "copy": 매 hop마다 딕셔너리 복사 (기본, 기존 동작)
+                - "zero_copy": 출력을 읽기 전용 뷰로 전달 (배열 복사 없음)
+        
+        Note:
+            엔진이 input_schema 속성({"expected_keys", "value_ranges"})을 가지면
+            해당 엔진으로 들어가는 edge에 처음 실행될 때 자동 등록됨
+            
+            zero_copy 모드:
+            - 엔진 입력은 MappingProxyType, ndarray 값은 쓰기 불가
+            - 입력을 수정하는 엔진은 mutates_input = True를 선언하면 복사본을 받음
+            - 자동 생성되는 DataFlowManager는 상태 동기화를 참조+버전으로 기록
+            - 최종 결과의 output(오류 결과 포함)은 일반 dict로 복원 (배열은 마지막에 한 번 복사)
         """
+        if handoff not in ("copy", "zero_copy"):
+            raise ValueError(f"지원하지 않는 handoff 모드: {handoff}")
         self.mode = mode
         self.enable_logging = enable_logging
-        self.data_flow = data_flow or DataFlowManager(mode=mode, enable_logging=enable_logging)
+        self.handoff = handoff
+        self.data_flow = data_flow or DataFlowManager(
+            mode=mode,
+            enable_logging=enable_logging,
+            sync_record="reference" if handoff == "zero_copy" else "copy",
+        )
+        self.event_sink = event_sink
+        
+        for (source_engine, target_engine), schema in (schemas or {}).items():
+            self.register_schema(source_engine, target_engine, **schema)
         
         if enable_logging:
             self.logger = logging.getLogger("ExecutionLoop")
         else:
             self.logger = None
     
+    def register_schema(
+        self,
+        source_engine: str,
+        target_engine: str,
+        expected_keys: Optional[list] = None,
+        value_ranges: Optional[Dict[str, tuple]] = None,
+    ):
+        """엔진 쌍 스키마 등록 (DataFlowManager.register_schema 위임)"""
+        self.data_flow.register_schema(
+            source_engine,
+            target_engine,
+            expected_keys=expected_keys,
+            value_ranges=value_ranges,
+        )
+    
+    def register_converter(
+        self,
+        source_engine: str,
+        target_engine: str,
+        converter: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ):
+        """엔진 쌍 변환 함수 등록 (DataFlowManager.register_converter 위임)"""
+        self.data_flow.register_converter(source_engine, target_engine, converter)
+    
     def execute(
         self,
         input_data: Dict[str, Any],
@@ -61,38 +119,25 @@ class ExecutionLoop:
         Returns:
             실행 결과
         """
-        current_data = input_data
+        zero_copy = self.handoff == "zero_copy"
+        current_data = freeze_payload(input_data) if zero_copy else input_data
         intermediate_results = {} if return_intermediate else None
         
+        # 로그 레벨은 실행 시작 시 한 번만 확인
+        logger = self.logger
+        debug = logger is not None and self.mode == "research" and logger.isEnabledFor(logging.DEBUG)
+        sink = self.event_sink
+        
         # 엔진 순차 실행
         prev_engine = None
         for name, engine in engines.items():
+            if not hasattr(engine, "process"):
+                if logger:
+                    logger.warning("엔진 %s에 process 메서드가 없습니다.", name)
+                continue
+            
             try:
-                # 데이터 전달 (이전 엔진 → 현재 엔진)
-                if prev_engine:
-                    current_data = self.data_flow.transfer(
-                        source_data=current_data,
-                        source_engine=prev_engine,
-                        target_engine=name,
-                        validate=(self.mode == "production"),  # 산업용에서만 검사
-                    )
-                
-                # 엔진 실행
-                if hasattr(engine, "process"):
-                    output = engine.process(current_data)
-                else:
-                    if self.logger:
-                        self.logger.warning(f"엔진 {name}에 process 메서드가 없습니다.")
-                    continue
-                
-                # 상태 동기화
-                if hasattr(engine, "get_state"):
-                    try:
-                        engine_state = engine.get_state()
-                        self.data_flow.synchronize_state(name, engine_state)
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.warning(f"엔진 {name} 상태 동기화 실패: {e}")
+                current_data, output = self._run_engine(name, engine, current_data, prev_engine)
                 
                 # 중간 결과 저장 (연구용)
                 if return_intermediate:
@@ -102,24 +147,20 @@ class ExecutionLoop:
                     }
                 
                 # 다음 엔진의 입력으로 사용
-                current_data = output
+                current_data = freeze_payload(output) if zero_copy and isinstance(output, Mapping) else output
                 prev_engine = name
                 
-                if self.logger and self.mode == "research":
-                    self.logger.debug(f"엔진 {name} 실행 완료")
+                if debug:
+                    logger.debug("엔진 %s 실행 완료", name)
+                if sink is not None:
+                    sink.emit("ExecutionLoop", "engine_done", name)
             
             except Exception as e:
-                if self.logger:
-                    self.logger.error(f"엔진 {name} 실행 중 오류: {e}")
+                error_result = self._handle_engine_error(name, e, current_data)
                 
                 # 산업용: 오류 발생 시 기본값 반환
-                if self.mode == "production":
-                    return {
-                        "error": True,
-                        "error_engine": name,
-                        "error_message": str(e),
-                        "output": current_data,  # 마지막 성공한 결과
-                    }
+                if error_result is not None:
+                    return error_result
                 else:
                     # 연구용: 오류 정보 포함
                     if return_intermediate:
@@ -129,6 +170,169 @@ class ExecutionLoop:
                         }
                     raise
         
+        return self._build_result(current_data, engines, intermediate_results, return_intermediate)
+    
+    def execute_stream(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        engines: Dict[str, Any],
+        return_intermediate: bool = False,
+        queue_size: int = 8,
+    ) -> Iterator[Dict[str, Any]]:
+        """여러 입력을 엔진 파이프라인으로 스트리밍 실행
+        
+        엔진마다 워커 스레드 하나가 단계(stage)를 맡아,
+        엔진 k가 입력 i를 처리하는 동안 엔진 k+1은 입력 i-1을 처리.
+        
+        - 출력 순서는 입력 순서와 동일
+        - 단계 사이 큐 크기 제한 (backpressure): 진행 중 항목 수 ≤ (엔진 수 + 1) × queue_size
+        - 입력 이터레이터는 필요할 때만 소비
+        - 오류 처리는 execute()와 동일 (산업용: 해당 입력만 오류 결과, 연구용: 예외 발생)
+        
+        Args:
+            inputs: 입력 데이터 이터레이터
+            engines: 엔진 딕셔너리 (우선순위 정렬됨)
+            return_intermediate: 중간 결과 반환 여부
+            queue_size: 단계 사이 큐 크기
+        
+        Yields:
+            입력별 실행 결과 (execute()와 같은 형식)
+        
+        Note:
+            각 엔진은 한 스레드에서만 호출되지만 서로 다른 엔진은 동시에 실행되므로,
+            엔진 간 공유 객체는 스레드 안전해야 함
+        """
+        zero_copy = self.handoff == "zero_copy"
+        stage_engines = []
+        for name, engine in engines.items():
+            if hasattr(engine, "process"):
+                stage_engines.append((name, engine))
+            elif self.logger:
+                self.logger.warning("엔진 %s에 process 메서드가 없습니다.", name)
+        
+        def make_stage(name: str, engine: Any, prev_engine: Optional[str]):
+            def stage(item: Dict[str, Any]) -> Dict[str, Any]:
+                if item["error_result"] is not None:
+                    return item  # 앞 단계 오류 → 이후 단계 스킵
+                try:
+                    engine_input, output = self._run_engine(name, engine, item["data"], prev_engine)
+                except Exception as e:
+                    item["error_result"] = self._handle_engine_error(name, e, item["data"])
+                    if item["error_result"] is None:
+                        raise
+                    return item
+                if return_intermediate:
+                    item["intermediate"][name] = {"input": engine_input, "output": output}
+                item["data"] = freeze_payload(output) if zero_copy and isinstance(output, Mapping) else output
+                return item
+            return stage
+        
+        stages = []
+        prev_engine = None
+        for name, engine in stage_engines:
+            stages.append(make_stage(name, engine, prev_engine))
+            prev_engine = name
+        
+        items = (
+            {
+                "data": freeze_payload(input_data) if zero_copy else input_data,
+                "error_result": None,
+                "intermediate": {} if return_intermediate else None,
+            }
+            for input_data in inputs
+        )
+        
+        for item in run_stages(items, stages, queue_size=queue_size, name="ExecutionLoop"):
+            if item["error_result"] is not None:
+                yield item["error_result"]
+            else:
+                yield self._build_result(item["data"], engines, item["intermediate"], return_intermediate)
+    
+    def _run_engine(
+        self,
+        name: str,
+        engine: Any,
+        current_data: Dict[str, Any],
+        prev_engine: Optional[str],
+    ) -> Tuple[Dict[str, Any], Any]:
+        """엔진 하나 실행 (데이터 전달 → 처리 → 상태 동기화)
+        
+        Returns:
+            (엔진 입력 데이터, 엔진 출력). 처리 중 예외는 그대로 전파
+        """
+        zero_copy = self.handoff == "zero_copy"
+        
+        # 데이터 전달 (이전 엔진 → 현재 엔진)
+        if prev_engine:
+            input_schema = getattr(engine, "input_schema", None)
+            if input_schema and not self.data_flow.has_schema(prev_engine, name):
+                self.register_schema(prev_engine, name, **input_schema)
+            current_data = self.data_flow.transfer(
+                source_data=current_data,
+                source_engine=prev_engine,
+                target_engine=name,
+                validate=(self.mode == "production"),  # 산업용에서만 검사
+                copy=not zero_copy,
+            )
+        
+        # 엔진 실행
+        if zero_copy and getattr(engine, "mutates_input", False):
+            # 수정을 선언한 엔진만 복사본 사용
+            output = engine.process(thaw_payload(current_data))
+        else:
+            output = engine.process(current_data)
+        
+        # 상태 동기화
+        if hasattr(engine, "get_state"):
+            try:
+                engine_state = engine.get_state()
+                self.data_flow.synchronize_state(name, engine_state)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning("엔진 %s 상태 동기화 실패: %s", name, e)
+        
+        return current_data, output
+    
+    def _handle_engine_error(
+        self,
+        name: str,
+        error: Exception,
+        current_data: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """엔진 오류 기록
+        
+        Returns:
+            산업용: 오류 결과 딕셔너리, 연구용: None (호출자가 예외 재발생)
+        """
+        if self.logger:
+            self.logger.error("엔진 %s 실행 중 오류: %s", name, error)
+        if self.event_sink is not None:
+            self.event_sink.emit("ExecutionLoop", "engine_error", name, repr(error))
+        
+        if self.mode == "production":
+            return {
+                "error": True,
+                "error_engine": name,
+                "error_message": str(error),
+                "output": self._thaw_output(current_data),  # 마지막 성공한 결과
+            }
+        return None
+    
+    @staticmethod
+    def _thaw_output(data: Any) -> Any:
+        """zero-copy 읽기 전용 페이로드를 호출자에게 돌려줄 일반 dict로 복원"""
+        return thaw_payload(data) if isinstance(data, MappingProxyType) else data
+    
+    def _build_result(
+        self,
+        current_data: Any,
+        engines: Dict[str, Any],
+        intermediate_results: Optional[Dict[str, Any]],
+        return_intermediate: bool,
+    ) -> Dict[str, Any]:
+        """Cingulate 모니터링 후 최종 결과 구성"""
+        current_data = self._thaw_output(current_data)
+        
         # Cingulate Cortex 모니터링 (있는 경우)
         monitoring_result = None
         if "cingulate" in engines:
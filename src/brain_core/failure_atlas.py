@@ -0,0 +1,671 @@
+"""
+Failure Atlas - 붕괴 영역 공간 인덱스
+
+FailureAtlasBuilder.build_failure_atlas()의 collapse_zones 리스트를
+조건/파라미터 공간의 균일 격자 인덱스로 변환하여 근접 질의를 선형 탐색 없이 처리
+
+영역 모델:
+    각 붕괴 영역 = 조건 공간의 공 (center ∈ R^d, radius ≥ 0)
+    점 p와 영역의 거리 = max(0, ||p - center|| - radius)   (영역 안이면 0)
+
+인덱스 (균일 격자):
+    - 격자 크기 cell_size (기본: 영역 지름의 중앙값, 셀 수가 영역 수 정도가 되도록 하한)
+    - 영역은 외접 상자가 겹치는 모든 셀에 등록
+    - 셀 → 영역 목록은 정렬된 셀 ID + CSR 배열 (빈 셀은 저장하지 않음)
+
+질의:
+    - contains(points): 배치 점-영역 포함 판정 (완전 벡터화, 후보 쌍만 거리 계산)
+    - within(point, radius): 반경 내 영역
+    - nearest(point): 가장 가까운 영역 (셀 고리(ring) 확장 탐색)
+    - nearest_many(points): 배치 최근접 (청크 단위 벡터화 거리 계산)
+
+영역 추가/삭제 후 첫 질의에서 인덱스를 한 번 재구성 (lazy rebuild)
+
+증분 빌더 (IncrementalRiskMap):
+    새 리스크 지표를 조건 서명별 running max / EWMA로 누적하고,
+    임계값을 넘나든 조건만 붕괴 영역/안정 영역 사이에서 이동 (갱신 비용 O(변경 수))
+    전체 위험 지형/FailureAtlas는 snapshot()으로 필요할 때만 복사 (버전별 캐시)
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Callable, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+from types import MappingProxyType
+import itertools
+import numpy as np
+
+__version__ = "0.1.0"
+
+# nearest_many 청크당 차분 배열 원소 수 (점 수 × 영역 수 × 차원) 상한
+_PAIR_CHUNK = 1 << 20
+
+
+class FailureAtlasIndex:
+    """붕괴 영역 공간 인덱스
+
+    Note:
+        스레드 안전하지 않음 (갱신과 질의를 같은 스레드에서 수행하거나 외부에서 잠금)
+    """
+
+    def __init__(self, dims: int, cell_size: Optional[float] = None):
+        """FailureAtlasIndex 초기화
+
+        Args:
+            dims: 조건 공간 차원
+            cell_size: 격자 셀 크기 (None이면 재구성 시 영역 지름의 중앙값으로 결정)
+        """
+        if dims < 1:
+            raise ValueError("dims는 1 이상이어야 합니다.")
+        if cell_size is not None and cell_size <= 0:
+            raise ValueError("cell_size는 양수여야 합니다.")
+        self.dims = dims
+        self.requested_cell_size = cell_size
+
+        self._zones: Dict[Hashable, Tuple[np.ndarray, float, Optional[float]]] = {}
+        self._dirty = True
+
+        # 재구성 결과
+        self.cell_size = cell_size or 1.0
+        self._ids: List[Hashable] = []
+        self._centers = np.zeros((0, dims))
+        self._radii = np.zeros(0)
+        self._origin = np.zeros(dims, dtype=np.int64)
+        self._shape = np.ones(dims, dtype=np.int64)
+        self._cell_ids = np.zeros(0, dtype=np.int64)
+        self._starts = np.zeros(1, dtype=np.int64)
+        self._members = np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # 생성/갱신
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_atlas(
+        cls,
+        atlas: Dict[str, Any],
+        coordinates: Union[Mapping[Hashable, Sequence[float]], Callable[[Hashable], Sequence[float]]],
+        radius: float = 0.0,
+        risk_map: Optional[Mapping[Hashable, float]] = None,
+        cell_size: Optional[float] = None,
+    ) -> "FailureAtlasIndex":
+        """FailureAtlas의 collapse_zones로 인덱스 생성
+
+        Args:
+            atlas: {"collapse_zones": [...]} (항목은 조건 서명 또는
+                {"signature"/"id", "center", "radius", "risk"} 딕셔너리)
+            coordinates: 조건 서명 → 조건 공간 좌표 (매핑 또는 함수)
+            radius: 반경이 없는 영역의 기본 반경
+            risk_map: 조건 서명 → 위험도 (선택)
+            cell_size: 격자 셀 크기
+
+        Returns:
+            FailureAtlasIndex
+        """
+        lookup = coordinates.__getitem__ if isinstance(coordinates, Mapping) else coordinates
+        zones = []
+        for zone in atlas.get("collapse_zones", []):
+            if isinstance(zone, dict):
+                zone_id = zone.get("signature", zone.get("id"))
+                center = zone["center"] if "center" in zone else lookup(zone_id)
+                zone_radius = zone.get("radius", radius)
+                risk = zone.get("risk")
+            else:
+                zone_id, center, zone_radius, risk = zone, lookup(zone), radius, None
+            if risk is None and risk_map is not None:
+                risk = risk_map.get(zone_id)
+            zones.append((zone_id, np.asarray(center, dtype=float).ravel(), zone_radius, risk))
+
+        if not zones:
+            raise ValueError("collapse_zones가 비어 있어 차원을 결정할 수 없습니다.")
+        index = cls(dims=len(zones[0][1]), cell_size=cell_size)
+        for zone_id, center, zone_radius, risk in zones:
+            index.add_zone(zone_id, center, zone_radius, risk)
+        return index
+
+    def add_zone(
+        self,
+        zone_id: Hashable,
+        center: Sequence[float],
+        radius: float = 0.0,
+        risk: Optional[float] = None,
+    ):
+        """영역 추가 (같은 ID가 있으면 교체)
+
+        Args:
+            zone_id: 영역 ID (예: 조건 서명)
+            center: 조건 공간 좌표 (dims,)
+            radius: 영역 반경
+            risk: 위험도 (선택)
+        """
+        center = np.asarray(center, dtype=float).ravel()
+        if center.shape != (self.dims,):
+            raise ValueError(f"center 차원({center.size})이 인덱스 차원({self.dims})과 다릅니다.")
+        if radius < 0:
+            raise ValueError("radius는 0 이상이어야 합니다.")
+        self._zones[zone_id] = (center, float(radius), risk)
+        self._dirty = True
+
+    def remove_zone(self, zone_id: Hashable) -> bool:
+        """영역 삭제
+
+        Returns:
+            삭제 여부 (없던 ID면 False)
+        """
+        if self._zones.pop(zone_id, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def __contains__(self, zone_id: Hashable) -> bool:
+        return zone_id in self._zones
+
+    def zone(self, zone_id: Hashable) -> Dict[str, Any]:
+        """영역 정보 {center, radius, risk}"""
+        center, radius, risk = self._zones[zone_id]
+        return {"center": center, "radius": radius, "risk": risk}
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+
+    def contains(self, points: Any) -> np.ndarray:
+        """배치 점-영역 포함 판정
+
+        Args:
+            points: (N, dims) 또는 (dims,) 좌표
+
+        Returns:
+            (N,) bool 배열 (어떤 붕괴 영역 안에 있으면 True)
+        """
+        return self.containing_zone(points) >= 0
+
+    def containing_zone(self, points: Any) -> np.ndarray:
+        """배치 점별 포함 영역 인덱스
+
+        Args:
+            points: (N, dims) 또는 (dims,) 좌표
+
+        Returns:
+            (N,) int 배열: 포함하는 영역 중 가장 깊이 들어간 영역의 zone_ids 위치 (없으면 -1)
+        """
+        points = self._points(points)
+        self._ensure_index()
+        result = np.full(len(points), -1, dtype=np.int64)
+        if not self._ids or not len(points):
+            return result
+
+        point_index, zone_index = self._candidate_pairs(points)
+        if not len(point_index):
+            return result
+        depth = self._radii[zone_index] - np.linalg.norm(points[point_index] - self._centers[zone_index], axis=1)
+        inside = depth >= 0
+        point_index, zone_index, depth = point_index[inside], zone_index[inside], depth[inside]
+
+        # 점별 최대 깊이 영역: (점, -깊이) 순 정렬 후 점별 첫 항목
+        order = np.lexsort((-depth, point_index))
+        points_hit, first = np.unique(point_index[order], return_index=True)
+        result[points_hit] = zone_index[order][first]
+        return result
+
+    @property
+    def zone_ids(self) -> List[Hashable]:
+        """containing_zone() 결과 인덱스에 대응하는 영역 ID 리스트"""
+        self._ensure_index()
+        return list(self._ids)
+
+    def within(self, point: Sequence[float], radius: float) -> List[Tuple[Hashable, float]]:
+        """반경 질의
+
+        Args:
+            point: 조건 공간 좌표 (dims,)
+            radius: 질의 반경 (영역 경계까지 거리 기준)
+
+        Returns:
+            [(zone_id, distance)] 거리 오름차순
+        """
+        point = self._points(point)[0]
+        self._ensure_index()
+        if not self._ids:
+            return []
+        # 영역은 외접 상자가 겹치는 모든 셀에 등록되어 있으므로 질의 공의 외접 상자 셀만 보면 됨
+        candidates = self._zones_in_box(self._cell_of(point - radius), self._cell_of(point + radius))
+        if not len(candidates):
+            return []
+        distance = self._distance(point, candidates)
+        keep = distance <= radius
+        candidates, distance = candidates[keep], distance[keep]
+        order = np.argsort(distance, kind="stable")
+        return [(self._ids[i], float(distance[j])) for j, i in zip(order, candidates[order])]
+
+    def nearest(self, point: Sequence[float]) -> Optional[Tuple[Hashable, float]]:
+        """최근접 영역 (셀 고리 확장 탐색)
+
+        고리 k까지 탐색한 뒤 최단 거리가 k * cell_size 이하이면 종료
+        (고리 k+1 이후 셀의 영역은 그보다 가깝지 않음).
+
+        Args:
+            point: 조건 공간 좌표 (dims,)
+
+        Returns:
+            (zone_id, distance) 또는 None (영역 없음)
+        """
+        point = self._points(point)[0]
+        self._ensure_index()
+        if not self._ids:
+            return None
+
+        home = self._cell_of(point)
+        grid_low, grid_high = self._origin, self._origin + self._shape - 1
+        # 격자 밖의 점은 격자까지의 셀 거리부터 시작
+        start = int(np.max(np.maximum(grid_low - home, home - grid_high).clip(min=0)))
+        last = int(np.max(np.maximum(np.abs(grid_low - home), np.abs(grid_high - home))))
+
+        best_index, best_distance = -1, np.inf
+        for ring in range(start, last + 1):
+            candidates = self._zones_on_ring(home, ring)
+            if len(candidates):
+                distance = self._distance(point, candidates)
+                j = int(np.argmin(distance))
+                if distance[j] < best_distance:
+                    best_index, best_distance = int(candidates[j]), float(distance[j])
+            if best_distance <= ring * self.cell_size:
+                break
+        return self._ids[best_index], best_distance
+
+    def nearest_many(self, points: Any) -> Tuple[List[Optional[Hashable]], np.ndarray]:
+        """배치 최근접 영역 (청크 단위 벡터화)
+
+        격자를 쓰지 않는 O(N·Z) 전수 비교 (Z = 영역 수). 영역이 많고 점이 적으면
+        점별 nearest()가 더 빠름. 거리는 차분의 norm으로 직접 계산하므로
+        원점에서 먼 좌표에서도 정밀도 손실 없음.
+
+        Args:
+            points: (N, dims) 좌표
+
+        Returns:
+            (zone_id 리스트, (N,) 거리 배열) (영역이 없으면 None / inf)
+        """
+        points = self._points(points)
+        self._ensure_index()
+        if not self._ids:
+            return [None] * len(points), np.full(len(points), np.inf)
+
+        indices = np.empty(len(points), dtype=np.int64)
+        distances = np.empty(len(points))
+        chunk = max(1, _PAIR_CHUNK // (len(self._ids) * self.dims))
+        for start in range(0, len(points), chunk):
+            block = points[start:start + chunk]
+            distance = (
+                np.linalg.norm(block[:, None, :] - self._centers[None, :, :], axis=2)
+                - self._radii[None, :]
+            )
+            best = np.argmin(distance, axis=1)
+            indices[start:start + chunk] = best
+            distances[start:start + chunk] = np.maximum(distance[np.arange(len(block)), best], 0.0)
+        return [self._ids[i] for i in indices], distances
+
+    def get_state(self) -> Dict[str, Any]:
+        """인덱스 상태 반환"""
+        self._ensure_index()
+        return {
+            "dims": self.dims,
+            "zones": len(self._ids),
+            "cell_size": self.cell_size,
+            "occupied_cells": int(len(self._cell_ids)),
+            "entries": int(len(self._members)),
+        }
+
+    # ------------------------------------------------------------------
+    # 내부: 인덱스 재구성
+    # ------------------------------------------------------------------
+
+    def _ensure_index(self):
+        if self._dirty:
+            self._rebuild()
+
+    def _rebuild(self):
+        self._ids = list(self._zones)
+        count = len(self._ids)
+        self._centers = np.array([self._zones[i][0] for i in self._ids]).reshape(count, self.dims)
+        self._radii = np.array([self._zones[i][1] for i in self._ids], dtype=float)
+        self._dirty = False
+        if count == 0:
+            self._cell_ids = np.zeros(0, dtype=np.int64)
+            self._starts = np.zeros(1, dtype=np.int64)
+            self._members = np.zeros(0, dtype=np.int64)
+            return
+
+        self.cell_size = self.requested_cell_size or self._default_cell_size()
+        low = self._cell_of(self._centers - self._radii[:, None])
+        high = self._cell_of(self._centers + self._radii[:, None])
+        self._origin = low.min(axis=0)
+        self._shape = high.max(axis=0) - self._origin + 1
+
+        spans = high - low + 1
+        totals = np.prod(spans, axis=1)
+        members = np.repeat(np.arange(count), totals)
+        # 영역별 외접 상자 셀 나열 (혼합 기수 분해)
+        offsets = np.arange(totals.sum()) - np.repeat(np.cumsum(totals) - totals, totals)
+        cells = np.empty((len(members), self.dims), dtype=np.int64)
+        for axis in range(self.dims - 1, -1, -1):
+            span = spans[members, axis]
+            cells[:, axis] = low[members, axis] + offsets % span
+            offsets //= span
+
+        cell_ids = self._linear(cells)
+        order = np.argsort(cell_ids, kind="stable")
+        cell_ids, members = cell_ids[order], members[order]
+        self._cell_ids, first = np.unique(cell_ids, return_index=True)
+        self._starts = np.append(first, len(cell_ids)).astype(np.int64)
+        self._members = members
+
+    def _default_cell_size(self) -> float:
+        """영역 지름의 중앙값 (단, 전체 셀 수가 영역 수 정도를 넘지 않도록 하한 적용)"""
+        diameters = 2.0 * self._radii[self._radii > 0]
+        extent = float(np.max(
+            (self._centers + self._radii[:, None]).max(axis=0) - (self._centers - self._radii[:, None]).min(axis=0)
+        ))
+        coarse = extent / max(1.0, len(self._centers) ** (1.0 / self.dims))
+        size = max(float(np.median(diameters)) if len(diameters) else 0.0, coarse)
+        return size if size > 0 else 1.0
+
+    # ------------------------------------------------------------------
+    # 내부: 셀 연산
+    # ------------------------------------------------------------------
+
+    def _points(self, points: Any) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        if points.ndim == 1:
+            points = points[None, :]
+        if points.ndim != 2 or points.shape[1] != self.dims:
+            raise ValueError(f"점 shape {points.shape}이 (N, {self.dims})가 아닙니다.")
+        return points
+
+    def _cell_of(self, coordinates: np.ndarray) -> np.ndarray:
+        return np.floor(coordinates / self.cell_size).astype(np.int64)
+
+    def _linear(self, cells: np.ndarray) -> np.ndarray:
+        """격자 안 셀 좌표 → 선형 ID (격자 밖이면 -1)"""
+        relative = cells - self._origin
+        inside = np.all((relative >= 0) & (relative < self._shape), axis=-1)
+        ids = np.zeros(relative.shape[:-1], dtype=np.int64)
+        for axis in range(self.dims):
+            ids = ids * self._shape[axis] + relative[..., axis]
+        return np.where(inside, ids, -1)
+
+    def _lookup(self, cell_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """셀 ID → (members 시작, 끝) (비어 있으면 시작 == 끝)"""
+        position = np.searchsorted(self._cell_ids, cell_ids)
+        position = np.minimum(position, len(self._cell_ids) - 1)
+        found = (cell_ids >= 0) & (self._cell_ids[position] == cell_ids)
+        starts = np.where(found, self._starts[position], 0)
+        ends = np.where(found, self._starts[position + 1], 0)
+        return starts, ends
+
+    def _candidate_pairs(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """점별 자기 셀에 등록된 영역과의 (점 인덱스, 영역 인덱스) 쌍"""
+        starts, ends = self._lookup(self._linear(self._cell_of(points)))
+        counts = ends - starts
+        point_index = np.repeat(np.arange(len(points)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return point_index, self._members[np.repeat(starts, counts) + offsets]
+
+    def _zones_in_box(self, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        """셀 상자 [low, high]에 등록된 영역 인덱스 (중복 제거)"""
+        low = np.maximum(low, self._origin)
+        high = np.minimum(high, self._origin + self._shape - 1)
+        if np.any(high < low):
+            return np.zeros(0, dtype=np.int64)
+        axes = [np.arange(lo, hi + 1) for lo, hi in zip(low, high)]
+        cells = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, self.dims)
+        return self._members_of(self._linear(cells))
+
+    def _zones_on_ring(self, home: np.ndarray, ring: int) -> np.ndarray:
+        """home 셀에서 Chebyshev 거리가 정확히 ring인 셀의 영역 인덱스"""
+        if ring == 0:
+            return self._members_of(self._linear(home[None, :]))
+        grid_low, grid_high = self._origin, self._origin + self._shape - 1
+        faces = []
+        for axis in range(self.dims):
+            # 축 axis 좌표가 ±ring인 면 (앞쪽 축은 중복 방지를 위해 내부만, 격자 밖 셀 제외)
+            ranges = []
+            for other in range(self.dims):
+                inner = 1 if other < axis else 0
+                lo = max(home[other] - ring + inner, grid_low[other])
+                hi = min(home[other] + ring - inner, grid_high[other])
+                if other == axis:
+                    ranges.append([c for c in (home[axis] - ring, home[axis] + ring) if lo <= c <= hi])
+                else:
+                    ranges.append(range(lo, hi + 1))
+            faces.extend(itertools.product(*ranges))
+        if not faces:
+            return np.zeros(0, dtype=np.int64)
+        return self._members_of(self._linear(np.array(faces, dtype=np.int64)))
+
+    def _members_of(self, cell_ids: np.ndarray) -> np.ndarray:
+        starts, ends = self._lookup(cell_ids)
+        counts = ends - starts
+        if not counts.sum():
+            return np.zeros(0, dtype=np.int64)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.unique(self._members[np.repeat(starts, counts) + offsets])
+
+    def _distance(self, point: np.ndarray, zone_index: np.ndarray) -> np.ndarray:
+        return np.maximum(np.linalg.norm(self._centers[zone_index] - point, axis=1) - self._radii[zone_index], 0.0)
+
+
+class IncrementalRiskMap:
+    """증분 위험 지형/FailureAtlas 빌더 (FailureAtlasBuilder 구현)
+
+    새 risk_indicators를 조건 서명별 누적값(running max 또는 EWMA)으로 접어 넣고,
+    임계값을 넘나든 조건만 FailureAtlas(붕괴 영역/안정 영역)에서 옮김.
+    갱신 비용은 전체 조건 수가 아니라 이번에 들어온 지표 수에 비례.
+
+    PhysicsPipeline(atlas_builder=IncrementalRiskMap(...))으로 연결하면
+    process()가 매번 처음부터 재구성하는 대신 update()를 호출하고 변경 내역만 반환.
+    전체 위험 지형/FailureAtlas는 snapshot()으로 조회 (version이 바뀔 때만 새로 복사,
+    같은 버전의 스냅샷은 읽기 전용으로 공유).
+    """
+
+    MODES = ("max", "ewma")
+
+    def __init__(
+        self,
+        mode: str = "max",
+        alpha: float = 0.3,
+        threshold: float = 0.7,
+        hysteresis: float = 0.0,
+        condition_key: Optional[Callable[[Dict[str, Any], float], str]] = None,
+        index: Optional[FailureAtlasIndex] = None,
+        coordinates: Optional[Callable[[str], Sequence[float]]] = None,
+        zone_radius: float = 0.0,
+    ):
+        """IncrementalRiskMap 초기화
+
+        Args:
+            mode: 누적 방식 ("max": 누적 최대, "ewma": 지수 이동 평균)
+            alpha: EWMA 가중치 (새 값 비중, 0 < alpha <= 1)
+            threshold: 붕괴 임계값 (값 >= threshold → 붕괴 영역)
+            hysteresis: 붕괴 영역 이탈 여유 (값 < threshold - hysteresis일 때 이탈)
+            condition_key: (parameters, time) → 조건 접두사 (None이면 지표 이름만 서명으로 사용)
+            index: 붕괴 영역 공간 인덱스 (있으면 진입/이탈 시 영역 추가/삭제)
+            coordinates: 조건 서명 → 조건 공간 좌표 (index 사용 시 필수)
+            zone_radius: 인덱스에 추가할 영역 반경
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 mode: {mode} (가능: {self.MODES})")
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha는 (0, 1] 범위여야 합니다.")
+        if index is not None and coordinates is None:
+            raise ValueError("index를 사용하려면 coordinates가 필요합니다.")
+
+        self.mode = mode
+        self.alpha = alpha
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.condition_key = condition_key
+        self.index = index
+        self.coordinates = coordinates
+        self.zone_radius = zone_radius
+
+        self.risk_map: Dict[str, float] = {}
+        self._collapse: Dict[str, float] = {}  # 삽입 순서 = 진입 순서
+        self._stable: Dict[str, float] = {}
+        self.updates = 0
+        self.version = 0  # 위험 지형이 바뀔 때마다 증가
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 위험 지형/FailureAtlas 스냅샷
+
+        마지막 스냅샷 이후 위험 지형이 바뀌었을 때만 O(전체 조건 수) 복사,
+        아니면 같은 객체를 반환. 이후 update()의 영향을 받지 않음.
+
+        Returns:
+            {"version", "risk_map": 읽기 전용 매핑,
+             "failure_atlas": {"collapse_zones": tuple, "stable_regions": tuple, "threshold"}}
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot["version"] != self.version:
+            snapshot = self._snapshot = {
+                "version": self.version,
+                "risk_map": MappingProxyType(dict(self.risk_map)),
+                "failure_atlas": MappingProxyType({
+                    "collapse_zones": tuple(self._collapse),
+                    "stable_regions": tuple(self._stable),
+                    "threshold": self.threshold,
+                }),
+            }
+        return snapshot
+
+    @property
+    def failure_atlas(self) -> Dict[str, Any]:
+        """현재 FailureAtlas (snapshot()의 failure_atlas를 일반 dict로, 영역 목록은 공유 tuple)"""
+        return dict(self.snapshot()["failure_atlas"])
+
+    def update(
+        self,
+        risk_indicators: Dict[str, float],
+        parameters: Optional[Dict[str, Any]] = None,
+        time: float = 0.0,
+    ) -> Dict[str, Any]:
+        """지표 접어 넣기 (O(len(risk_indicators)))
+
+        Args:
+            risk_indicators: {지표 이름: 위험도}
+            parameters: 조건 접두사 계산용 파라미터 (condition_key가 있을 때)
+            time: 시간 (condition_key 인자)
+
+        Returns:
+            {"changed": {서명: 누적값}, "entered": [서명...], "exited": [서명...]}
+        """
+        prefix = ""
+        if self.condition_key is not None:
+            prefix = f"{self.condition_key(parameters or {}, time)}:"
+
+        changed: Dict[str, float] = {}
+        entered: List[str] = []
+        exited: List[str] = []
+        for name, value in risk_indicators.items():
+            signature = prefix + name
+            value = float(value)
+            previous = self.risk_map.get(signature)
+            if previous is None:
+                current = value
+            elif self.mode == "max":
+                current = max(previous, value)
+            else:
+                current = previous + self.alpha * (value - previous)
+            if current == previous:
+                continue
+            self.risk_map[signature] = current
+            changed[signature] = current
+
+            if signature in self._collapse:
+                if current < self.threshold - self.hysteresis:
+                    del self._collapse[signature]
+                    self._stable[signature] = current
+                    exited.append(signature)
+                else:
+                    self._collapse[signature] = current
+            elif current >= self.threshold:
+                self._stable.pop(signature, None)
+                self._collapse[signature] = current
+                entered.append(signature)
+            else:
+                self._stable[signature] = current
+
+        if self.index is not None:
+            for signature in exited:
+                self.index.remove_zone(signature)
+            for signature in entered:
+                self.index.add_zone(signature, self.coordinates(signature), self.zone_radius,
+                                    risk=self.risk_map[signature])
+
+        self.updates += 1
+        if changed:
+            self.version += 1
+        return {"changed": changed, "entered": entered, "exited": exited}
+
+    def reset(self):
+        """누적 상태 초기화 (인덱스의 붕괴 영역도 삭제)"""
+        if self.index is not None:
+            for signature in self._collapse:
+                self.index.remove_zone(signature)
+        self.risk_map.clear()
+        self._collapse.clear()
+        self._stable.clear()
+        self.updates = 0
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # FailureAtlasBuilder Protocol
+    # ------------------------------------------------------------------
+
+    def build_risk_map(
+        self,
+        features: Dict[str, Any],
+        risk_indicators: Dict[str, float],
+    ) -> Dict[str, float]:
+        """지표를 접어 넣고 누적 위험 지형 스냅샷(읽기 전용) 반환"""
+        self.update(risk_indicators)
+        return self.snapshot()["risk_map"]
+
+    def build_failure_atlas(
+        self,
+        risk_map: Dict[str, float],
+        threshold: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """FailureAtlas 반환
+
+        누적 위험 지형(self.risk_map 또는 build_risk_map()이 반환한 스냅샷)에 대해
+        같은 임계값으로 호출하면 증분 유지된 결과(히스테리시스 반영) 반환,
+        다른 위험 지형이나 임계값이면 처음부터 분류.
+        """
+        if threshold in (None, self.threshold):
+            snapshot = self._snapshot
+            if risk_map is self.risk_map or (snapshot is not None and risk_map is snapshot["risk_map"]):
+                return self.failure_atlas
+        threshold = self.threshold if threshold is None else threshold
+        return {
+            "collapse_zones": [s for s, v in risk_map.items() if v >= threshold],
+            "stable_regions": [s for s, v in risk_map.items() if v < threshold],
+            "threshold": threshold,
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        """빌더 상태 반환"""
+        return {
+            "mode": self.mode,
+            "threshold": self.threshold,
+            "conditions": len(self.risk_map),
+            "collapse_zones": len(self._collapse),
+            "updates": self.updates,
+            "version": self.version,
+        }
@@ -0,0 +1,262 @@
+"""
+Feature Cache - 물리 특징 캐시
+
+PhysicsPipeline의 (parameters, time) → {features, risk_indicators} 결과 캐시
+
+구조 (2단계):
+    메모리 LRU (max_entries) → 디스크 내용 주소(content-addressed) 저장소 (선택)
+
+    키 = sha256(namespace + 정규화된 parameters + time)
+    디스크 경로 = cache_dir / 키[:2] / 키.pkl
+
+- 파라미터 스윕에서 같은 점을 다시 방문하면 장 생성(generate_field)과 특징 추출을 모두 건너뜀
+- 디스크 기록은 임시 파일 → os.replace (원자적, 여러 프로세스가 같은 디렉토리 공유 가능)
+- 디스크 항목은 pickle (신뢰할 수 있는 디렉토리에만 사용할 것)
+- 메모리 tier는 저장/조회 시 deep copy (파이프라인 결과를 수정해도 캐시 오염 없음)
+
+Note:
+    캐시 키는 어댑터/추출기 설정을 모름. 설정(점성 계수, 격자 등)이 다른 파이프라인이
+    같은 cache_dir를 공유하면 namespace를 다르게 지정할 것.
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import numpy as np
+
+__version__ = "0.1.0"
+
+
+def _canonical(value: Any) -> Any:
+    """JSON 직렬화 가능한 정규 형태로 변환
+
+    - 수치: int/float/numpy 스칼라 구분 없이 값이 같으면 같은 형태 (float로 정확히 표현되는 값은 16진 표현)
+    - 딕셔너리: 키의 정규 형태(타입 포함) 문자열로만 정렬 ("1"과 1은 다른 키)
+    """
+    if value is None or isinstance(value, (bool, np.bool_, str)):
+        return value if not isinstance(value, np.bool_) else bool(value)
+    if isinstance(value, (int, np.integer)):
+        value = int(value)
+        # 2^53 초과 정수는 float 변환 시 값이 바뀌므로 정수 그대로
+        return {"f": float(value).hex()} if float(value) == value else {"i": str(value)}
+    if isinstance(value, (float, np.floating)):
+        return {"f": float(value).hex()}
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        return {
+            "nd": array.dtype.str,
+            "shape": list(array.shape),
+            "sha256": hashlib.sha256(array.tobytes()).hexdigest(),
+        }
+    if isinstance(value, dict):
+        items = [
+            (json.dumps(_canonical(k), separators=(",", ":")), _canonical(v))
+            for k, v in value.items()
+        ]
+        items.sort(key=lambda item: item[0])
+        return {"d": [[k, v] for k, v in items]}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, os.PathLike):
+        return {"path": os.fspath(value)}
+    raise TypeError(f"캐시 키로 정규화할 수 없는 파라미터 타입: {type(value).__name__}")
+
+
+def canonical_key(
+    parameters: Dict[str, Any],
+    time: float,
+    namespace: str = "",
+) -> str:
+    """(parameters, time)의 정규 해시 키
+
+    딕셔너리 키 순서, 수치의 int/float/numpy 스칼라 구분(parameters와 time 모두)과 무관하게 같은 키.
+    (예: {"re": 100}과 {"re": 100.0}은 같은 키, 배열은 dtype까지 구분)
+
+    Args:
+        parameters: 시뮬레이션 파라미터 (스칼라, 문자열, 리스트, 딕셔너리, numpy 배열)
+        time: 시간
+        namespace: 키 공간 구분자
+
+    Returns:
+        sha256 16진 문자열
+    """
+    payload = json.dumps(
+        [namespace, _canonical(parameters), float(time).hex()],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FeatureCache:
+    """2단계 특징 캐시 (메모리 LRU + 디스크)
+
+    PhysicsPipeline(feature_cache=...)로 연결하여 사용.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        namespace: str = "",
+        enable_logging: bool = True,
+    ):
+        """FeatureCache 초기화
+
+        Args:
+            max_entries: 메모리 tier 최대 항목 수 (0이면 디스크 tier만 사용)
+            cache_dir: 디스크 tier 디렉토리 (None이면 메모리만)
+            namespace: 키 공간 구분자 (어댑터/추출기 설정 식별용)
+            enable_logging: 로깅 활성화 여부
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries는 0 이상이어야 합니다.")
+
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.namespace = namespace
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # LRU (오래된 것이 앞)
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evicted": 0,
+        }
+
+        if enable_logging:
+            self.logger = logging.getLogger("FeatureCache")
+        else:
+            self.logger = None
+
+    def key(self, parameters: Dict[str, Any], time: float) -> str:
+        """캐시 키 계산 (namespace 포함)"""
+        return canonical_key(parameters, time, self.namespace)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (메모리 → 디스크, 디스크 적중은 메모리로 승격)
+
+        Args:
+            key: key()로 계산한 키
+
+        Returns:
+            저장된 값의 복사본 또는 None (호출자가 수정해도 캐시는 변하지 않음)
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return copy.deepcopy(value)
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+            self._remember(key, value)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """캐시 저장 (메모리 + 디스크)
+
+        Args:
+            key: key()로 계산한 키
+            value: {"features", "risk_indicators"} (복사본을 저장하므로 이후 호출자의 수정과 무관)
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+            self.stats["stores"] += 1
+        self._write_disk(key, value)
+
+    def clear(self, disk: bool = False):
+        """캐시 비우기
+
+        Args:
+            disk: True면 디스크 항목도 삭제
+        """
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob("*/*.pkl"):
+                path.unlink(missing_ok=True)
+
+    def get_state(self) -> Dict[str, Any]:
+        """캐시 상태 반환"""
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+                "namespace": self.namespace,
+                "stats": dict(self.stats),
+            }
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, value: Dict[str, Any]):
+        """메모리 tier에 저장 (잠금 보유 상태에서 호출)"""
+        if self.max_entries == 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # 손상된 항목은 미스로 처리 (다음 put이 덮어씀)
+            if self.logger:
+                self.logger.warning("캐시 항목 읽기 실패 %s: %s", path, e)
+            return None
+
+    def _write_disk(self, key: str, value: Dict[str, Any]):
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
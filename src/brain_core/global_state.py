@@ -13,13 +13,77 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 import numpy as np
+import sys
 import time
 
 __version__ = "0.2.0"
 
 
+class _StateViews:
+    """GlobalState 계열 공통 조회 메서드 (L0/L1/L2 편의 프로퍼티)
+    
+    get_extension()만 있으면 동작하므로 dataclass/slots 구현이 모두 공유.
+    __slots__ = ()로 선언하여 슬롯 기반 하위 클래스에 __dict__를 추가하지 않음.
+    """
+    
+    __slots__ = ()
+    
+    # 편의 메서드: L0 관련 (extensions["L0"] 사용)
+    @property
+    def l0_weights(self) -> Optional[np.ndarray]:
+        """L0 가중치 행렬"""
+        l0_data = self.get_extension("L0")
+        return l0_data.get("weights") if l0_data and isinstance(l0_data, dict) else None
+    
+    @property
+    def l0_bias(self) -> Optional[np.ndarray]:
+        """L0 바이어스 벡터"""
+        l0_data = self.get_extension("L0")
+        return l0_data.get("bias") if l0_data and isinstance(l0_data, dict) else None
+    
+    @property
+    def l0_converged(self) -> bool:
+        """L0 수렴 여부"""
+        l0_data = self.get_extension("L0")
+        return l0_data.get("converged", False) if l0_data and isinstance(l0_data, dict) else False
+    
+    # 편의 메서드: L1 관련 (extensions["L1"] 사용)
+    @property
+    def risk_map(self) -> Optional[Dict[str, float]]:
+        """위험 지형"""
+        l1_data = self.get_extension("L1")
+        return l1_data.get("risk_map") if l1_data and isinstance(l1_data, dict) else None
+    
+    @property
+    def manifold_dimensions(self) -> Optional[Dict[str, Any]]:
+        """상태 공간 차원"""
+        l1_data = self.get_extension("L1")
+        return l1_data.get("dimensions") if l1_data and isinstance(l1_data, dict) else None
+    
+    # 편의 메서드: L2 관련 (extensions["L2"] 사용)
+    @property
+    def causal_links(self) -> Optional[List[Any]]:
+        """인과 링크"""
+        l2_data = self.get_extension("L2")
+        return l2_data.get("causal_links") if l2_data and isinstance(l2_data, dict) else None
+    
+    @property
+    def storyline(self) -> Optional[List[Any]]:
+        """스토리라인"""
+        l2_data = self.get_extension("L2")
+        return l2_data.get("storyline") if l2_data and isinstance(l2_data, dict) else None
+    
+    def memory_report(self) -> Dict[str, int]:
+        """인스턴스 메모리 사용량 보고 (바이트)
+        
+        Returns:
+            state_memory_report() 결과
+        """
+        return state_memory_report(self)
+
+
 @dataclass
-class GlobalState:
+class GlobalState(_StateViews):
     """공통 상태 표현 (Core + Extensions 구조)
     
     Core: 항상 있는 최소 공통 필드
@@ -135,48 +199,217 @@ class GlobalState:
         if not (0.0 <= self.risk <= 1.0):
             return False
         return True
+
+
+class CompactGlobalState(_StateViews):
+    """슬롯 기반 경량 GlobalState (대량 세션 풀용)
     
-    # 편의 메서드: L0 관련 (extensions["L0"] 사용)
-    @property
-    def l0_weights(self) -> Optional[np.ndarray]:
-        """L0 가중치 행렬"""
-        l0_data = self.get_extension("L0")
-        return l0_data.get("weights") if l0_data and isinstance(l0_data, dict) else None
+    GlobalState와 동일한 API를 제공하되:
+    - __slots__로 인스턴스 __dict__ 제거
+    - metadata/extensions는 처음 접근할 때 생성 (lazy)
+    - state_vector dtype 지정 가능 (예: float32)
     
-    @property
-    def l0_bias(self) -> Optional[np.ndarray]:
-        """L0 바이어스 벡터"""
-        l0_data = self.get_extension("L0")
-        return l0_data.get("bias") if l0_data and isinstance(l0_data, dict) else None
+    Attributes:
+        state_vector: 공통 상태 벡터 (N차원)
+        energy: 에너지 (Hopfield energy)
+        risk: 위험도 (0.0 ~ 1.0)
+        step: 시뮬레이션 스텝
+        timestamp: 시간 스탬프
+        metadata: 추가 정보 (lazy)
+        extensions: 엔진별 확장 데이터 (lazy)
+    """
     
-    @property
-    def l0_converged(self) -> bool:
-        """L0 수렴 여부"""
-        l0_data = self.get_extension("L0")
-        return l0_data.get("converged", False) if l0_data and isinstance(l0_data, dict) else False
+    __slots__ = (
+        "state_vector",
+        "energy",
+        "risk",
+        "step",
+        "timestamp",
+        "_metadata",
+        "_extensions",
+    )
     
-    # 편의 메서드: L1 관련 (extensions["L1"] 사용)
-    @property
-    def risk_map(self) -> Optional[Dict[str, float]]:
-        """위험 지형"""
-        l1_data = self.get_extension("L1")
-        return l1_data.get("risk_map") if l1_data and isinstance(l1_data, dict) else None
+    def __init__(
+        self,
+        state_vector: np.ndarray,
+        energy: float = 0.0,
+        risk: float = 0.0,
+        step: int = 0,
+        timestamp: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        extensions: Optional[Dict[str, Any]] = None,
+        dtype: Optional[Any] = None,
+    ):
+        """CompactGlobalState 초기화
+        
+        Args:
+            state_vector: 상태 벡터
+            energy: 에너지
+            risk: 위험도
+            step: 스텝
+            timestamp: 시간 스탬프 (None이면 현재 시각)
+            metadata: 추가 정보 (비어 있으면 할당하지 않음)
+            extensions: 확장 데이터 (비어 있으면 할당하지 않음)
+            dtype: state_vector 저장 dtype (None이면 입력 dtype 유지)
+        """
+        self.state_vector = (
+            np.asarray(state_vector, dtype=dtype) if dtype is not None
+            else np.asarray(state_vector)
+        )
+        self.energy = energy
+        self.risk = risk
+        self.step = step
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._metadata = metadata or None
+        self._extensions = extensions or None
     
-    @property
-    def manifold_dimensions(self) -> Optional[Dict[str, Any]]:
-        """상태 공간 차원"""
-        l1_data = self.get_extension("L1")
-        return l1_data.get("dimensions") if l1_data and isinstance(l1_data, dict) else None
+    @classmethod
+    def from_state(cls, state: Any, dtype: Optional[Any] = None) -> 'CompactGlobalState':
+        """GlobalState(또는 호환 객체)에서 변환
+        
+        Args:
+            state: 원본 상태
+            dtype: state_vector 저장 dtype
+        
+        Returns:
+            CompactGlobalState
+        """
+        return cls(
+            state_vector=state.state_vector,
+            energy=state.energy,
+            risk=state.risk,
+            step=state.step,
+            timestamp=state.timestamp,
+            metadata=dict(state.metadata) if state.metadata else None,
+            extensions=dict(state.extensions) if state.extensions else None,
+            dtype=dtype,
+        )
+    
+    def to_global_state(self) -> GlobalState:
+        """일반 GlobalState로 변환"""
+        return GlobalState(
+            state_vector=self.state_vector,
+            energy=self.energy,
+            risk=self.risk,
+            step=self.step,
+            timestamp=self.timestamp,
+            metadata=dict(self._metadata) if self._metadata else {},
+            extensions=dict(self._extensions) if self._extensions else {},
+        )
     
-    # 편의 메서드: L2 관련 (extensions["L2"] 사용)
     @property
-    def causal_links(self) -> Optional[List[Any]]:
-        """인과 링크"""
-        l2_data = self.get_extension("L2")
-        return l2_data.get("causal_links") if l2_data and isinstance(l2_data, dict) else None
+    def metadata(self) -> Dict[str, Any]:
+        """추가 정보 (첫 접근 시 할당)"""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = value
     
     @property
-    def storyline(self) -> Optional[List[Any]]:
-        """스토리라인"""
-        l2_data = self.get_extension("L2")
-        return l2_data.get("storyline") if l2_data and isinstance(l2_data, dict) else None
+    def extensions(self) -> Dict[str, Any]:
+        """엔진별 확장 데이터 (첫 접근 시 할당)"""
+        if self._extensions is None:
+            self._extensions = {}
+        return self._extensions
+    
+    @extensions.setter
+    def extensions(self, value: Dict[str, Any]):
+        self._extensions = value
+    
+    def get_extension(self, engine_name: str, default: Any = None) -> Any:
+        """엔진별 확장 데이터 조회 (조회만으로는 할당하지 않음)"""
+        if self._extensions is None:
+            return default
+        return self._extensions.get(engine_name, default)
+    
+    def set_extension(self, engine_name: str, data: Any):
+        """엔진별 확장 데이터 설정"""
+        self.extensions[engine_name] = data
+    
+    def update_extension(self, engine_name: str, **kwargs):
+        """엔진별 확장 데이터 부분 업데이트"""
+        extensions = self.extensions
+        if engine_name not in extensions:
+            extensions[engine_name] = {}
+        extensions[engine_name].update(kwargs)
+    
+    def copy(self, deep: bool = False) -> 'CompactGlobalState':
+        """상태 복사 (GlobalState.copy와 동일한 의미)
+        
+        Args:
+            deep: True면 deep copy, False면 shallow copy (기본값)
+        
+        Returns:
+            복사된 상태 (비어 있는 metadata/extensions는 계속 미할당)
+        """
+        new = CompactGlobalState.__new__(CompactGlobalState)
+        new.state_vector = self.state_vector.copy() if deep else self.state_vector
+        new.energy = self.energy
+        new.risk = self.risk
+        new.step = self.step
+        new.timestamp = self.timestamp
+        new._metadata = self._metadata.copy() if self._metadata else None
+        if not self._extensions:
+            new._extensions = None
+        elif deep:
+            new._extensions = {k: (v.copy() if hasattr(v, 'copy') else v)
+                               for k, v in self._extensions.items()}
+        else:
+            new._extensions = self._extensions.copy()
+        return new
+    
+    def update_step(self, step: int):
+        """스텝 업데이트"""
+        self.step = step
+        self.timestamp = time.time()
+    
+    def get_dimension(self) -> int:
+        """상태 벡터 차원 반환"""
+        return len(self.state_vector)
+    
+    def is_valid(self) -> bool:
+        """상태 유효성 검사 (최소만)"""
+        if self.state_vector is None or len(self.state_vector) == 0:
+            return False
+        if not (0.0 <= self.risk <= 1.0):
+            return False
+        return True
+    
+    def __repr__(self) -> str:
+        return (
+            f"CompactGlobalState(dim={len(self.state_vector)}, "
+            f"dtype={self.state_vector.dtype}, energy={self.energy}, "
+            f"risk={self.risk}, step={self.step})"
+        )
+
+
+def state_memory_report(state: Any) -> Dict[str, int]:
+    """상태 인스턴스의 메모리 사용량 보고 (바이트, shallow)
+    
+    metadata/extensions는 컨테이너 크기만 계산 (내부 값은 제외).
+    할당되지 않은 lazy 컨테이너는 0으로 계산.
+    
+    Args:
+        state: GlobalState 또는 CompactGlobalState
+    
+    Returns:
+        {object, instance_dict, metadata, extensions, state_vector, total}
+    """
+    report = {
+        "object": sys.getsizeof(state),
+        "instance_dict": sys.getsizeof(state.__dict__) if hasattr(state, "__dict__") else 0,
+    }
+    for name in ("metadata", "extensions"):
+        # lazy 컨테이너는 프로퍼티 접근 없이 슬롯 값으로 확인
+        container = getattr(state, f"_{name}", None) if isinstance(state, CompactGlobalState) \
+            else getattr(state, name, None)
+        report[name] = sys.getsizeof(container) if container is not None else 0
+    
+    vector = state.state_vector
+    report["state_vector"] = sys.getsizeof(vector) if vector.base is None \
+        else sys.getsizeof(vector) + vector.nbytes
+    report["total"] = sum(report.values())
+    return report
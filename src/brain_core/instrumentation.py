@@ -0,0 +1,216 @@
+"""
+Instrumentation - 엔진별 지연/할당 계측
+
+상태계 중심 루프에서 엔진 update 호출 비용을 측정
+
+계측 항목 (엔진별):
+- 호출 수, 오류 수, 스킵 수 (사유별)
+- wall time / CPU time 히스토그램 (log2 버킷)
+- tracemalloc 할당 변화량 (선택, 오버헤드 큼)
+
+산업용 중심:
+- 계측기를 연결하지 않으면 루프는 분기 하나만 추가로 평가 (거의 0 오버헤드)
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, Callable
+from bisect import bisect_left
+import json
+import time
+import tracemalloc
+
+__version__ = "0.1.0"
+
+# 히스토그램 버킷 상한 (초): 1us, 2us, 4us, ... ~16.8s
+_BUCKET_BOUNDS = tuple(1e-6 * (2 ** i) for i in range(25))
+
+
+def _format_bound(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"<={seconds * 1e6:.0f}us"
+    if seconds < 1.0:
+        return f"<={seconds * 1e3:.3g}ms"
+    return f"<={seconds:.3g}s"
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (고정 log2 버킷, 상수 메모리)"""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)  # 마지막 버킷: 상한 초과
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """측정값 기록"""
+        self.counts[bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """분위수 근사 (버킷 상한 기준)
+
+        Args:
+            q: 분위 (0.0 ~ 1.0)
+
+        Returns:
+            q 분위가 속한 버킷의 상한 (초)
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                return min(_BUCKET_BOUNDS[i], self.max) if i < len(_BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (빈 버킷 제외)"""
+        buckets = {}
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                label = _format_bound(_BUCKET_BOUNDS[i]) if i < len(_BUCKET_BOUNDS) else "overflow"
+                buckets[label] = bucket_count
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class EngineStats:
+    """엔진 하나의 계측 값"""
+
+    __slots__ = ("calls", "errors", "skips", "wall", "cpu", "alloc_net", "alloc_peak")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.skips: Dict[str, int] = {}
+        self.wall = LatencyHistogram()
+        self.cpu = LatencyHistogram()
+        self.alloc_net = 0   # 누적 순 할당 (바이트)
+        self.alloc_peak = 0  # 단일 호출 최대 피크 할당 (바이트)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "skips": dict(self.skips),
+            "skip_count": sum(self.skips.values()),
+            "wall_time": self.wall.to_dict(),
+            "cpu_time": self.cpu.to_dict(),
+            "alloc_net_bytes": self.alloc_net,
+            "alloc_peak_bytes": self.alloc_peak,
+        }
+
+
+class EngineProfiler:
+    """엔진별 계측기
+
+    StateCentricExecutionLoop(profiler=...)로 연결하여 사용.
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        """EngineProfiler 초기화
+
+        Args:
+            trace_allocations: tracemalloc으로 호출별 할당 변화량 측정
+                (tracemalloc이 꺼져 있으면 자동 시작, 실행 속도가 크게 느려짐)
+        """
+        self.trace_allocations = trace_allocations
+        self.engines: Dict[str, EngineStats] = {}
+        self._started_tracemalloc = False
+
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def _stats(self, name: str) -> EngineStats:
+        stats = self.engines.get(name)
+        if stats is None:
+            stats = self.engines[name] = EngineStats()
+        return stats
+
+    def call(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """함수 호출 계측 (예외는 기록 후 그대로 전파)
+
+        Args:
+            name: 엔진 이름
+            func: 호출할 함수 (보통 engine.update)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        stats = self._stats(name)
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            mem_before = tracemalloc.get_traced_memory()[0]
+
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            return func(*args)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.wall.record(time.perf_counter() - wall_start)
+            stats.cpu.record(time.thread_time() - cpu_start)
+            stats.calls += 1
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                stats.alloc_net += current - mem_before
+                stats.alloc_peak = max(stats.alloc_peak, peak - mem_before)
+
+    def record_skip(self, name: str, reason: str):
+        """엔진 호출 스킵 기록
+
+        Args:
+            name: 엔진 이름
+            reason: 스킵 사유 (예: "cycle_aborted")
+        """
+        skips = self._stats(name).skips
+        skips[reason] = skips.get(reason, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """계측 결과를 딕셔너리로 반환"""
+        return {
+            "trace_allocations": self.trace_allocations,
+            "engines": {name: stats.to_dict() for name, stats in self.engines.items()},
+        }
+
+    def to_json(self, **json_kwargs: Any) -> str:
+        """계측 결과를 JSON 문자열로 반환"""
+        return json.dumps(self.to_dict(), **json_kwargs)
+
+    def reset(self):
+        """계측 값 초기화"""
+        self.engines.clear()
+
+    def close(self):
+        """이 계측기가 시작한 tracemalloc 정지"""
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
@@ -9,7 +9,7 @@ Version: 0.1.0
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Tuple
 import sys
 from pathlib import Path
 
@@ -74,12 +74,15 @@ class CognitiveKernelIntegration:
         self,
         core: BrainCore,
         engine_names: Optional[list] = None,
+        converters: Optional[Dict[Tuple[str, str], Callable[[Dict[str, Any]], Dict[str, Any]]]] = None,
     ) -> Dict[str, bool]:
         """엔진들을 BrainCore에 통합
         
         Args:
             core: BrainCore 인스턴스
             engine_names: 통합할 엔진 이름 리스트 (None이면 모두)
+            converters: 엔진 쌍 형식 변환 {(source, target): 변환 함수}
+                (core.data_flow에 등록, 어댑터마다 변환 코드를 두지 않음)
         
         Returns:
             통합 결과 딕셔너리 {엔진명: 성공여부}
@@ -87,6 +90,9 @@ class CognitiveKernelIntegration:
         if engine_names is None:
             engine_names = ["thalamus", "amygdala"]
         
+        for (source_engine, target_engine), converter in (converters or {}).items():
+            core.data_flow.register_converter(source_engine, target_engine, converter)
+        
         results = {}
         
         for engine_name in engine_names:
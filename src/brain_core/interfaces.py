@@ -18,11 +18,23 @@ Version: 0.1.0
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Protocol, runtime_checkable
+from typing import Dict, Any, List, Optional, Protocol, Callable, Sequence, Tuple, runtime_checkable
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from collections import deque
+from collections.abc import Mapping
+import math
+import numbers
+import numpy as np
 
 __version__ = "0.1.0"
 
+# 컴파일된 스키마 검사 함수: data -> (유효성, 오류 메시지)
+SchemaValidator = Callable[[Dict[str, Any]], Tuple[bool, Optional[str]]]
+
+# 엔진 쌍 변환 함수: data -> 변환된 data (입력을 수정하지 않고 새 딕셔너리 반환)
+Converter = Callable[[Dict[str, Any]], Dict[str, Any]]
+
 
 @runtime_checkable
 class BrainEngine(Protocol):
@@ -84,6 +96,21 @@ class BrainEngineBase(ABC):
         """
         pass
     
+    def process_many(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 입력 일괄 처리
+        
+        기본 구현은 process를 순서대로 호출.
+        배치 연산이 가능한 엔진은 재정의하여 사용.
+        
+        Args:
+            inputs: 입력 데이터 리스트
+        
+        Returns:
+            처리 결과 리스트 (입력 순서 유지)
+        """
+        process = self.process
+        return [process(input_data) for input_data in inputs]
+    
     def get_state(self) -> Dict[str, Any]:
         """현재 상태 반환
         
@@ -108,6 +135,45 @@ class BrainEngineBase(ABC):
         }
 
 
+def freeze_payload(data: Mapping) -> Mapping:
+    """읽기 전용 페이로드로 변환 (zero-copy 전달용)
+    
+    딕셔너리는 MappingProxyType으로 감싸고, ndarray 값은 쓰기 불가 뷰로 교체.
+    배열 데이터 자체는 복사하지 않음 (비용: 키 개수에 비례).
+    중첩 컨테이너는 얕게만 보호됨.
+    
+    Args:
+        data: 원본 데이터
+    
+    Returns:
+        읽기 전용 매핑
+    """
+    if isinstance(data, MappingProxyType):
+        return data
+    frozen = {}
+    for key, value in data.items():
+        if isinstance(value, np.ndarray) and value.flags.writeable:
+            value = value.view()
+            value.flags.writeable = False
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+def thaw_payload(data: Mapping) -> Dict[str, Any]:
+    """수정 가능한 페이로드로 복사 (수정을 선언한 엔진용)
+    
+    Args:
+        data: 읽기 전용(또는 일반) 매핑
+    
+    Returns:
+        새 딕셔너리 (ndarray 값은 쓰기 가능한 복사본)
+    """
+    return {
+        key: value.copy() if isinstance(value, np.ndarray) else value
+        for key, value in data.items()
+    }
+
+
 class DataConverter:
     """데이터 변환 레이어
     
@@ -120,6 +186,8 @@ class DataConverter:
         target_format: Optional[str] = None,
         source_engine: Optional[str] = None,
         target_engine: Optional[str] = None,
+        copy: bool = True,
+        plan: Optional[Sequence[Converter]] = None,
     ) -> Dict[str, Any]:
         """데이터 변환
         
@@ -128,19 +196,21 @@ class DataConverter:
             target_format: 목표 형식 (None이면 자동 감지)
             source_engine: 소스 엔진 이름
             target_engine: 목표 엔진 이름
+            copy: False면 원본을 복사 없이 전달 (zero-copy 모드)
+            plan: 엔진 쌍 변환 함수 체인 (ConverterRegistry.resolve 결과)
         
         Returns:
             변환된 데이터
         """
-        # 기본 변환: 딕셔너리 복사
-        converted = source_data.copy()
-        
-        # 엔진별 특수 변환 (필요시)
-        if source_engine and target_engine:
-            # 특정 엔진 쌍에 대한 변환 로직
-            pass
+        # 엔진 쌍 변환: 변환 함수가 새 딕셔너리를 만들므로 기본 복사 생략
+        if plan:
+            converted = source_data
+            for step in plan:
+                converted = step(converted)
+            return converted
         
-        return converted
+        # 기본 변환: 딕셔너리 복사 (zero-copy 모드에서는 그대로 전달)
+        return source_data.copy() if copy else source_data
     
     @staticmethod
     def validate(
@@ -169,57 +239,321 @@ class DataConverter:
             for key, (min_val, max_val) in value_ranges.items():
                 if key in data:
                     value = data[key]
-                    if isinstance(value, (int, float)):
-                        if value < min_val or value > max_val:
+                    # numbers.Real: Python/numpy 스칼라 모두 포함, NaN은 범위 위반
+                    if isinstance(value, numbers.Real):
+                        if math.isnan(value) or value < min_val or value > max_val:
                             return False, f"키 '{key}' 값이 범위를 벗어남: {value} (범위: {min_val}~{max_val})"
         
         return True, None
+    
+    @staticmethod
+    def compile_schema(
+        expected_keys: Optional[list] = None,
+        value_ranges: Optional[Dict[str, tuple]] = None,
+    ) -> SchemaValidator:
+        """스키마를 검사 함수로 컴파일 (한 번만 준비, 매 전달마다 재사용)
+        
+        validate()와 같은 규칙에 더해 ndarray 값은 min/max로 벡터화 범위 검사.
+        (스칼라는 numpy 스칼라 포함, NaN 스칼라와 NaN이 포함된 배열은 범위 위반으로 처리)
+        
+        Args:
+            expected_keys: 예상 키 리스트
+            value_ranges: 값 범위 딕셔너리 {key: (min, max)}
+        
+        Returns:
+            검사 함수 data -> (유효성, 오류 메시지)
+        """
+        required = frozenset(expected_keys) if expected_keys else None
+        ranges = tuple(
+            (key, min_val, max_val) for key, (min_val, max_val) in (value_ranges or {}).items()
+        )
+        
+        def validator(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+            # 키 검사
+            if required is not None and not required <= data.keys():
+                return False, f"누락된 키: {set(required - data.keys())}"
+            
+            # 값 범위 검사
+            for key, min_val, max_val in ranges:
+                value = data.get(key)
+                if value is None:
+                    continue
+                if isinstance(value, numbers.Real):
+                    if math.isnan(value) or value < min_val or value > max_val:
+                        return False, f"키 '{key}' 값이 범위를 벗어남: {value} (범위: {min_val}~{max_val})"
+                elif isinstance(value, np.ndarray) and value.size:
+                    low, high = value.min(), value.max()
+                    if not (min_val <= low and high <= max_val):
+                        return False, (
+                            f"키 '{key}' 배열 값이 범위를 벗어남: [{low}, {high}] "
+                            f"(범위: {min_val}~{max_val})"
+                        )
+            return True, None
+        
+        validator.expected_keys = required
+        validator.value_ranges = dict(value_ranges or {})
+        return validator
+
+
+class ConverterRegistry:
+    """엔진 쌍별 변환 함수 레지스트리
+    
+    (source_engine, target_engine)마다 변환 함수를 등록.
+    직접 등록된 변환이 없으면 등록된 변환을 이어 붙인 최단 경로 체인을 사용
+    (예: thalamus→amygdala가 없고 thalamus→hub, hub→amygdala가 있으면 두 단계 체인).
+    
+    해석된 체인(plan)은 캐시되어, 같은 엔진 쌍의 반복 전달은 딕셔너리 조회 한 번으로 끝남.
+    등록/해제 시 캐시는 비워짐.
+    """
+    
+    def __init__(self):
+        self._converters: Dict[str, Dict[str, Converter]] = {}
+        self._plans: Dict[Tuple[str, str], Tuple[Converter, ...]] = {}
+    
+    def register(self, source_engine: str, target_engine: str, converter: Converter):
+        """변환 함수 등록 (같은 쌍이 있으면 교체)
+        
+        Args:
+            source_engine: 소스 엔진 이름
+            target_engine: 목표 엔진 이름
+            converter: 변환 함수 (입력을 수정하지 않고 새 딕셔너리 반환)
+        """
+        if not callable(converter):
+            raise TypeError("converter는 호출 가능해야 합니다.")
+        self._converters.setdefault(source_engine, {})[target_engine] = converter
+        self._plans.clear()
+    
+    def unregister(self, source_engine: str, target_engine: str) -> bool:
+        """변환 함수 해제
+        
+        Returns:
+            해제 여부 (등록되어 있지 않았으면 False)
+        """
+        targets = self._converters.get(source_engine)
+        if not targets or target_engine not in targets:
+            return False
+        del targets[target_engine]
+        if not targets:
+            del self._converters[source_engine]
+        self._plans.clear()
+        return True
+    
+    def resolve(self, source_engine: str, target_engine: str) -> Tuple[Converter, ...]:
+        """엔진 쌍 변환 체인 반환 (캐시)
+        
+        Args:
+            source_engine: 소스 엔진 이름
+            target_engine: 목표 엔진 이름
+        
+        Returns:
+            변환 함수 튜플 (경로가 없으면 빈 튜플)
+        """
+        key = (source_engine, target_engine)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = self._shortest_path(source_engine, target_engine)
+        return plan
+    
+    def has_path(self, source_engine: str, target_engine: str) -> bool:
+        """엔진 쌍 변환 경로 존재 여부"""
+        return bool(self.resolve(source_engine, target_engine))
+    
+    def _shortest_path(self, source_engine: str, target_engine: str) -> Tuple[Converter, ...]:
+        """BFS로 변환 단계 수가 가장 적은 체인 탐색"""
+        if source_engine == target_engine or source_engine not in self._converters:
+            return ()
+        
+        previous: Dict[str, str] = {source_engine: source_engine}
+        frontier = deque([source_engine])
+        while frontier:
+            node = frontier.popleft()
+            for neighbor in self._converters.get(node, {}):
+                if neighbor in previous:
+                    continue
+                previous[neighbor] = node
+                if neighbor == target_engine:
+                    return self._build_plan(previous, target_engine)
+                frontier.append(neighbor)
+        return ()
+    
+    def _build_plan(self, previous: Dict[str, str], target_engine: str) -> Tuple[Converter, ...]:
+        steps = []
+        node = target_engine
+        while previous[node] != node:
+            parent = previous[node]
+            steps.append(self._converters[parent][node])
+            node = parent
+        return tuple(reversed(steps))
+    
+    def get_state(self) -> Dict[str, Any]:
+        """등록 현황 반환"""
+        return {
+            "pairs": [
+                (source, target)
+                for source, targets in self._converters.items()
+                for target in targets
+            ],
+            "cached_plans": len(self._plans),
+        }
 
 
 class StateSynchronizer:
     """상태 동기화 관리자
     
     여러 엔진의 상태를 동기화
+    
+    "copy" 모드 이력은 엔진별 변경분(delta)만 보관:
+        {"engine", "timestamp", "version", "delta": {바뀐 키: 값}, "removed": (삭제된 키, ...)}
+    이력은 최근 history_size개로 제한되며, 밀려난 변경분은 엔진별 기준 상태(base)에
+    합쳐지므로 보관 범위 안의 과거 상태는 get_state_at()으로 복원 가능.
     """
     
-    def __init__(self):
-        """StateSynchronizer 초기화"""
+    def __init__(self, record: str = "copy", history_size: int = 100):
+        """StateSynchronizer 초기화
+        
+        Args:
+            record: "copy" (변경분 복사본 보관) 또는
+                "reference" (참조 + 버전 스탬프만 보관, 복사 없음)
+            history_size: 동기화 이력 최대 보관 수
+        """
+        if record not in ("copy", "reference"):
+            raise ValueError(f"지원하지 않는 record 모드: {record}")
+        self.record = record
         self.engine_states: Dict[str, Dict[str, Any]] = {}
-        self.sync_history: list = []
+        self.versions: Dict[str, int] = {}
+        self.sync_history: deque = deque(maxlen=history_size)
+        
+        # 이력에서 밀려난 변경분을 합친 엔진별 기준 상태 {engine: (version, state)}
+        self._bases: Dict[str, Tuple[int, Dict[str, Any]]] = {}
     
     def update_state(self, engine_name: str, state: Dict[str, Any]):
         """엔진 상태 업데이트
         
         Args:
             engine_name: 엔진 이름
-            state: 상태 정보
+            state: 상태 정보 ("reference" 모드에서는 이후 수정하지 말 것)
         """
+        version = self.versions.get(engine_name, 0) + 1
+        self.versions[engine_name] = version
+        
+        if self.record == "reference":
+            self.engine_states[engine_name] = state
+            self._append({
+                "engine": engine_name,
+                "timestamp": time.time(),
+                "version": version,
+            })
+            return
+        
+        previous = self.engine_states.get(engine_name)
+        if previous is None:
+            delta = state.copy()
+            removed = ()
+        else:
+            delta = {
+                key: value for key, value in state.items()
+                if key not in previous or not _same_value(previous[key], value)
+            }
+            removed = tuple(key for key in previous if key not in state)
+        
         self.engine_states[engine_name] = state.copy()
-        self.sync_history.append({
+        self._append({
             "engine": engine_name,
             "timestamp": time.time(),
-            "state": state.copy(),
+            "version": version,
+            "delta": delta,
+            "removed": removed,
         })
-        # 최근 100개만 유지
-        if len(self.sync_history) > 100:
-            self.sync_history = self.sync_history[-100:]
     
-    def get_synchronized_state(self) -> Dict[str, Any]:
+    def _append(self, entry: Dict[str, Any]):
+        """이력 추가 (가득 차면 가장 오래된 변경분을 기준 상태에 합침)"""
+        history = self.sync_history
+        if history.maxlen is not None and len(history) == history.maxlen:
+            oldest = history.popleft()
+            if "delta" in oldest:
+                engine_name = oldest["engine"]
+                _, base = self._bases.get(engine_name, (0, {}))
+                self._bases[engine_name] = (oldest["version"], _apply_delta(base, oldest))
+        history.append(entry)
+    
+    def get_state_at(self, engine_name: str, version: int) -> Optional[Dict[str, Any]]:
+        """엔진의 과거 상태 복원
+        
+        Args:
+            engine_name: 엔진 이름
+            version: 복원할 버전 (1부터 시작)
+        
+        Returns:
+            해당 버전의 상태 (보관 범위를 벗어나거나 "reference" 모드의 과거 버전이면 None)
+        """
+        current = self.versions.get(engine_name)
+        if current is None or version < 1 or version > current:
+            return None
+        if version == current:
+            return self.engine_states[engine_name].copy()
+        if self.record == "reference":
+            return None
+        
+        base_version, base = self._bases.get(engine_name, (0, {}))
+        if version < base_version:
+            return None
+        state = base
+        for entry in self.sync_history:
+            if entry["engine"] != engine_name:
+                continue
+            if entry["version"] > version:
+                break
+            state = _apply_delta(state, entry)
+        return state if state is not base else base.copy()
+    
+    def get_synchronized_state(self, since: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """동기화된 전체 상태 반환
         
+        Args:
+            since: 이전 호출에서 받은 "versions" (지정하면 그 이후 바뀐 엔진만 포함)
+        
         Returns:
             전체 상태 정보
         """
+        if since is None:
+            engines = self.engine_states.copy()
+        else:
+            engines = {
+                name: self.engine_states[name]
+                for name, version in self.versions.items()
+                if since.get(name) != version
+            }
         return {
-            "engines": self.engine_states.copy(),
+            "engines": engines,
+            "versions": self.versions.copy(),
             "sync_count": len(self.sync_history),
         }
     
     def reset(self):
         """상태 리셋"""
         self.engine_states.clear()
+        self.versions.clear()
         self.sync_history.clear()
+        self._bases.clear()
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """변경 여부 판단 (같은 객체이거나 스칼라 값이 같으면 변경 없음)"""
+    if old is new:
+        return True
+    if isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        return False
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
 
+def _apply_delta(state: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+    """상태에 변경분 적용 (새 딕셔너리 반환)"""
+    updated = {key: value for key, value in state.items() if key not in entry["removed"]}
+    updated.update(entry["delta"])
+    return updated
 
 import time
 
@@ -1,20 +1,42 @@
 """
-Physics Adapters - 물리 시뮬레이터 어댑터 인터페이스
+Physics Adapters - 물리 시뮬레이터 어댑터
 
-난류/대류 접근을 위한 Protocol 정의
+난류/대류 접근을 위한 Protocol 정의 및 기준 구현
 
-확장 가능성:
-- Protocol만 정의 (Mock 구현 제거)
-- 필요할 때 구현 가능
-- 인터페이스는 명확히 정의
+구현:
+- MemmapFieldAdapter: 대용량 CFD 스냅샷을 메모리 매핑으로 로드 (RAM에 전체 적재 안 함)
+- SyntheticTurbulenceAdapter: 발산 없는 합성 난류 장 생성 (외부 CFD 없는 벤치마크/회귀 테스트용)
+
+필드 파일 포맷 (.bcfd, little-endian):
+    magic        4 bytes   b"BCFD"
+    version      uint16    FIELD_FORMAT_VERSION
+    header_len   uint32    JSON 헤더 길이
+    header       JSON      {"alignment": int,
+                            "attributes": {...},
+                            "fields": {name: {"dtype": "<f4", "shape": [...],
+                                              "offset": int, "order": "C"}}}
+    padding      ...       각 필드 데이터 시작을 alignment 배수 위치로 맞춤
+    data         raw       필드별 원시 바이트 (offset은 파일 시작 기준)
+
+    데이터가 페이지 경계(기본 4096)에 정렬되어 있어 필드별 np.memmap이 그대로 가능.
+
+지원 파일:
+- .bcfd: 위 포맷 (write_field_file로 생성)
+- .npy: np.load(mmap_mode)
+- .npz: 비압축(ZIP_STORED) 멤버를 직접 오프셋 계산하여 메모리 매핑
+- 헤더 없는 raw 바이너리: load_raw(shape, dtype 지정)
 
 Author: GNJz (Qquarts)
-Version: 0.2.0
+Version: 0.3.0
 """
 
 from __future__ import annotations
 
-from typing import Dict, Any, Protocol, runtime_checkable
+from typing import Dict, Any, Optional, Sequence, Tuple, Protocol, runtime_checkable
+from pathlib import Path
+import json
+import struct
+import zipfile
 import numpy as np
 
 from .physics_pipeline import (
@@ -23,18 +45,449 @@ from .physics_pipeline import (
     FailureAtlasBuilder,
 )
 
-__version__ = "0.2.0"
-
-# Mock 구현 제거
-# Protocol만 유지하여 확장 가능성 보장
-# 필요할 때 실제 구현 추가 가능
-
-# 사용 예시:
-# class MyPhysicsAdapter(PhysicsAdapter):
-#     def generate_field(self, parameters: Dict[str, Any], time: float = 0.0) -> Dict[str, np.ndarray]:
-#         # 실제 구현
-#         pass
-#     
-#     def load_from_file(self, filepath: str) -> Dict[str, np.ndarray]:
-#         # 실제 구현
-#         pass
+__version__ = "0.3.0"
+
+FIELD_FORMAT_MAGIC = b"BCFD"
+FIELD_FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<4sHI")
+
+# ZIP 로컬 파일 헤더: signature ~ extra_len (30 bytes)
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_ZIP_LOCAL_MAGIC = b"PK\x03\x04"
+
+
+def write_field_file(
+    filepath: str,
+    fields: Dict[str, np.ndarray],
+    attributes: Optional[Dict[str, Any]] = None,
+    alignment: int = 4096,
+) -> Dict[str, Any]:
+    """필드 파일(.bcfd) 작성
+
+    필드는 한 번에 하나씩 기록하므로 memmap 배열을 넘기면 전체를 RAM에 올리지 않음.
+
+    Args:
+        filepath: 출력 경로
+        fields: {필드 이름: 배열}
+        attributes: 부가 정보 (JSON 직렬화 가능해야 함, 예: time, parameters)
+        alignment: 필드 데이터 시작 정렬 단위 (바이트)
+
+    Returns:
+        기록된 JSON 헤더
+    """
+    if alignment < 1:
+        raise ValueError("alignment는 1 이상이어야 합니다.")
+
+    arrays = {name: np.asarray(array) for name, array in fields.items()}
+
+    # 헤더 길이가 오프셋에 영향을 주므로 오프셋이 안정될 때까지 반복 (보통 2회)
+    offsets = {name: 0 for name in arrays}
+    while True:
+        header = {
+            "alignment": alignment,
+            "attributes": attributes or {},
+            "fields": {
+                name: {
+                    "dtype": array.dtype.newbyteorder("<").str,
+                    "shape": list(array.shape),
+                    "offset": offsets[name],
+                    "order": "C",
+                }
+                for name, array in arrays.items()
+            },
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+        position = _PREFIX.size + len(header_bytes)
+        new_offsets = {}
+        for name, array in arrays.items():
+            position = -(-position // alignment) * alignment
+            new_offsets[name] = position
+            position += array.nbytes
+        if new_offsets == offsets:
+            break
+        offsets = new_offsets
+
+    with open(filepath, "wb") as f:
+        f.write(_PREFIX.pack(FIELD_FORMAT_MAGIC, FIELD_FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b"\0" * (offsets[name] - f.tell()))
+            dtype = np.dtype(header["fields"][name]["dtype"])
+            # 첫 축 단위로 나누어 기록 (대형 memmap 입력도 메모리 사용 제한)
+            if array.ndim == 0:
+                f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+                continue
+            for index in range(array.shape[0]):
+                f.write(np.ascontiguousarray(array[index], dtype=dtype).tobytes())
+    return header
+
+
+def read_field_header(filepath: str) -> Dict[str, Any]:
+    """필드 파일(.bcfd) JSON 헤더 읽기
+
+    Args:
+        filepath: 파일 경로
+
+    Returns:
+        JSON 헤더
+    """
+    with open(filepath, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError("필드 파일이 너무 짧습니다.")
+        magic, version, header_len = _PREFIX.unpack(prefix)
+        if magic != FIELD_FORMAT_MAGIC:
+            raise ValueError(f"필드 파일 포맷이 아닙니다 (magic: {magic!r})")
+        if version > FIELD_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 필드 포맷 버전: {version}")
+        return json.loads(f.read(header_len).decode("utf-8"))
+
+
+class MemmapFieldAdapter:
+    """메모리 매핑 CFD 장 어댑터 (PhysicsAdapter 구현)
+
+    load_from_file()은 각 필드를 읽기 전용 np.memmap으로 반환.
+    배열을 슬라이스하면 해당 페이지만 디스크에서 읽히므로,
+    특징 추출기가 접근하는 영역만 메모리에 올라감.
+
+    generate_field()는 외부 시뮬레이터 결과를 재생(replay)하는 용도:
+    parameters["filepath"] 또는 path_template.format(time=..., **parameters)로 파일을 찾음.
+    """
+
+    def __init__(
+        self,
+        path_template: Optional[str] = None,
+        field_names: Optional[Sequence[str]] = None,
+        mode: str = "r",
+    ):
+        """MemmapFieldAdapter 초기화
+
+        Args:
+            path_template: 시간별 스냅샷 경로 템플릿 (예: "run/snap_{time:08.4f}.bcfd")
+            field_names: 로드할 필드 이름 (None이면 전체)
+            mode: np.memmap 모드 ("r" 읽기 전용, "c" copy-on-write)
+        """
+        if mode not in ("r", "c"):
+            raise ValueError(f"지원하지 않는 memmap 모드: {mode}")
+        self.path_template = path_template
+        self.field_names = tuple(field_names) if field_names else None
+        self.mode = mode
+
+    def generate_field(
+        self,
+        parameters: Dict[str, Any],
+        time: float = 0.0,
+    ) -> Dict[str, np.ndarray]:
+        """저장된 스냅샷을 장 데이터로 반환
+
+        Args:
+            parameters: {"filepath": 경로} 또는 path_template 치환 값
+            time: 시간 (path_template의 {time})
+
+        Returns:
+            장 데이터 (memmap 배열)
+        """
+        filepath = parameters.get("filepath")
+        if filepath is None:
+            if self.path_template is None:
+                raise ValueError("parameters['filepath'] 또는 path_template이 필요합니다.")
+            filepath = self.path_template.format(time=time, **parameters)
+        return self.load_from_file(str(filepath))
+
+    def load_from_file(self, filepath: str) -> Dict[str, np.ndarray]:
+        """CFD 결과 파일을 메모리 매핑으로 로드
+
+        Args:
+            filepath: .bcfd / .npy / .npz(비압축) 파일 경로
+
+        Returns:
+            장 데이터 {field_name: memmap 배열}
+        """
+        path = Path(filepath)
+        suffix = path.suffix.lower()
+        if suffix == ".npy":
+            fields = {path.stem: np.load(path, mmap_mode=self.mode)}
+        elif suffix == ".npz":
+            fields = self._load_npz(path)
+        else:
+            fields = self._load_bcfd(path)
+
+        if self.field_names is not None:
+            missing = set(self.field_names) - fields.keys()
+            if missing:
+                raise KeyError(f"파일 {path}에 필드가 없습니다: {sorted(missing)}")
+            fields = {name: fields[name] for name in self.field_names}
+        return fields
+
+    def load_raw(
+        self,
+        filepath: str,
+        shape: Sequence[int],
+        dtype: Any = np.float32,
+        offset: int = 0,
+        name: str = "velocity",
+        order: str = "C",
+    ) -> Dict[str, np.ndarray]:
+        """헤더 없는 raw 바이너리 파일 메모리 매핑
+
+        Args:
+            filepath: 파일 경로
+            shape: 배열 shape
+            dtype: 원소 dtype
+            offset: 데이터 시작 오프셋 (바이트)
+            name: 필드 이름
+            order: 메모리 순서 ("C" 또는 "F")
+
+        Returns:
+            {name: memmap 배열}
+        """
+        return {name: np.memmap(filepath, dtype=np.dtype(dtype), mode=self.mode,
+                                offset=offset, shape=tuple(shape), order=order)}
+
+    def get_header(self, filepath: str) -> Dict[str, Any]:
+        """.bcfd 파일 헤더 반환 (데이터는 매핑하지 않음)"""
+        return read_field_header(filepath)
+
+    # ------------------------------------------------------------------
+    # 내부: 포맷별 매핑
+    # ------------------------------------------------------------------
+
+    def _load_bcfd(self, path: Path) -> Dict[str, np.ndarray]:
+        header = read_field_header(str(path))
+        selected = self.field_names
+        fields = {}
+        for name, spec in header["fields"].items():
+            if selected is not None and name not in selected:
+                continue
+            fields[name] = np.memmap(
+                path, dtype=np.dtype(spec["dtype"]), mode=self.mode,
+                offset=spec["offset"], shape=tuple(spec["shape"]), order=spec.get("order", "C"),
+            )
+        return fields
+
+    def _load_npz(self, path: Path) -> Dict[str, np.ndarray]:
+        """비압축 .npz 멤버를 오프셋 계산으로 직접 매핑"""
+        fields = {}
+        with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+            for info in archive.infolist():
+                name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+                if self.field_names is not None and name not in self.field_names:
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(
+                        f"압축된 npz 멤버는 메모리 매핑할 수 없습니다: {info.filename} "
+                        "(np.savez로 저장하거나 np.load 사용)"
+                    )
+
+                # 로컬 헤더의 파일명/extra 길이는 중앙 디렉토리와 다를 수 있어 직접 읽음
+                f.seek(info.header_offset)
+                local = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+                if local[0] != _ZIP_LOCAL_MAGIC:
+                    raise ValueError(f"손상된 npz 멤버: {info.filename}")
+                name_len, extra_len = local[-2], local[-1]
+                f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + name_len + extra_len)
+
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                elif version == (2, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                else:
+                    raise ValueError(f"지원하지 않는 npy 헤더 버전 {version}: {info.filename}")
+                fields[name] = np.memmap(
+                    path, dtype=dtype, mode=self.mode, offset=f.tell(), shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+        return fields
+
+
+class SyntheticTurbulenceAdapter:
+    """합성 난류 장 생성기 (PhysicsAdapter 기준 구현, 벤치마크/회귀 테스트용)
+
+    외부 CFD 없이 주기 도메인에서 발산 없는(∇·u = 0) 랜덤 속도 장을 FFT로 합성.
+
+    합성 절차 (스펙트럼 공간, 완전 벡터화):
+        n̂_i  = rfftn(가우시안 잡음_i)                  (실수 장의 FFT → 에르미트 대칭 자동 보장)
+        û    = A(|k|) (n̂ - k (k·n̂) / |k|²)          (비압축 투영)
+        u    = irfftn(û), 이후 ½<|u|²> = energy가 되도록 배율 조정
+        A(k) = sqrt(E(k) / k^(d-1))                   (셸 모드 수 보정)
+        E(k) = (k/k_p)^4 / (1 + (k/k_p)²)^(17/6) · exp(-(k/k_d)²)
+               (von Kármán 스펙트럼: k ≫ k_p에서 k^(-5/3), k_d 이상 소산 감쇠)
+
+    재현성:
+        같은 (seed, time, parameters)이면 같은 장 (시간마다 독립 실현)
+
+    메모리 (3D, float32, N³ 격자): 출력 12·N³ 바이트 + 스펙트럼 작업 공간 약 16·N³ 바이트
+        (512³: 출력 약 1.6 GB + 작업 공간 약 2.2 GB)
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int] = (64, 64, 64),
+        domain_length: float = 2.0 * np.pi,
+        energy: float = 1.0,
+        k_peak: float = 2.0,
+        k_dissipation: Optional[float] = None,
+        seed: int = 0,
+        dtype: Any = np.float32,
+    ):
+        """SyntheticTurbulenceAdapter 초기화
+
+        Args:
+            shape: 격자 shape (2D 또는 3D)
+            domain_length: 주기 도메인 길이 (모든 축 공통)
+            energy: 운동 에너지 ½<|u|²>
+            k_peak: 에너지 스펙트럼 최대 파수 (에너지 보유 스케일)
+            k_dissipation: 소산 감쇠 파수 (None이면 감쇠 없음, 구형 절단만)
+            seed: 난수 시드
+            dtype: 출력 dtype (float32 또는 float64)
+
+        generate_field의 parameters로 energy, k_peak, k_dissipation, seed를 호출별로 바꿀 수 있음.
+        """
+        self.shape = tuple(int(n) for n in shape)
+        if len(self.shape) not in (2, 3):
+            raise ValueError(f"2D/3D 격자만 지원합니다: shape {self.shape}")
+        self.domain_length = float(domain_length)
+        self.energy = energy
+        self.k_peak = k_peak
+        self.k_dissipation = k_dissipation
+        self.seed = seed
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"float32/float64만 지원합니다: {self.dtype}")
+
+        # 스펙트럼 작업 배열 캐시 (마지막 (k_peak, k_dissipation) 하나만 유지)
+        self._filter_key = None
+        self._filter: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def generate_field(
+        self,
+        parameters: Dict[str, Any],
+        time: float = 0.0,
+    ) -> Dict[str, np.ndarray]:
+        """합성 난류 속도 장 생성
+
+        Args:
+            parameters: {"energy", "k_peak", "k_dissipation", "seed"} (모두 선택)
+            time: 시간 (난수 스트림 선택에 사용)
+
+        Returns:
+            {"velocity": (d, *shape) 배열}
+        """
+        energy = float(parameters.get("energy", self.energy))
+        k_peak = float(parameters.get("k_peak", self.k_peak))
+        k_dissipation = parameters.get("k_dissipation", self.k_dissipation)
+        seed = int(parameters.get("seed", self.seed))
+
+        dims = len(self.shape)
+        axes = tuple(range(dims))
+        axis_k = self._axis_k()
+        amplitude, inv_k2 = self._spectral_filter(k_peak, k_dissipation)
+
+        # (seed, time)별 독립 난수 스트림
+        time_bits = int(np.array(float(time), dtype=np.float64).view(np.uint64))
+        rng = np.random.default_rng(np.random.SeedSequence([seed, time_bits]))
+
+        noise_hat = [
+            np.fft.rfftn(rng.standard_normal(self.shape, dtype=self.dtype), axes=axes)
+            for _ in range(dims)
+        ]
+        # k·n̂ / |k|²
+        projection = axis_k[0] * noise_hat[0]
+        for k, n_hat in zip(axis_k[1:], noise_hat[1:]):
+            projection += k * n_hat
+        projection *= inv_k2
+
+        velocity = np.empty((dims,) + self.shape, dtype=self.dtype)
+        for i in range(dims):
+            u_hat = noise_hat[i]
+            u_hat -= axis_k[i] * projection
+            u_hat *= amplitude
+            velocity[i] = np.fft.irfftn(u_hat, s=self.shape, axes=axes)
+            noise_hat[i] = None  # 성분별 작업 공간 즉시 해제
+
+        # float64 누적 (float32 대형 격자의 합산 오차 방지)
+        subscripts = "xyz"[:dims]
+        current = 0.5 * float(np.einsum(
+            f"c{subscripts},c{subscripts}->", velocity, velocity, dtype=np.float64,
+        )) / np.prod(self.shape)
+        if current > 0:
+            velocity *= self.dtype.type(np.sqrt(energy / current))
+        return {"velocity": velocity}
+
+    def load_from_file(self, filepath: str) -> Dict[str, np.ndarray]:
+        """저장된 스냅샷 로드 (MemmapFieldAdapter에 위임)
+
+        Args:
+            filepath: .bcfd / .npy / .npz 파일 경로
+
+        Returns:
+            장 데이터 (memmap 배열)
+        """
+        return MemmapFieldAdapter().load_from_file(filepath)
+
+    @staticmethod
+    def target_spectrum(k: Any, k_peak: float, k_dissipation: Optional[float] = None) -> np.ndarray:
+        """목표 에너지 스펙트럼 형태 E(k) (정규화 전)
+
+        Args:
+            k: 파수
+            k_peak: 에너지 스펙트럼 최대 파수
+            k_dissipation: 소산 감쇠 파수 (None이면 감쇠 없음)
+
+        Returns:
+            E(k)
+        """
+        ratio = np.asarray(k) / k_peak
+        spectrum = ratio ** 4 / (1.0 + ratio ** 2) ** (17.0 / 6.0)
+        if k_dissipation is not None:
+            spectrum = spectrum * np.exp(-(np.asarray(k) / k_dissipation) ** 2)
+        return spectrum
+
+    # ------------------------------------------------------------------
+    # 내부: 스펙트럼 격자
+    # ------------------------------------------------------------------
+
+    def _axis_k(self) -> Tuple[np.ndarray, ...]:
+        """축별 파수 (rfftn 출력 shape에 브로드캐스트, 전체 격자 배열 아님)"""
+        scale = 2.0 * np.pi / self.domain_length
+        dims = len(self.shape)
+        axis_k = []
+        for axis, n in enumerate(self.shape):
+            k = np.fft.rfftfreq(n, d=1.0 / n) if axis == dims - 1 else np.fft.fftfreq(n, d=1.0 / n)
+            view = [1] * dims
+            view[axis] = k.size
+            axis_k.append((k * scale).astype(self.dtype).reshape(view))
+        return tuple(axis_k)
+
+    def _spectral_filter(
+        self,
+        k_peak: float,
+        k_dissipation: Optional[float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(진폭 A(|k|), 1/|k|²) 스펙트럼 배열 (캐시)
+
+        k = 0 모드와 구형 절단 |k| > k_max(가장 짧은 축의 Nyquist) 모드는 0.
+        """
+        key = (k_peak, k_dissipation)
+        if self._filter_key == key:
+            return self._filter
+
+        self._filter = None  # 새 배열 할당 전 이전 캐시 해제
+        axis_k = self._axis_k()
+        k2 = axis_k[0] ** 2
+        for k in axis_k[1:]:
+            k2 = k2 + k ** 2
+
+        k_max = (2.0 * np.pi / self.domain_length) * (min(self.shape) // 2)
+        valid = (k2 > 0) & (k2 <= k_max ** 2)
+        inv_k2 = np.zeros_like(k2)
+        np.divide(1.0, k2, out=inv_k2, where=valid)
+
+        magnitude = np.sqrt(k2, out=k2)
+        spectrum = self.target_spectrum(magnitude[valid], k_peak, k_dissipation)
+        amplitude = np.zeros_like(magnitude)
+        amplitude[valid] = np.sqrt(spectrum / magnitude[valid] ** (len(self.shape) - 1))
+
+        self._filter_key, self._filter = key, (amplitude, inv_k2)
+        return self._filter
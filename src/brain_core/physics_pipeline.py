@@ -13,16 +13,41 @@ Physics Pipeline - 물리 입력 파이프라인 인터페이스
 - 외부 물리 시뮬레이터의 결과를 받아서 처리
 - 특징 추출 → 위험 지형 매핑
 
+타일 스트리밍 (process_tiled):
+- 장을 공간 타일 단위로 순회 (미분 스텐실용 halo 포함, 주기 경계)
+- 타일별 부분 통계 → 전역 특징으로 축약, 타일별 위험도 → 공간 위험 지도
+- 최대 메모리는 도메인 크기가 아니라 타일 크기에 비례
+  (memmap 장과 함께 쓰면 RAM보다 큰 도메인 처리 가능)
+
+시계열 병렬 처리 (process_series):
+- 시간 스텝을 프로세스 풀로 분산 (워커마다 어댑터/추출기를 한 번만 전달받아 재사용)
+- 결과를 시간 인덱스 배열로 조립 (스펙트럼(t, k), 소산률(t), 리스크 지표(t) 등)
+
+단계 파이프라인 (process_stream):
+- 장 로딩(스레드) → 특징 추출(스레드 또는 프로세스 풀) → FailureAtlas(스레드)
+- 단계 사이 큐 크기 제한 (backpressure): 현재 스냅샷 분석 중에 다음 스냅샷 로딩
+
+특징 캐시 (feature_cache):
+- (parameters, time) 적중 시 장 생성/특징 추출 생략 (feature_cache.FeatureCache)
+
+증분 FailureAtlas:
+- atlas_builder가 update()를 가지면 매번 재구성하지 않고 증분 갱신 (failure_atlas.IncrementalRiskMap)
+  결과에는 변경 내역(risk_update)만 담고, 전체 지형은 atlas_builder.snapshot()으로 조회
+
 Author: GNJz (Qquarts)
-Version: 0.2.0
+Version: 0.3.0
 """
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Protocol, runtime_checkable
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple, runtime_checkable
+from concurrent.futures import Future, ProcessPoolExecutor
+import itertools
 import numpy as np
 
-__version__ = "0.2.0"
+from .streaming import run_stages
+
+__version__ = "0.3.0"
 
 
 @runtime_checkable
@@ -155,6 +180,203 @@ class FailureAtlasBuilder(Protocol):
         ...
 
 
+def iter_tiles(
+    grid_shape: Sequence[int],
+    tile_shape: Sequence[int],
+) -> Iterator[Tuple[Tuple[int, ...], Tuple[slice, ...]]]:
+    """공간 타일 순회
+
+    Args:
+        grid_shape: 격자 shape
+        tile_shape: 타일 shape (격자보다 크면 격자 크기로 잘림)
+
+    Yields:
+        (타일 인덱스, 격자 내 타일 영역 slice)
+    """
+    if len(tile_shape) != len(grid_shape):
+        raise ValueError(f"tile_shape 차원({len(tile_shape)})이 격자 차원({len(grid_shape)})과 다릅니다.")
+    starts = [range(0, n, max(1, int(t))) for n, t in zip(grid_shape, tile_shape)]
+    for index, origin in zip(itertools.product(*(range(len(r)) for r in starts)), itertools.product(*starts)):
+        yield index, tuple(
+            slice(o, min(o + int(t), n)) for o, t, n in zip(origin, tile_shape, grid_shape)
+        )
+
+
+def read_tile(
+    array: np.ndarray,
+    region: Tuple[slice, ...],
+    halo: int,
+    leading_axes: int = 0,
+) -> np.ndarray:
+    """halo를 포함한 타일 읽기 (주기 경계로 감쌈)
+
+    필요한 원소만 인덱싱하므로 memmap 배열은 해당 페이지만 읽힘.
+
+    Args:
+        array: 장 배열 (앞쪽 leading_axes개 축은 성분 축 등 비공간 축)
+        region: 공간 축 타일 영역
+        halo: 각 방향 halo 폭
+        leading_axes: 비공간 선행 축 수
+
+    Returns:
+        (선행 축..., 타일 + 2*halo ...) 배열 (복사본)
+    """
+    spatial = array.shape[leading_axes:]
+    if halo == 0:
+        return np.array(array[(slice(None),) * leading_axes + region])
+    indices = [
+        np.arange(r.start - halo, r.stop + halo) % n
+        for r, n in zip(region, spatial)
+    ]
+    return np.asarray(array[(slice(None),) * leading_axes + np.ix_(*indices)])
+
+
+def tile_statistics(
+    tile_fields: Dict[str, np.ndarray],
+    halo: int,
+    spacing: Sequence[float],
+) -> Dict[str, float]:
+    """타일 부분 통계 (유한 차분, 축약 가능한 합계 형태)
+
+    Args:
+        tile_fields: halo 포함 타일 {"velocity": (d, ...)}
+        halo: halo 폭 (1 이상이면 중앙 차분이 타일 경계에서도 정확)
+        spacing: 축별 격자 간격
+
+    Returns:
+        {"count", "dims", "sum_u2", "sum_w", "sum_w2", "sum_w4", "max_w"}
+    """
+    velocity = tile_fields["velocity"]
+    dims = velocity.shape[0]
+    interior = tuple(slice(halo, n - halo) for n in velocity.shape[1:])
+
+    def d(component: int, axis: int) -> np.ndarray:
+        return np.gradient(velocity[component], spacing[axis], axis=axis)[interior]
+
+    if dims == 2:
+        w2 = (d(1, 0) - d(0, 1)) ** 2
+    else:
+        w2 = (d(2, 1) - d(1, 2)) ** 2 + (d(0, 2) - d(2, 0)) ** 2 + (d(1, 0) - d(0, 1)) ** 2
+    u2 = np.sum(velocity[(slice(None),) + interior] ** 2, axis=0)
+    w = np.sqrt(w2)
+    return {
+        "count": int(u2.size),
+        "dims": dims,
+        "sum_u2": float(u2.sum()),
+        "sum_w": float(w.sum()),
+        "sum_w2": float(w2.sum()),
+        "sum_w4": float((w2 ** 2).sum()),
+        "max_w": float(w.max()) if w.size else 0.0,
+    }
+
+
+def reduce_tile_statistics(
+    partials: List[Dict[str, float]],
+    viscosity: float,
+) -> Dict[str, Any]:
+    """타일 부분 통계를 전역 특징으로 축약
+
+    Args:
+        partials: tile_statistics() 결과 리스트
+        viscosity: 동점성 계수 ν (ε = ν<|ω|²>)
+
+    Returns:
+        특징 딕셔너리 (kinetic_energy, dissipation_rate, vorticity_stats, tile_count)
+    """
+    count = sum(p["count"] for p in partials)
+    if count == 0:
+        return {"kinetic_energy": 0.0, "dissipation_rate": 0.0, "vorticity_stats": {}, "tile_count": len(partials)}
+    mean_w2 = sum(p["sum_w2"] for p in partials) / count
+    mean_w4 = sum(p["sum_w4"] for p in partials) / count
+    return {
+        "kinetic_energy": 0.5 * sum(p["sum_u2"] for p in partials) / count,
+        "dissipation_rate": viscosity * mean_w2,
+        "vorticity_stats": {
+            "mean": sum(p["sum_w"] for p in partials) / count,
+            "rms": float(np.sqrt(mean_w2)),
+            "max": max(p["max_w"] for p in partials),
+            "flatness": mean_w4 / mean_w2 ** 2 if mean_w2 > 0 else float("nan"),
+            "enstrophy": 0.5 * mean_w2,
+        },
+        "tile_count": len(partials),
+    }
+
+
+# 워커 프로세스별 파이프라인 (process_series 초기화 함수가 설정)
+_series_pipeline: Optional["PhysicsPipeline"] = None
+
+
+def _init_series_worker(pipeline: "PhysicsPipeline"):
+    """시계열 워커 초기화 (프로세스당 1회: 어댑터/추출기와 FFT 격자 캐시 재사용)"""
+    global _series_pipeline
+    _series_pipeline = pipeline
+
+
+def _run_series_step(step: Tuple[Dict[str, Any], float]) -> Dict[str, Any]:
+    parameters, time = step
+    return _series_pipeline._analyze(parameters, time)
+
+
+def _run_extract_step(field_data: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    extractor = _series_pipeline.feature_extractor
+    features = extractor.extract_features(field_data)
+    return {"features": features, "risk_indicators": extractor.compute_risk_indicators(features)}
+
+
+def stack_series(steps: Sequence[Dict[str, Any]], times: Sequence[float]) -> Dict[str, Any]:
+    """스텝별 특징을 시간 인덱스 배열로 조립
+
+    스칼라 특징은 (T,) 배열, 한 단계 중첩된 스칼라는 "그룹.키" 이름의 (T,) 배열,
+    에너지 스펙트럼은 (T, K) 배열(셸 수가 다르면 NaN 채움)로 변환.
+
+    Args:
+        steps: {"features", "risk_indicators"} 리스트 (시간 순)
+        times: 시간 값
+
+    Returns:
+        {"times", "features": {이름: 배열}, "risk_indicators": {이름: 배열},
+         "wavenumbers", "energy_spectrum", "onset_index"}
+    """
+    count = len(steps)
+
+    def collect(dicts: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        columns: Dict[str, np.ndarray] = {}
+        for index, values in enumerate(dicts):
+            for name, value in _flatten_scalars(values):
+                if name not in columns:
+                    dtype = bool if isinstance(value, (bool, np.bool_)) else float
+                    columns[name] = np.zeros(count, dtype=bool) if dtype is bool else np.full(count, np.nan)
+                columns[name][index] = value
+        return columns
+
+    result: Dict[str, Any] = {
+        "times": np.asarray(times, dtype=float),
+        "features": collect([step.get("features") or {} for step in steps]),
+        "risk_indicators": collect([step.get("risk_indicators") or {} for step in steps]),
+    }
+
+    spectra = [(step.get("features") or {}).get("energy_spectrum") for step in steps]
+    if spectra and all(spectrum is not None for spectrum in spectra):
+        widest = max(spectra, key=lambda spectrum: len(spectrum["energy"]))
+        energy = np.full((count, len(widest["energy"])), np.nan)
+        for index, spectrum in enumerate(spectra):
+            energy[index, :len(spectrum["energy"])] = spectrum["energy"]
+        result["wavenumbers"] = np.asarray(widest["wavenumbers"])
+        result["energy_spectrum"] = energy
+
+    turbulent = result["features"].get("transition_detection.turbulent")
+    result["onset_index"] = int(np.argmax(turbulent)) if turbulent is not None and turbulent.any() else None
+    return result
+
+
+def _flatten_scalars(values: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    for name, value in values.items():
+        if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating)):
+            yield prefix + name, value
+        elif isinstance(value, dict) and not prefix:
+            yield from _flatten_scalars(value, f"{name}.")
+
+
 class PhysicsPipeline:
     """물리 입력 파이프라인
     
@@ -170,6 +392,7 @@ class PhysicsPipeline:
         physics_adapter: Optional[PhysicsAdapter] = None,
         feature_extractor: Optional[TurbulenceFeatureExtractor] = None,
         atlas_builder: Optional[FailureAtlasBuilder] = None,
+        feature_cache: Optional[Any] = None,
     ):
         """PhysicsPipeline 초기화
         
@@ -177,6 +400,8 @@ class PhysicsPipeline:
             physics_adapter: 물리 시뮬레이터 어댑터 (Protocol 구현체)
             feature_extractor: 특징 추출기 (Protocol 구현체)
             atlas_builder: FailureAtlas 빌더 (Protocol 구현체)
+            feature_cache: 특징 캐시 (feature_cache.FeatureCache, None이면 캐시 안 함)
+                process()/process_series()에서 (parameters, time) 적중 시 장 생성과 특징 추출 생략
         
         Note:
             현재는 Protocol만 정의되어 있음
@@ -185,6 +410,7 @@ class PhysicsPipeline:
         self.physics_adapter = physics_adapter
         self.feature_extractor = feature_extractor
         self.atlas_builder = atlas_builder
+        self.feature_cache = feature_cache
     
     def process(
         self,
@@ -201,14 +427,27 @@ class PhysicsPipeline:
             처리 결과:
             - field_data: 물리 장 데이터 (physics_adapter가 있을 때)
             - features: 추출된 특징 (feature_extractor가 있을 때)
-            - risk_map: 위험 지형 (atlas_builder가 있을 때)
-            - failure_atlas: FailureAtlas (atlas_builder가 있을 때)
+            - risk_map: 위험 지형 (atlas_builder가 있고 update()가 없을 때)
+            - failure_atlas: FailureAtlas (atlas_builder가 있고 update()가 없을 때)
+            - risk_update: 증분 갱신 내역 (atlas_builder가 update()를 가질 때, 전체 지형은
+              atlas_builder.snapshot()으로 조회)
+            - cache_hit: 캐시 적중 여부 (feature_cache가 있을 때, 적중 시 field_data 없음)
         
         Note:
             각 컴포넌트가 None이면 해당 단계는 스킵
         """
         result = {}
         
+        # 0. 특징 캐시 (적중 시 장 생성/특징 추출 생략)
+        cache_key = None
+        if self.feature_cache is not None and self.physics_adapter and self.feature_extractor:
+            cache_key = self.feature_cache.key(parameters, time)
+            cached = self.feature_cache.get(cache_key)
+            result["cache_hit"] = cached is not None
+            if cached is not None:
+                result.update(cached)
+                return self._build_atlas(result, parameters, time)
+        
         # 1. 물리 장 생성
         if self.physics_adapter:
             field_data = self.physics_adapter.generate_field(parameters, time)
@@ -224,12 +463,29 @@ class PhysicsPipeline:
             # 리스크 지표 계산
             risk_indicators = self.feature_extractor.compute_risk_indicators(features)
             result["risk_indicators"] = risk_indicators
-        else:
-            features = {}
-            risk_indicators = {}
+            
+            if cache_key is not None:
+                self.feature_cache.put(cache_key, {"features": features, "risk_indicators": risk_indicators})
         
         # 3. FailureAtlas 생성
-        if self.atlas_builder and features and risk_indicators:
+        return self._build_atlas(result, parameters, time)
+    
+    def _build_atlas(
+        self,
+        result: Dict[str, Any],
+        parameters: Dict[str, Any],
+        time: float,
+    ) -> Dict[str, Any]:
+        """FailureAtlas 단계 (features/risk_indicators가 있고 atlas_builder가 있을 때)
+        
+        atlas_builder가 update()를 가지면(예: failure_atlas.IncrementalRiskMap)
+        재구성 대신 증분 갱신하고 변경 내역만 risk_update로 반환 (비용 O(지표 수))
+        """
+        features = result.get("features")
+        risk_indicators = result.get("risk_indicators")
+        if self.atlas_builder and risk_indicators and hasattr(self.atlas_builder, "update"):
+            result["risk_update"] = self.atlas_builder.update(risk_indicators, parameters, time)
+        elif self.atlas_builder and features and risk_indicators:
             risk_map = self.atlas_builder.build_risk_map(features, risk_indicators)
             result["risk_map"] = risk_map
             
@@ -237,3 +493,253 @@ class PhysicsPipeline:
             result["failure_atlas"] = failure_atlas
         
         return result
+    
+    def process_series(
+        self,
+        parameters: Dict[str, Any],
+        times: Sequence[float],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> Dict[str, Any]:
+        """시계열 병렬 실행
+        
+        각 시간 스텝에 대해 장 생성 → 특징 추출 → 리스크 지표를 계산하고
+        결과를 시간 인덱스 배열로 조립 (전이 시작 검출용).
+        
+        workers > 1이면 프로세스 풀 사용: 파이프라인(어댑터/추출기)은 워커 초기화 때
+        프로세스당 한 번만 전달되어 FFT 격자 캐시 등이 스텝 사이에 재사용됨.
+        워커 결과에는 field_data를 포함하지 않음 (대용량 배열의 프로세스 간 복사 방지).
+        
+        Args:
+            parameters: 시뮬레이션 파라미터 (모든 스텝 공통)
+            times: 시간 값 시퀀스
+            workers: 워커 프로세스 수 (None 또는 1이면 현재 프로세스에서 순차 실행)
+                feature_cache가 있으면 캐시 미스 스텝만 계산
+            chunksize: 워커에 한 번에 전달할 스텝 수
+        
+        Returns:
+            stack_series() 결과:
+            - times: (T,)
+            - features: {"kinetic_energy": (T,), "transition_detection.re_lambda": (T,), ...}
+            - risk_indicators: {이름: (T,)}
+            - wavenumbers, energy_spectrum: (K,), (T, K) (추출기가 스펙트럼을 낼 때)
+            - onset_index: 처음 난류로 판정된 스텝 인덱스 (없으면 None)
+        
+        Note:
+            workers > 1이면 어댑터/추출기와 parameters가 pickle 가능해야 함.
+            FailureAtlas 단계는 실행하지 않음 (시계열 배열에서 호출자가 구성).
+        """
+        if self.physics_adapter is None or self.feature_extractor is None:
+            raise ValueError("시계열 모드에는 physics_adapter와 feature_extractor가 필요합니다.")
+        
+        times = [float(t) for t in times]
+        steps: List[Optional[Dict[str, Any]]] = [None] * len(times)
+        keys: List[Optional[str]] = [None] * len(times)
+        if self.feature_cache is not None:
+            for index, t in enumerate(times):
+                keys[index] = self.feature_cache.key(parameters, t)
+                steps[index] = self.feature_cache.get(keys[index])
+        missing = [index for index, step in enumerate(steps) if step is None]
+        
+        if workers is None or workers <= 1 or len(missing) <= 1:
+            computed = [self._analyze(parameters, times[index]) for index in missing]
+        else:
+            worker_pipeline = PhysicsPipeline(self.physics_adapter, self.feature_extractor)
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(missing)),
+                initializer=_init_series_worker,
+                initargs=(worker_pipeline,),
+            ) as executor:
+                computed = list(executor.map(
+                    _run_series_step, [(parameters, times[index]) for index in missing],
+                    chunksize=max(1, chunksize),
+                ))
+        
+        for index, step in zip(missing, computed):
+            steps[index] = step
+            if keys[index] is not None:
+                self.feature_cache.put(keys[index], step)
+        
+        return stack_series(steps, times)
+    
+    def process_stream(
+        self,
+        parameters: Dict[str, Any],
+        times: Iterable[float],
+        queue_size: int = 2,
+        extract_workers: Optional[int] = None,
+        materialize: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """단계 파이프라인 실행 (스냅샷 재생용)
+        
+        단계:
+            1. load (스레드): 캐시 조회 → generate_field (materialize면 RAM으로 읽기)
+            2. extract: 특징/리스크 지표 계산
+               - extract_workers가 None이면 스레드에서 실행
+               - 아니면 프로세스 풀에 제출하고 Future만 다음 단계로 전달 (여러 스냅샷 동시 분석)
+            3. atlas (스레드): Future 결과 수신 → 캐시 저장 → FailureAtlas 단계
+        
+        단계 사이 큐는 queue_size로 제한되므로 메모리에 동시에 올라가는 장은
+        약 (단계 수 + 1) * queue_size개로 제한됨.
+        
+        Args:
+            parameters: 시뮬레이션 파라미터 (모든 스텝 공통)
+            times: 시간 이터레이터 (필요할 때만 소비됨)
+            queue_size: 단계 사이 큐 크기
+            extract_workers: 특징 추출 프로세스 수 (None이면 스레드)
+            materialize: 로딩 단계에서 장을 메모리로 읽을지 여부
+                (memmap 장의 디스크 읽기를 로딩 스레드에서 수행하여 분석과 겹치게 함)
+        
+        Yields:
+            시간 순서대로 process()와 같은 결과 (field_data 제외) + time
+        
+        Note:
+            extract_workers를 쓰면 특징 추출기가 pickle 가능해야 하고, 장 데이터는 워커로 복사됨.
+            atlas_builder는 현재 프로세스에서 순서대로 호출됨 (증분 빌더 상태 유지).
+        """
+        if self.physics_adapter is None or self.feature_extractor is None:
+            raise ValueError("스트림 모드에는 physics_adapter와 feature_extractor가 필요합니다.")
+        
+        executor = None
+        if extract_workers is not None and extract_workers >= 1:
+            executor = ProcessPoolExecutor(
+                max_workers=extract_workers,
+                initializer=_init_series_worker,
+                initargs=(PhysicsPipeline(feature_extractor=self.feature_extractor),),
+            )
+        
+        def load(time: float) -> Dict[str, Any]:
+            item: Dict[str, Any] = {"time": float(time), "key": None, "cached": None, "field_data": None}
+            if self.feature_cache is not None:
+                item["key"] = self.feature_cache.key(parameters, item["time"])
+                item["cached"] = self.feature_cache.get(item["key"])
+            if item["cached"] is None:
+                field_data = self.physics_adapter.generate_field(parameters, item["time"])
+                if materialize:
+                    field_data = {name: np.array(field) for name, field in field_data.items()}
+                item["field_data"] = field_data
+            return item
+        
+        def extract(item: Dict[str, Any]) -> Dict[str, Any]:
+            field_data = item.pop("field_data")
+            if item["cached"] is not None:
+                item["analysis"] = item["cached"]
+            elif executor is not None:
+                item["analysis"] = executor.submit(_run_extract_step, field_data)
+            else:
+                features = self.feature_extractor.extract_features(field_data)
+                item["analysis"] = {
+                    "features": features,
+                    "risk_indicators": self.feature_extractor.compute_risk_indicators(features),
+                }
+            return item
+        
+        def atlas(item: Dict[str, Any]) -> Dict[str, Any]:
+            analysis = item["analysis"]
+            if isinstance(analysis, Future):
+                analysis = analysis.result()
+            result: Dict[str, Any] = {"time": item["time"]}
+            if self.feature_cache is not None:
+                result["cache_hit"] = item["cached"] is not None
+                if item["cached"] is None:
+                    self.feature_cache.put(item["key"], analysis)
+            result.update(analysis)
+            return self._build_atlas(result, parameters, item["time"])
+        
+        try:
+            yield from run_stages(times, [load, extract, atlas], queue_size=queue_size, name="PhysicsPipeline")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _analyze(self, parameters: Dict[str, Any], time: float) -> Dict[str, Any]:
+        """한 시간 스텝의 특징/리스크 지표 (field_data 제외)"""
+        field_data = self.physics_adapter.generate_field(parameters, time)
+        features = self.feature_extractor.extract_features(field_data)
+        return {
+            "features": features,
+            "risk_indicators": self.feature_extractor.compute_risk_indicators(features),
+        }
+    
+    def process_tiled(
+        self,
+        parameters: Dict[str, Any],
+        time: float = 0.0,
+        tile_shape: Optional[Sequence[int]] = None,
+        halo: int = 1,
+        field_name: str = "velocity",
+    ) -> Dict[str, Any]:
+        """타일 스트리밍 모드 실행
+        
+        장을 공간 타일로 나누어 순회하며 타일별 부분 통계를 계산한 뒤 전역 특징으로 축약.
+        한 번에 메모리에 올라가는 것은 타일 하나(+halo)뿐이므로,
+        어댑터가 memmap 장을 반환하면 RAM보다 큰 도메인도 처리 가능.
+        
+        특징 추출기가 다음 메서드를 가지면 사용하고, 없으면 유한 차분 기본 구현 사용:
+        - extract_tile_features(tile_fields, halo, spacing) -> 부분 통계
+        - reduce_tile_features(partials) -> 특징 딕셔너리
+        
+        Args:
+            parameters: 시뮬레이션 파라미터
+            time: 시간
+            tile_shape: 공간 타일 shape (None이면 축마다 64)
+            halo: 미분 스텐실용 halo 폭 (주기 경계로 감쌈)
+            field_name: 타일링할 벡터 장 이름 (성분 우선 배열)
+        
+        Returns:
+            process()와 같은 키 (field_data 제외) + tile_risk:
+            - features: 전역 특징 (tile_count 포함)
+            - risk_indicators: 전역 리스크 지표
+            - tile_risk: 타일별 최대 리스크 지표 배열 (타일 격자 shape)
+            - risk_map / failure_atlas (또는 증분 빌더면 risk_update): atlas_builder가 있을 때
+        
+        Note:
+            스펙트럼 특징(energy_spectrum 등)은 전역 FFT가 필요하므로 타일 모드에서는 계산하지 않음
+        """
+        if self.physics_adapter is None or self.feature_extractor is None:
+            raise ValueError("타일 모드에는 physics_adapter와 feature_extractor가 필요합니다.")
+        
+        field_data = self.physics_adapter.generate_field(parameters, time)
+        field = field_data[field_name]
+        grid_shape = field.shape[1:]
+        tile_shape = tuple(tile_shape) if tile_shape is not None else (64,) * len(grid_shape)
+        spacing = self._grid_spacing(grid_shape)
+        
+        extractor = self.feature_extractor
+        tile_features = getattr(extractor, "extract_tile_features", None)
+        reduce_features = getattr(extractor, "reduce_tile_features", None)
+        if tile_features is None:
+            def tile_features(tile_fields, tile_halo, tile_spacing):
+                return tile_statistics(tile_fields, tile_halo, tile_spacing)
+        if reduce_features is None:
+            viscosity = float(getattr(extractor, "viscosity", parameters.get("viscosity", 1e-3)))
+            
+            def reduce_features(partials):
+                return reduce_tile_statistics(partials, viscosity)
+        
+        tile_counts = tuple(-(-n // int(t)) for n, t in zip(grid_shape, tile_shape))
+        tile_risk = np.zeros(tile_counts)
+        partials = []
+        for index, region in iter_tiles(grid_shape, tile_shape):
+            tile = {field_name: read_tile(field, region, halo, leading_axes=1)}
+            partial = tile_features(tile, halo, spacing)
+            partials.append(partial)
+            local = extractor.compute_risk_indicators(reduce_features([partial]))
+            tile_risk[index] = max(local.values()) if local else 0.0
+        
+        features = reduce_features(partials)
+        risk_indicators = extractor.compute_risk_indicators(features)
+        result = {
+            "features": features,
+            "risk_indicators": risk_indicators,
+            "tile_risk": tile_risk,
+        }
+        
+        return self._build_atlas(result, parameters, time)
+    
+    def _grid_spacing(self, grid_shape: Sequence[int]) -> Tuple[float, ...]:
+        """축별 격자 간격 (특징 추출기의 domain_length, 없으면 2π)"""
+        lengths = getattr(self.feature_extractor, "domain_length", 2.0 * np.pi)
+        if np.isscalar(lengths):
+            lengths = (lengths,) * len(grid_shape)
+        return tuple(float(length) / n for length, n in zip(lengths, grid_shape))
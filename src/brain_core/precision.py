@@ -0,0 +1,134 @@
+"""
+Precision - 수치 정밀도 정책
+
+상태 파이프라인 전체에서 사용할 부동소수 dtype 정책
+
+적용 범위:
+- GlobalState.state_vector
+- extensions["L0"]의 weights / bias
+- Hopfield 에너지 계산
+- 상태 직렬화 (state_io)
+
+수학적 배경:
+Hopfield 에너지:
+    E(x) = -(1/2) Σ_ij w_ij x_i x_j - Σ_i b_i x_i
+
+float32/float16은 메모리 대역폭을 절반/1/4로 줄이지만
+에너지 값에 반올림 오차가 생김 → accuracy report로 확인
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional
+import numpy as np
+
+__version__ = "0.1.0"
+
+# 지원 정밀도
+SUPPORTED_PRECISIONS = ("float64", "float32", "float16")
+
+
+def float_dtype_of(array: Any) -> np.dtype:
+    """배열의 부동소수 dtype 반환 (정수/기타는 float64)
+
+    래퍼들이 state_vector의 dtype을 따라가도록 할 때 사용.
+
+    Args:
+        array: 배열 (또는 None)
+
+    Returns:
+        부동소수 dtype
+    """
+    dtype = getattr(array, "dtype", None)
+    if dtype is not None and np.issubdtype(dtype, np.floating):
+        return dtype
+    return np.dtype(np.float64)
+
+
+def hopfield_energy(
+    x: np.ndarray,
+    W: np.ndarray,
+    b: np.ndarray,
+    dtype: Optional[Any] = None,
+) -> float:
+    """Hopfield 에너지 계산
+
+    수식: E(x) = -(1/2) xᵀWx - bᵀx
+
+    Args:
+        x: 상태 벡터
+        W: 가중치 행렬
+        b: 바이어스 벡터
+        dtype: 계산 dtype (None이면 x의 부동소수 dtype)
+
+    Returns:
+        에너지 (Python float)
+    """
+    dtype = float_dtype_of(x) if dtype is None else np.dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    W = np.asarray(W, dtype=dtype)
+    b = np.asarray(b, dtype=dtype)
+    return float(-0.5 * (x @ (W @ x)) - (b @ x))
+
+
+class PrecisionPolicy:
+    """정밀도 정책
+
+    BrainCore가 보유하며, 사이클 시작 전 상태에 적용.
+    이후 내장 래퍼들은 state_vector의 dtype을 따라감.
+    """
+
+    def __init__(self, precision: str = "float64"):
+        """PrecisionPolicy 초기화
+
+        Args:
+            precision: "float64" (기본), "float32", "float16"
+        """
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(
+                f"지원하지 않는 정밀도: {precision} (지원: {SUPPORTED_PRECISIONS})"
+            )
+        self.precision = precision
+        self.dtype = np.dtype(precision)
+
+    def cast_array(self, array: Any) -> np.ndarray:
+        """배열을 정책 dtype으로 변환 (이미 같은 dtype이면 복사 없음)"""
+        return np.asarray(array, dtype=self.dtype)
+
+    def apply(self, state: Any) -> Any:
+        """상태에 정책 적용 (state_vector, L0 weights/bias)
+
+        L0 extension은 새 딕셔너리로 교체하므로 shallow copy된 상태에
+        적용해도 원본의 L0 데이터는 변경되지 않음.
+
+        Args:
+            state: GlobalState (또는 호환 객체)
+
+        Returns:
+            같은 상태 객체
+        """
+        state.state_vector = self.cast_array(state.state_vector)
+
+        l0_data = state.get_extension("L0")
+        if isinstance(l0_data, dict):
+            l0_data = dict(l0_data)
+            for key in ("weights", "bias"):
+                if l0_data.get(key) is not None:
+                    l0_data[key] = self.cast_array(l0_data[key])
+            state.set_extension("L0", l0_data)
+
+        return state
+
+    def energy(self, x: np.ndarray, W: np.ndarray, b: np.ndarray) -> float:
+        """정책 dtype으로 Hopfield 에너지 계산"""
+        return hopfield_energy(x, W, b, dtype=self.dtype)
+
+    def get_config(self) -> Dict[str, Any]:
+        """설정 반환"""
+        return {
+            "precision": self.precision,
+            "itemsize": self.dtype.itemsize,
+        }
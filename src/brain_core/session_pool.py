@@ -0,0 +1,340 @@
+"""
+Session Pool - 멀티 테넌트 세션 관리
+
+세션(테넌트)별 GlobalState를 보관하고 BrainCore 사이클을 공정하게 실행
+
+산업용 중심:
+- 메모리 상한 (max_sessions, LRU 축출)
+- 축출 시 바이너리 상태 포맷으로 디스크 스필 (선택)
+- 상태 벡터 버퍼 재사용 (할당 최소화)
+- 세션 간 라운드로빈 스케줄링 (예측 가능한 지연)
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict, deque
+from pathlib import Path
+import hashlib
+import threading
+import logging
+import numpy as np
+
+from .global_state import GlobalState
+from .state_io import serialize_state, deserialize_state
+
+__version__ = "0.1.0"
+
+
+class SessionPool:
+    """세션 풀
+
+    세션별 상태를 LRU 순서로 보관.
+    세션마다 상태 벡터 버퍼를 하나씩 소유하며, 사이클 결과는 해당 버퍼에
+    제자리 복사(in-place)되어 매 사이클 새 배열을 보관하지 않음.
+    닫히거나 축출된 세션의 버퍼는 (shape, dtype)별 free list로 돌아가 재사용됨.
+
+    Note:
+        같은 세션에 대한 run_cycle을 여러 스레드에서 동시에 호출하지 말 것.
+        (구조 변경은 잠금으로 보호되지만 세션 상태 갱신은 직렬 실행 전제)
+    """
+
+    def __init__(
+        self,
+        core: Any,
+        max_sessions: int = 1024,
+        spill_dir: Optional[str] = None,
+        max_free_buffers: int = 256,
+        enable_logging: bool = True,
+    ):
+        """SessionPool 초기화
+
+        Args:
+            core: BrainCore 인스턴스
+            max_sessions: 메모리에 유지할 최대 세션 수
+            spill_dir: 축출 세션 스필 디렉토리 (None이면 축출 시 폐기)
+            max_free_buffers: (shape, dtype)별 재사용 버퍼 최대 보관 수
+            enable_logging: 로깅 활성화 여부
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions는 1 이상이어야 합니다.")
+
+        self.core = core
+        self.max_sessions = max_sessions
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_free_buffers = max_free_buffers
+
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._sessions: "OrderedDict[str, GlobalState]" = OrderedDict()  # LRU (오래된 것이 앞)
+        self._spilled: Dict[str, Path] = {}
+        self._pending: Dict[str, deque] = {}
+        self._ready: deque = deque()  # 대기 요청이 있는 세션 (라운드로빈 순서)
+        self._in_flight: Dict[str, int] = {}  # 사이클 실행 중인 세션 (축출 대상 제외)
+        self._free_buffers: Dict[Tuple[Tuple[int, ...], str], List[np.ndarray]] = {}
+        self._lock = threading.RLock()
+
+        self.stats = {
+            "cycles": 0,
+            "evicted": 0,
+            "spilled": 0,
+            "restored": 0,
+            "dropped": 0,
+            "buffer_reuses": 0,
+            "buffer_allocations": 0,
+        }
+
+        if enable_logging:
+            self.logger = logging.getLogger("SessionPool")
+        else:
+            self.logger = None
+
+    # ------------------------------------------------------------------
+    # 세션 관리
+    # ------------------------------------------------------------------
+
+    def open_session(self, session_id: str, initial_state: GlobalState):
+        """세션 생성 (이미 있으면 상태 교체)
+
+        Args:
+            session_id: 세션 ID
+            initial_state: 초기 상태 (풀이 소유하는 shallow copy로 보관)
+        """
+        with self._lock:
+            if session_id in self._sessions or session_id in self._spilled:
+                self.close_session(session_id)
+            self._sessions[session_id] = self._adopt(initial_state)
+            self._evict_if_needed(protect=session_id)
+
+    def close_session(self, session_id: str):
+        """세션 종료 (버퍼 반환, 스필 파일 삭제, 대기 요청 폐기)
+
+        Args:
+            session_id: 세션 ID
+        """
+        with self._lock:
+            state = self._sessions.pop(session_id, None)
+            # 실행 중인 사이클이 아직 버퍼를 사용하므로 재사용 목록에 돌려주지 않음
+            if state is not None and session_id not in self._in_flight:
+                self._release_buffer(state.state_vector)
+            spill_path = self._spilled.pop(session_id, None)
+            if spill_path is not None and spill_path.exists():
+                spill_path.unlink()
+            self._pending.pop(session_id, None)
+
+    def has_session(self, session_id: str) -> bool:
+        """세션 존재 여부 (스필된 세션 포함)"""
+        return session_id in self._sessions or session_id in self._spilled
+
+    def get_state(self, session_id: str) -> GlobalState:
+        """세션 상태 반환 (스필되어 있으면 복원, LRU 갱신)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            세션 상태의 복사본 (state_vector 포함, 풀 버퍼는 축출 후 다른 세션에 재사용되므로
+            풀 소유 객체를 외부에 내주지 않음)
+        """
+        with self._lock:
+            state = self._touch(session_id).copy()
+            state.state_vector = np.array(state.state_vector)
+            return state
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def run_cycle(self, session_id: str, **run_kwargs) -> Dict[str, Any]:
+        """세션 상태로 한 사이클 실행 후 결과 상태 저장
+
+        Args:
+            session_id: 세션 ID
+            **run_kwargs: BrainCore.run_cycle() 인자
+
+        Returns:
+            BrainCore.run_cycle() 결과
+        """
+        with self._lock:
+            state = self._touch(session_id)
+            # 실행 중에는 축출/스필되지 않음 (버퍼가 다른 세션에 재사용되는 것 방지)
+            self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+
+        try:
+            result = self.core.run_cycle(initial_state=state, **run_kwargs)
+        except BaseException:
+            with self._lock:
+                self._end_flight(session_id)
+            raise
+
+        with self._lock:
+            self._end_flight(session_id)
+            # 실행 중 close_session된 경우만 저장 생략
+            if session_id in self._sessions:
+                self._store_result(session_id, result["final_state"])
+            self.stats["cycles"] += 1
+            # 실행 중에 미뤄진 축출 처리
+            self._evict_if_needed(protect=session_id)
+        return result
+
+    def submit(self, session_id: str, **run_kwargs):
+        """사이클 요청 등록 (run_pending에서 실행)
+
+        Args:
+            session_id: 세션 ID
+            **run_kwargs: BrainCore.run_cycle() 인자
+        """
+        with self._lock:
+            if not self.has_session(session_id):
+                raise KeyError(f"세션 {session_id}이 없습니다.")
+            queue = self._pending.setdefault(session_id, deque())
+            if not queue:
+                self._ready.append(session_id)
+            queue.append(run_kwargs)
+
+    def run_pending(self, max_cycles: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """대기 요청을 세션 간 라운드로빈으로 실행
+
+        한 세션의 요청이 아무리 많아도 다른 세션과 번갈아 한 번씩 실행됨.
+
+        Args:
+            max_cycles: 이번 호출에서 실행할 최대 사이클 수 (None이면 모두)
+
+        Returns:
+            [(session_id, result), ...] 실행 순서대로
+        """
+        results = []
+        while max_cycles is None or len(results) < max_cycles:
+            with self._lock:
+                if not self._ready:
+                    break
+                session_id = self._ready.popleft()
+                queue = self._pending.get(session_id)
+                if not queue:
+                    continue
+                run_kwargs = queue.popleft()
+                if queue:
+                    self._ready.append(session_id)  # 다음 라운드
+                else:
+                    del self._pending[session_id]
+            results.append((session_id, self.run_cycle(session_id, **run_kwargs)))
+        return results
+
+    def pending_count(self) -> int:
+        """대기 요청 수"""
+        with self._lock:
+            return sum(len(queue) for queue in self._pending.values())
+
+    # ------------------------------------------------------------------
+    # 내부: LRU / 스필
+    # ------------------------------------------------------------------
+
+    def _touch(self, session_id: str) -> GlobalState:
+        """세션 조회 + LRU 갱신 (스필된 세션은 복원)"""
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+            return self._sessions[session_id]
+
+        spill_path = self._spilled.pop(session_id, None)
+        if spill_path is None:
+            raise KeyError(f"세션 {session_id}이 없습니다.")
+
+        state = self._adopt(deserialize_state(spill_path.read_bytes()))
+        spill_path.unlink()
+        self._sessions[session_id] = state
+        self.stats["restored"] += 1
+        self._evict_if_needed(protect=session_id)
+        return state
+
+    def _end_flight(self, session_id: str):
+        """실행 중 표시 해제 (잠금 보유 상태에서 호출)"""
+        remaining = self._in_flight[session_id] - 1
+        if remaining:
+            self._in_flight[session_id] = remaining
+        else:
+            del self._in_flight[session_id]
+
+    def _evict_if_needed(self, protect: Optional[str] = None):
+        """max_sessions 초과 시 LRU 축출 (대기 요청 없는 세션 우선)
+
+        실행 중인 세션과 protect는 축출하지 않음. 후보가 없으면 일시적으로 상한을 넘기고
+        해당 사이클이 끝날 때 다시 축출.
+        """
+        while len(self._sessions) > self.max_sessions:
+            candidates = [sid for sid in self._sessions if sid != protect and sid not in self._in_flight]
+            if not candidates:
+                break
+            victim = next((sid for sid in candidates if sid not in self._pending), candidates[0])
+            self._evict(victim)
+
+    def _evict(self, session_id: str):
+        state = self._sessions.pop(session_id)
+        self.stats["evicted"] += 1
+
+        if self.spill_dir is not None:
+            spill_path = self.spill_dir / (hashlib.sha1(session_id.encode("utf-8")).hexdigest() + ".bcst")
+            spill_path.write_bytes(serialize_state(state, precision=self.core.precision))
+            self._spilled[session_id] = spill_path
+            self.stats["spilled"] += 1
+        else:
+            self._pending.pop(session_id, None)
+            self.stats["dropped"] += 1
+            if self.logger:
+                self.logger.warning("세션 %s 축출 (스필 디렉토리 없음 → 폐기)", session_id)
+
+        self._release_buffer(state.state_vector)
+
+    # ------------------------------------------------------------------
+    # 내부: 버퍼 재사용
+    # ------------------------------------------------------------------
+
+    def _adopt(self, state: GlobalState) -> GlobalState:
+        """풀 소유 버퍼에 벡터를 복사한 shallow copy 생성"""
+        owned = state.copy()
+        owned.state_vector = self._acquire_buffer(state.state_vector)
+        return owned
+
+    def _store_result(self, session_id: str, final_state: GlobalState):
+        """결과 상태를 세션 버퍼에 제자리 복사하여 저장"""
+        buffer = self._sessions[session_id].state_vector
+        vector = np.asarray(final_state.state_vector)
+        stored = final_state.copy()
+        if buffer.shape == vector.shape and buffer.dtype == vector.dtype:
+            np.copyto(buffer, vector)
+            stored.state_vector = buffer
+        else:
+            self._release_buffer(buffer)
+            stored.state_vector = self._acquire_buffer(vector)
+        self._sessions[session_id] = stored
+
+    def _acquire_buffer(self, vector: Any) -> np.ndarray:
+        vector = np.asarray(vector)
+        free = self._free_buffers.get((vector.shape, vector.dtype.str))
+        if free:
+            buffer = free.pop()
+            self.stats["buffer_reuses"] += 1
+        else:
+            buffer = np.empty(vector.shape, dtype=vector.dtype)
+            self.stats["buffer_allocations"] += 1
+        np.copyto(buffer, vector)
+        return buffer
+
+    def _release_buffer(self, buffer: np.ndarray):
+        free = self._free_buffers.setdefault((buffer.shape, buffer.dtype.str), [])
+        if len(free) < self.max_free_buffers:
+            free.append(buffer)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계 반환"""
+        with self._lock:
+            return {
+                **self.stats,
+                "active_sessions": len(self._sessions),
+                "spilled_sessions": len(self._spilled),
+                "pending_requests": sum(len(queue) for queue in self._pending.values()),
+                "free_buffers": sum(len(free) for free in self._free_buffers.values()),
+            }
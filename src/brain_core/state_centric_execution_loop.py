@@ -14,10 +14,15 @@ from __future__ import annotations
 
 from typing import Dict, Any, List, Optional, Tuple
 import logging
+import threading
+import time
 import numpy as np
 
 from .global_state import GlobalState
 from .execution_modes import SelfOrganizingEngine
+from .instrumentation import EngineProfiler
+from .event_sink import EventSink
+from .circuit_breaker import CircuitBreakerSet
 
 __version__ = "0.2.0"
 
@@ -37,18 +42,46 @@ class StateCentricExecutionLoop:
     def __init__(
         self,
         enable_logging: bool = True,
+        profiler: Optional[EngineProfiler] = None,
+        event_sink: Optional[EventSink] = None,
+        circuit_breakers: Optional[CircuitBreakerSet] = None,
     ):
         """StateCentricExecutionLoop 초기화
         
         Args:
             enable_logging: 로깅 활성화 여부
+            profiler: 엔진별 계측기 (None이면 계측 안 함)
+            event_sink: 구조화 이벤트 싱크 (None이면 이벤트 기록 안 함)
+            circuit_breakers: 엔진별 차단기 (None이면 실패 엔진도 매 스텝 호출)
+        
+        Note:
+            차단기는 예외뿐 아니라 엔진의 last_error 속성(내부에서 삼킨 오류)도 실패로 집계.
+            open 상태 엔진은 호출하지 않고 "circuit_open" 사유로 스킵 기록.
+            차단기를 사용하면 run_cycle 중 예외를 낸 엔진은 사이클을 중단시키지 않고
+            그 사이클의 남은 스텝에서 제외됨 ("engine_failed" 스킵 기록).
+            차단기가 없으면 기존대로 예외 시 사이클 중단.
         """
         self.enable_logging = enable_logging
+        self.profiler = profiler
+        self.event_sink = event_sink
+        self.circuit_breakers = circuit_breakers
+        
+        # 마지막 run_cycle/run_batch의 시간 정보 (스레드별, 여러 스레드가 루프를 공유해도 섞이지 않음)
+        self._local = threading.local()
         if enable_logging:
             self.logger = logging.getLogger("StateCentricExecutionLoop")
         else:
             self.logger = None
 
+    @property
+    def last_cycle_info(self) -> Dict[str, Any]:
+        """현재 스레드에서 마지막으로 실행한 사이클의 시간 정보 (status, steps, elapsed, engine_time, ...)"""
+        return getattr(self._local, "cycle_info", {})
+
+    @last_cycle_info.setter
+    def last_cycle_info(self, info: Dict[str, Any]):
+        self._local.cycle_info = info
+
     def run_cycle(
         self,
         initial_state: GlobalState,
@@ -56,6 +89,8 @@ class StateCentricExecutionLoop:
         max_steps: int = 100,
         convergence_threshold: float = 1e-4,
         return_trajectory: bool = False,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
     ) -> Tuple[GlobalState, Optional[List[GlobalState]]]:
         """상태계 중심 실행 루프 실행
         
@@ -63,21 +98,59 @@ class StateCentricExecutionLoop:
         - 상태 업데이트: state_{t+1} = engine.update(state_t)
         - 수렴 조건: |E_{t+1} - E_t| < ε
         
+        시간 제한:
+        - deadline: 사이클 전체 wall-clock 상한. 엔진 호출 경계에서 확인하며,
+          초과하면 그 시점의 상태를 반환 (last_cycle_info["deadline_exceeded"] = True)
+        - engine_budgets: 엔진별 사이클 내 누적 시간 상한 (soft).
+          초과한 엔진은 남은 스텝에서 호출하지 않음 ("budget_exceeded" 스킵 기록)
+        
         Args:
             initial_state: 초기 GlobalState
             engines: SelfOrganizingEngine 프로토콜을 따르는 엔진 딕셔너리 (순서 중요)
             max_steps: 최대 실행 스텝 수
             convergence_threshold: 수렴 임계값 (state_vector 변화량)
             return_trajectory: 전체 상태 궤적 반환 여부
+            deadline: 사이클 시간 상한 (초, None이면 제한 없음)
+            engine_budgets: 엔진별 시간 예산 {엔진 이름: 초}
         
         Returns:
             Tuple[GlobalState, Optional[List[GlobalState]]]: 최종 GlobalState와 (옵션) 상태 궤적
+            (사이클 시간 정보는 같은 스레드의 last_cycle_info 참조)
         """
+        cycle_start = time.perf_counter()
+        deadline_at = cycle_start + deadline if deadline is not None else None
+        budgets = engine_budgets or {}
+        engine_time: Dict[str, float] = dict.fromkeys(engines, 0.0)
+        over_budget: List[str] = []
+        failed_engines: List[str] = []  # 차단기 사용 시 이번 사이클에서 제외된 엔진
+        completed_steps = 0
+        
         current_state = initial_state.copy(deep=True)  # 초기 상태 복사
         trajectory: List[GlobalState] = [current_state.copy()] if return_trajectory else []
 
-        if self.logger:
-            self.logger.info(f"StateCentricExecutionLoop 시작 (max_steps: {max_steps}, threshold: {convergence_threshold})")
+        # 로그 레벨은 사이클 시작 시 한 번만 확인 (비활성 레벨은 포맷 비용 없음)
+        logger = self.logger
+        debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
+        sink = self.event_sink
+        profiler = self.profiler
+        breakers = self.circuit_breakers
+        engine_names = list(engines)
+        
+        def finish(status: str) -> Tuple[GlobalState, Optional[List[GlobalState]]]:
+            self.last_cycle_info = {
+                "status": status,
+                "steps": completed_steps,
+                "elapsed": time.perf_counter() - cycle_start,
+                "deadline": deadline,
+                "deadline_exceeded": status == "deadline_exceeded",
+                "engine_time": engine_time,
+                "over_budget": over_budget,
+                "failed_engines": failed_engines,
+            }
+            return current_state, trajectory if return_trajectory else None
+
+        if logger:
+            logger.info("StateCentricExecutionLoop 시작 (max_steps: %d, threshold: %g)", max_steps, convergence_threshold)
 
         for step in range(max_steps):
             prev_state_vector = current_state.state_vector.copy()
@@ -85,20 +158,68 @@ class StateCentricExecutionLoop:
             
             # 엔진 순서대로 상태 업데이트
             # 수식: state_{t+1} = engine.update(state_t)
-            for name, engine in engines.items():
-                if self.logger:
-                    self.logger.debug(f"Step {step}, 엔진 {name} 업데이트 시작")
+            for index, (name, engine) in enumerate(engines.items()):
+                if deadline_at is not None and time.perf_counter() >= deadline_at:
+                    for skipped in engine_names[index:]:
+                        self._record_skip(skipped, "deadline_exceeded", step)
+                    if logger:
+                        logger.warning("StateCentricExecutionLoop 사이클 시간 상한 초과 (스텝: %d, 상한: %gs)",
+                                       step, deadline)
+                    return finish("deadline_exceeded")
+                if name in over_budget:
+                    self._record_skip(name, "budget_exceeded", step)
+                    continue
+                if name in failed_engines:
+                    self._record_skip(name, "engine_failed", step)
+                    continue
+                if breakers is not None and not breakers.allow(name):
+                    self._record_skip(name, "circuit_open", step)
+                    continue
+                if debug:
+                    logger.debug("Step %d, 엔진 %s 업데이트 시작", step, name)
+                call_start = time.perf_counter()
                 try:
-                    current_state = engine.update(current_state)
-                    if self.logger:
-                        self.logger.debug(f"Step {step}, 엔진 {name} 업데이트 완료. Risk: {current_state.risk:.3f}, Energy: {current_state.energy:.3f}")
+                    if profiler is None:
+                        current_state = engine.update(current_state)
+                    else:
+                        current_state = profiler.call(name, engine.update, current_state)
+                    if breakers is not None:
+                        self._record_outcome(breakers, name, engine)
+                    if debug:
+                        logger.debug("Step %d, 엔진 %s 업데이트 완료. Risk: %.3f, Energy: %.3f",
+                                     step, name, current_state.risk, current_state.energy)
+                    if sink is not None:
+                        sink.emit("StateCentricExecutionLoop", "engine_update",
+                                  step, name, current_state.risk, current_state.energy)
                 except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Step {step}, 엔진 {name} 업데이트 중 오류: {e}")
+                    engine_time[name] += time.perf_counter() - call_start
+                    if breakers is not None:
+                        breakers.record_failure(name, e)
+                    if logger:
+                        logger.error("Step %d, 엔진 %s 업데이트 중 오류: %s", step, name, e)
+                    if sink is not None:
+                        sink.emit("StateCentricExecutionLoop", "engine_error", step, name, repr(e))
+                    if breakers is not None:
+                        # 차단기 사용 시: 실패 엔진만 이번 사이클에서 제외하고 계속 진행
+                        failed_engines.append(name)
+                        continue
+                    if profiler is not None:
+                        for skipped in engine_names[index + 1:]:
+                            profiler.record_skip(skipped, "cycle_aborted")
                     # 오류 발생 시 현재 상태 반환
-                    return current_state, trajectory if return_trajectory else None
+                    return finish("error")
+                
+                spent = engine_time[name] + (time.perf_counter() - call_start)
+                engine_time[name] = spent
+                budget = budgets.get(name)
+                if budget is not None and spent > budget:
+                    over_budget.append(name)
+                    if logger:
+                        logger.warning("엔진 %s 시간 예산 초과 (%.3fms > %.3fms), 이번 사이클 남은 호출 생략",
+                                       name, spent * 1000, budget * 1000)
             
             current_state.update_step(step + 1)  # 스텝 및 타임스탬프 업데이트
+            completed_steps = step + 1
 
             if return_trajectory:
                 trajectory.append(current_state.copy())
@@ -108,15 +229,220 @@ class StateCentricExecutionLoop:
             energy_delta = abs(current_state.energy - prev_energy)
             state_vector_delta = np.linalg.norm(current_state.state_vector - prev_state_vector)
             
-            if self.logger:
-                self.logger.debug(f"Step {step}: Energy Delta = {energy_delta:.6f}, State Vector Delta = {state_vector_delta:.6f}, Risk = {current_state.risk:.3f}, Energy = {current_state.energy:.3f}")
+            if debug:
+                logger.debug("Step %d: Energy Delta = %.6f, State Vector Delta = %.6f, Risk = %.3f, Energy = %.3f",
+                             step, energy_delta, state_vector_delta, current_state.risk, current_state.energy)
+            if sink is not None:
+                sink.emit("StateCentricExecutionLoop", "step", step, energy_delta, state_vector_delta)
             
             # 에너지 수렴 또는 상태 벡터 수렴
             if energy_delta < convergence_threshold or state_vector_delta < convergence_threshold:
-                if self.logger:
-                    self.logger.info(f"StateCentricExecutionLoop 수렴 완료 (스텝: {step+1})")
-                return current_state, trajectory if return_trajectory else None
+                if logger:
+                    logger.info("StateCentricExecutionLoop 수렴 완료 (스텝: %d)", step + 1)
+                return finish("converged")
 
-        if self.logger:
-            self.logger.warning(f"StateCentricExecutionLoop 최대 스텝 도달 (수렴 실패)")
-        return current_state, trajectory if return_trajectory else None
+        if logger:
+            logger.warning("StateCentricExecutionLoop 최대 스텝 도달 (수렴 실패)")
+        return finish("max_steps")
+
+    def run_batch(
+        self,
+        initial_states: List[GlobalState],
+        engines: Dict[str, SelfOrganizingEngine],
+        max_steps: int = 100,
+        convergence_threshold: float = 1e-4,
+        deadline: Optional[float] = None,
+        engine_budgets: Optional[Dict[str, float]] = None,
+    ) -> List[GlobalState]:
+        """여러 독립 상태를 같은 스텝 순서로 실행
+        
+        각 상태는 run_cycle과 동일한 규칙으로 갱신/수렴하되,
+        수렴 판정은 배치 전체에 대해 벡터화되어 한 번에 계산됨.
+        엔진이 update_batch(states) -> states 메서드를 가지면 활성 상태들을
+        한 번에 전달하고, 없으면 상태별 update()를 Python 루프로 호출.
+        
+        Note:
+            엔진 갱신 자체가 묶여 실행되는 것은 update_batch를 제공하는 엔진뿐.
+            내장 엔진 래퍼(engine_wrappers)는 외부 엔진을 상태 하나씩 호출하므로
+            update_batch가 없고, 이 경우 절약되는 것은 사이클/수렴 판정 오버헤드뿐
+            (엔진 호출 수는 상태별 run_cycle과 같음).
+        
+        update_batch 오류 처리:
+            예외 시점까지 일부 상태가 이미 변경되었을 수 있으므로 상태별 update()로
+            재시도하지 않음 (같은 갱신이 두 번 적용되는 것 방지). 해당 배치의 상태들은
+            run_cycle의 오류와 같이 그 시점 상태로 실행을 마침.
+        
+        수렴 조건 (상태 i별):
+            |E_{t+1}^i - E_t^i| < ε  또는  ||x_{t+1}^i - x_t^i|| < ε
+        
+        시간 제한 (run_cycle과 같은 규칙, 배치 전체에 적용):
+        - deadline: 배치 사이클 전체 wall-clock 상한. 초과하면 모든 상태를 그 시점에서 반환
+        - engine_budgets: 엔진별 배치 사이클 내 누적 시간 상한 (soft)
+        
+        Args:
+            initial_states: 초기 상태 리스트 (state_vector shape 동일)
+            engines: SelfOrganizingEngine 딕셔너리 (순서 중요)
+            max_steps: 최대 실행 스텝 수
+            convergence_threshold: 수렴 임계값
+            deadline: 배치 사이클 시간 상한 (초, None이면 제한 없음)
+            engine_budgets: 엔진별 시간 예산 {엔진 이름: 초}
+        
+        Returns:
+            최종 상태 리스트 (입력 순서 유지)
+            (배치 시간 정보는 같은 스레드의 last_cycle_info 참조)
+        """
+        cycle_start = time.perf_counter()
+        deadline_at = cycle_start + deadline if deadline is not None else None
+        budgets = engine_budgets or {}
+        engine_time: Dict[str, float] = dict.fromkeys(engines, 0.0)
+        over_budget: List[str] = []
+        failed_engines: List[str] = []  # 예외를 낸 엔진 (run_cycle 정보와 같은 키)
+        completed_steps = 0
+        errored = False
+        
+        states = [state.copy(deep=True) for state in initial_states]
+        status = "max_steps" if states else "converged"
+        active = list(range(len(states)))
+        profiler = self.profiler
+        breakers = self.circuit_breakers
+        engine_names = list(engines)
+        
+        for step in range(max_steps if states else 0):
+            prev_vectors = np.stack([states[i].state_vector for i in active])
+            prev_energies = np.array([states[i].energy for i in active], dtype=np.float64)
+            failed = set()
+            
+            for index, (name, engine) in enumerate(engines.items()):
+                if deadline_at is not None and time.perf_counter() >= deadline_at:
+                    for skipped in engine_names[index:]:
+                        self._record_skip(skipped, "deadline_exceeded", step)
+                    if self.logger:
+                        self.logger.warning("StateCentricExecutionLoop 배치 사이클 시간 상한 초과 (스텝: %d, 상한: %gs)",
+                                            step, deadline)
+                    status = "deadline_exceeded"
+                    break
+                batch_update = getattr(engine, "update_batch", None)
+                live = [i for i in active if i not in failed]
+                if not live:
+                    break
+                if name in over_budget:
+                    self._record_skip(name, "budget_exceeded", step)
+                    continue
+                if breakers is not None:
+                    if not breakers.allow(name):
+                        self._record_skip(name, "circuit_open", step)
+                        continue
+                    if breakers.probing(name) and len(live) > 1:
+                        # half_open 시험 호출은 상태 하나로만 (나머지는 이번 스텝 스킵)
+                        live = live[:1]
+                        self._record_skip(name, "circuit_open", step)
+                call_start = time.perf_counter()
+                if batch_update is not None:
+                    try:
+                        batch = [states[i] for i in live]
+                        updated = batch_update(batch) if profiler is None \
+                            else profiler.call(name, batch_update, batch)
+                        for i, state in zip(live, updated):
+                            states[i] = state
+                        if breakers is not None:
+                            self._record_outcome(breakers, name, engine)
+                        self._charge(name, engine_time, call_start, budgets, over_budget)
+                        continue
+                    except Exception as e:
+                        if name not in failed_engines:
+                            failed_engines.append(name)
+                        if breakers is not None:
+                            breakers.record_failure(name, e)
+                        if self.logger:
+                            self.logger.error("Step %d, 엔진 %s 배치 업데이트 중 오류 (%d개 상태 중단): %s",
+                                              step, name, len(live), e)
+                        failed.update(live)
+                        self._charge(name, engine_time, call_start, budgets, over_budget)
+                        continue
+                for i in live:
+                    try:
+                        states[i] = engine.update(states[i]) if profiler is None \
+                            else profiler.call(name, engine.update, states[i])
+                        if breakers is not None:
+                            self._record_outcome(breakers, name, engine)
+                    except Exception as e:
+                        if name not in failed_engines:
+                            failed_engines.append(name)
+                        if breakers is not None:
+                            breakers.record_failure(name, e)
+                        if self.logger:
+                            self.logger.error("Step %d, 엔진 %s 업데이트 중 오류 (배치 %d): %s", step, name, i, e)
+                        failed.add(i)
+                self._charge(name, engine_time, call_start, budgets, over_budget)
+            
+            if status == "deadline_exceeded":
+                break
+            
+            for i in active:
+                if i not in failed:
+                    states[i].update_step(step + 1)
+            completed_steps = step + 1
+            
+            # 벡터화된 수렴 판정
+            energies = np.array([states[i].energy for i in active], dtype=np.float64)
+            vectors = np.stack([states[i].state_vector for i in active])
+            energy_delta = np.abs(energies - prev_energies)
+            state_delta = np.linalg.norm(
+                (vectors - prev_vectors).reshape(len(active), -1), axis=1
+            )
+            done = (energy_delta < convergence_threshold) | (state_delta < convergence_threshold)
+            
+            errored = errored or bool(failed)
+            active = [i for i, finished in zip(active, done) if not finished and i not in failed]
+            if not active:
+                # 상태 하나라도 오류로 중단되었으면 "error"
+                status = "error" if errored else "converged"
+                break
+        
+        if status == "max_steps" and self.logger:
+            self.logger.warning("StateCentricExecutionLoop 배치 최대 스텝 도달 (미수렴 %d개)", len(active))
+        self.last_cycle_info = {
+            "status": status,
+            "steps": completed_steps,
+            "elapsed": time.perf_counter() - cycle_start,
+            "deadline": deadline,
+            "deadline_exceeded": status == "deadline_exceeded",
+            "engine_time": engine_time,
+            "over_budget": over_budget,
+            "failed_engines": failed_engines,
+        }
+        return states
+
+    def _charge(
+        self,
+        name: str,
+        engine_time: Dict[str, float],
+        call_start: float,
+        budgets: Dict[str, float],
+        over_budget: List[str],
+    ):
+        """엔진 호출 시간 누적 및 예산 초과 판정 (run_batch용)"""
+        spent = engine_time[name] + (time.perf_counter() - call_start)
+        engine_time[name] = spent
+        budget = budgets.get(name)
+        if budget is not None and spent > budget and name not in over_budget:
+            over_budget.append(name)
+            if self.logger:
+                self.logger.warning("엔진 %s 시간 예산 초과 (%.3fms > %.3fms), 이번 배치 사이클 남은 호출 생략",
+                                    name, spent * 1000, budget * 1000)
+
+    def _record_skip(self, name: str, reason: str, step: int):
+        """엔진 호출 스킵 기록 (계측기/이벤트 싱크)"""
+        if self.profiler is not None:
+            self.profiler.record_skip(name, reason)
+        if self.event_sink is not None:
+            self.event_sink.emit("StateCentricExecutionLoop", "engine_skipped", step, name, reason)
+
+    @staticmethod
+    def _record_outcome(breakers: CircuitBreakerSet, name: str, engine: Any):
+        """update 정상 반환 후 차단기 기록 (엔진이 삼킨 오류는 last_error로 판단)"""
+        soft_error = getattr(engine, "last_error", None)
+        if soft_error is None:
+            breakers.record_success(name)
+        else:
+            breakers.record_failure(name, soft_error)
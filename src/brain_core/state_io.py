@@ -0,0 +1,131 @@
+"""
+State IO - GlobalState 바이너리 직렬화
+
+세션 저장/스필(spill)용 바이너리 상태 포맷
+
+포맷 (little-endian):
+    magic        4 bytes   b"BCST"
+    version      uint16    STATE_FORMAT_VERSION
+    header_len   uint32    JSON 헤더 길이
+    header       JSON      {dtype, shape, energy, risk, step, timestamp,
+                            compact, payload_len}
+    vector       raw       state_vector 원시 바이트 (C order)
+    payload      pickle    {"metadata": ..., "extensions": ...}
+
+state_vector는 원시 바이트로 저장하므로 dtype(정밀도)이 그대로 보존됨.
+metadata/extensions는 임의 객체를 담을 수 있으므로 pickle 사용
+(신뢰할 수 있는 데이터에만 사용할 것).
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+import json
+import pickle
+import struct
+import numpy as np
+
+from .global_state import GlobalState, CompactGlobalState
+from .precision import PrecisionPolicy
+
+__version__ = "0.1.0"
+
+STATE_FORMAT_MAGIC = b"BCST"
+STATE_FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<4sHI")
+
+
+def serialize_state(
+    state: Any,
+    precision: Optional[PrecisionPolicy] = None,
+) -> bytes:
+    """상태를 바이너리 포맷으로 직렬화
+
+    Args:
+        state: GlobalState 또는 CompactGlobalState
+        precision: 정밀도 정책 (있으면 state_vector/L0를 해당 dtype으로 저장)
+
+    Returns:
+        직렬화된 바이트
+    """
+    if precision is not None:
+        # 원본을 건드리지 않도록 shallow copy에 적용
+        state = precision.apply(state.copy())
+
+    vector = np.ascontiguousarray(state.state_vector)
+    is_compact = isinstance(state, CompactGlobalState)
+    if is_compact:
+        # lazy 컨테이너는 할당하지 않고 그대로 저장
+        payload_obj = {"metadata": state._metadata, "extensions": state._extensions}
+    else:
+        payload_obj = {"metadata": state.metadata, "extensions": state.extensions}
+    payload = pickle.dumps(payload_obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    header = json.dumps({
+        "dtype": vector.dtype.str,
+        "shape": list(vector.shape),
+        "energy": float(state.energy),
+        "risk": float(state.risk),
+        "step": int(state.step),
+        "timestamp": float(state.timestamp),
+        "compact": is_compact,
+        "payload_len": len(payload),
+    }).encode("utf-8")
+
+    return b"".join([
+        _PREFIX.pack(STATE_FORMAT_MAGIC, STATE_FORMAT_VERSION, len(header)),
+        header,
+        vector.tobytes(),
+        payload,
+    ])
+
+
+def deserialize_state(
+    data: bytes,
+    precision: Optional[PrecisionPolicy] = None,
+) -> Any:
+    """바이너리 포맷에서 상태 복원
+
+    Args:
+        data: serialize_state()가 만든 바이트
+        precision: 정밀도 정책 (있으면 복원 후 적용)
+
+    Returns:
+        GlobalState (저장 시 CompactGlobalState였으면 CompactGlobalState)
+    """
+    magic, version, header_len = _PREFIX.unpack_from(data, 0)
+    if magic != STATE_FORMAT_MAGIC:
+        raise ValueError("BrainCore 상태 포맷이 아닙니다.")
+    if version != STATE_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 상태 포맷 버전: {version}")
+
+    offset = _PREFIX.size
+    header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+    offset += header_len
+
+    dtype = np.dtype(header["dtype"])
+    count = int(np.prod(header["shape"], dtype=np.int64))
+    vector = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+    # frombuffer는 읽기 전용 뷰 → 엔진이 수정할 수 있도록 복사
+    vector = vector.reshape(header["shape"]).copy()
+    offset += vector.nbytes
+
+    payload = pickle.loads(data[offset:offset + header["payload_len"]])
+
+    state_class = CompactGlobalState if header["compact"] else GlobalState
+    state = state_class(
+        state_vector=vector,
+        energy=header["energy"],
+        risk=header["risk"],
+        step=header["step"],
+        timestamp=header["timestamp"],
+        metadata=payload["metadata"] if payload["metadata"] is not None else {},
+        extensions=payload["extensions"] if payload["extensions"] is not None else {},
+    )
+
+    if precision is not None:
+        precision.apply(state)
+    return state
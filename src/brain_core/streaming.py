@@ -0,0 +1,124 @@
+"""
+Streaming - 단계별 파이프라인 실행기
+
+여러 입력을 단계(stage) 파이프라인으로 흘려보내는 공통 실행기
+
+구조:
+    입력 이터레이터 → [stage 0] → queue → [stage 1] → ... → 출력 (입력 순서 유지)
+
+- 단계마다 워커 스레드 하나 (단계 k가 항목 i를 처리하는 동안 단계 k+1은 항목 i-1 처리)
+- 단계 사이 큐는 크기 제한 (backpressure → 메모리 상한)
+- 단계 함수의 예외는 해당 항목 위치에서 소비자에게 다시 발생
+- 소비자가 중간에 멈추면(generator close) 모든 워커 정지
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, List
+import queue
+import threading
+
+__version__ = "0.1.0"
+
+_DONE = object()
+_POLL_INTERVAL = 0.05
+
+
+class _StageError:
+    """단계에서 발생한 예외 (하류로 전달)"""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def run_stages(
+    items: Iterable[Any],
+    stages: List[Callable[[Any], Any]],
+    queue_size: int = 8,
+    name: str = "stage",
+) -> Iterator[Any]:
+    """단계 파이프라인 실행
+
+    Args:
+        items: 입력 이터레이터 (필요할 때만 소비됨)
+        stages: 단계 함수 리스트 (item -> item)
+        queue_size: 단계 사이 큐 크기 (1 이상)
+        name: 워커 스레드 이름 접두사
+
+    Yields:
+        마지막 단계 결과 (입력 순서 유지)
+    """
+    if queue_size < 1:
+        raise ValueError("queue_size는 1 이상이어야 합니다.")
+
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+
+    def put(q: queue.Queue, obj: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(obj, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q: queue.Queue) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def feed():
+        try:
+            for item in items:
+                if not put(queues[0], item):
+                    return
+        except Exception as e:
+            put(queues[0], _StageError(e))
+        put(queues[0], _DONE)
+
+    def work(stage: Callable[[Any], Any], q_in: queue.Queue, q_out: queue.Queue):
+        while True:
+            item = get(q_in)
+            if item is _DONE:
+                put(q_out, _DONE)
+                return
+            if not isinstance(item, _StageError):
+                try:
+                    item = stage(item)
+                except Exception as e:
+                    item = _StageError(e)
+            if not put(q_out, item):
+                return
+
+    threads = [threading.Thread(target=feed, name=f"{name}-feed", daemon=True)]
+    for index, stage in enumerate(stages):
+        threads.append(threading.Thread(
+            target=work,
+            args=(stage, queues[index], queues[index + 1]),
+            name=f"{name}-{index}",
+            daemon=True,
+        ))
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            if isinstance(item, _StageError):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,371 @@
+"""
+Turbulence Features - FFT 기반 난류 특징 추출기
+
+TurbulenceFeatureExtractor Protocol의 기준 구현 (numpy.fft)
+
+입력:
+    field_data["velocity"]: 성분 우선 배열 (d, n_1, ..., n_d), d = 2 또는 3
+        (성분이 마지막 축인 (n_1, ..., n_d, d) 배열도 허용)
+    field_data["temperature"]: (선택) 스칼라 장 (n_1, ..., n_d) → 대류 지표
+    주기 경계 조건 가정 (스펙트럼 미분)
+
+수식:
+    û_i(k) = (1/N) Σ_x u_i(x) e^{-ik·x}                  (rfftn, norm="forward")
+    E(k)   = Σ_{|k'|∈shell(k)} ½ Σ_i |û_i(k')|²          (셸 평균 에너지 스펙트럼)
+    ω̂      = i k × û                                     (스펙트럼 와도)
+    ε      = 2ν Σ_k k² E(k)                              (소산률)
+    λ      = sqrt(15 ν u'² / ε),  Re_λ = u' λ / ν          (등방성 가정)
+
+산업용 중심:
+- 격자 점에 대한 Python 루프 없음 (모든 연산 벡터화)
+- 파수/셸 인덱스는 (격자 shape, 도메인 길이)별로 한 번만 계산하여 재사용
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .physics_pipeline import reduce_tile_statistics
+
+__version__ = "0.1.0"
+
+
+class SpectralGrid:
+    """격자별 파수 정보 (재사용용 캐시 항목)
+
+    rfftn 출력 shape 기준:
+    - axis_k: 축별 1차원 파수 (브로드캐스트 형태, 전체 격자 배열을 만들지 않음)
+    - k2: |k|² (전체 스펙트럼 격자)
+    - shell: 셸 인덱스 rint(|k| / dk) (int32)
+    - mode_weight: rfft 대칭 보정 가중치 (마지막 축 내부 모드 ×2)
+    """
+
+    def __init__(self, shape: Tuple[int, ...], lengths: Tuple[float, ...]):
+        self.shape = shape
+        self.lengths = lengths
+        ndim = len(shape)
+
+        axis_k = []
+        for axis, (n, length) in enumerate(zip(shape, lengths)):
+            scale = 2.0 * np.pi / length
+            if axis == ndim - 1:
+                k = np.fft.rfftfreq(n, d=1.0 / n) * scale
+            else:
+                k = np.fft.fftfreq(n, d=1.0 / n) * scale
+            view = [1] * ndim
+            view[axis] = k.size
+            axis_k.append(k.reshape(view))
+        self.axis_k = tuple(axis_k)
+
+        k2 = axis_k[0] ** 2
+        for k in axis_k[1:]:
+            k2 = k2 + k ** 2
+        self.k2 = k2
+
+        self.dk = min(2.0 * np.pi / length for length in lengths)
+        self.shell = np.rint(np.sqrt(k2) / self.dk).astype(np.int32)
+        self.n_shells = int(self.shell.max()) + 1
+        self.wavenumbers = np.arange(self.n_shells) * self.dk
+
+        # rfft는 마지막 축의 음수 주파수를 생략 → 0과 Nyquist를 제외한 모드는 두 번 계산
+        n_last = shape[-1]
+        weight = np.full(n_last // 2 + 1, 2.0)
+        weight[0] = 1.0
+        if n_last % 2 == 0:
+            weight[-1] = 1.0
+        view = [1] * ndim
+        view[-1] = weight.size
+        self.mode_weight = weight.reshape(view)
+
+    def shell_sum(self, values: np.ndarray) -> np.ndarray:
+        """스펙트럼 격자 값을 셸별로 합산"""
+        return np.bincount(
+            self.shell.ravel(), weights=(values * self.mode_weight).ravel(), minlength=self.n_shells,
+        )
+
+
+class SpectralTurbulenceExtractor:
+    """FFT 기반 난류 특징 추출기 (TurbulenceFeatureExtractor 구현)"""
+
+    def __init__(
+        self,
+        viscosity: float = 1e-3,
+        domain_length: Union[float, Sequence[float]] = 2.0 * np.pi,
+        transition_re_lambda: float = 100.0,
+        dissipation_scale: float = 1.0,
+        compute_vorticity_field: bool = True,
+        max_cached_grids: int = 4,
+    ):
+        """SpectralTurbulenceExtractor 초기화
+
+        Args:
+            viscosity: 동점성 계수 ν
+            domain_length: 도메인 길이 (스칼라면 모든 축 공통, 축별 지정 가능)
+            transition_re_lambda: 난류 전이로 판단할 Taylor 레이놀즈 수
+            dissipation_scale: 소산률 리스크 정규화 기준 (ε = scale에서 리스크 0.5)
+            compute_vorticity_field: 와도 장을 실공간으로 복원하여 최대값/평탄도 계산
+                (False면 스펙트럼에서 계산 가능한 통계만 사용, 역변환 생략)
+            max_cached_grids: 보관할 격자 파수 캐시 수
+        """
+        self.viscosity = viscosity
+        self.domain_length = domain_length
+        self.transition_re_lambda = transition_re_lambda
+        self.dissipation_scale = dissipation_scale
+        self.compute_vorticity_field = compute_vorticity_field
+        self.max_cached_grids = max_cached_grids
+        self._grids: Dict[Tuple[Tuple[int, ...], Tuple[float, ...]], SpectralGrid] = {}
+
+    # ------------------------------------------------------------------
+    # TurbulenceFeatureExtractor Protocol
+    # ------------------------------------------------------------------
+
+    def extract_features(
+        self,
+        field_data: Dict[str, np.ndarray],
+    ) -> Dict[str, Any]:
+        """난류 특징 추출
+
+        Args:
+            field_data: 물리 장 데이터 ("velocity" 필수)
+
+        Returns:
+            특징 딕셔너리:
+            - energy_spectrum: {"wavenumbers", "energy"} 셸 평균 스펙트럼
+            - kinetic_energy: ½<|u|²>
+            - dissipation_rate: ε
+            - vorticity_stats: {mean, rms, max, flatness, enstrophy}
+            - transition_detection: {re_lambda, taylor_microscale, turbulent}
+            - convection_onset: 온도 장이 있을 때 {heat_flux, temperature_variance, onset}
+            - instability_indicators: {spectral_slope, kolmogorov_scale, integral_scale}
+        """
+        velocity = self._velocity(field_data)
+        grid = self.grid_for(velocity.shape[1:])
+        axes = tuple(range(1, velocity.ndim))
+
+        u_hat = np.fft.rfftn(velocity, axes=axes, norm="forward")
+        power = np.sum(u_hat.real ** 2 + u_hat.imag ** 2, axis=0)  # Σ_i |û_i|²
+
+        energy = 0.5 * grid.shell_sum(power)
+        kinetic_energy = float(energy.sum())
+        dissipation = float(self.viscosity * np.sum(power * grid.k2 * grid.mode_weight))  # 2ν Σ k² E(k)
+
+        vorticity_stats = self._vorticity_stats(u_hat, grid, axes)
+
+        return {
+            "energy_spectrum": {"wavenumbers": grid.wavenumbers, "energy": energy},
+            "kinetic_energy": kinetic_energy,
+            "dissipation_rate": dissipation,
+            "vorticity_stats": vorticity_stats,
+            "transition_detection": self._transition(kinetic_energy, dissipation, velocity.shape[0]),
+            "convection_onset": self._convection(field_data, velocity),
+            "instability_indicators": self._instability(grid, energy, kinetic_energy, dissipation),
+        }
+
+    def compute_risk_indicators(
+        self,
+        features: Dict[str, Any],
+    ) -> Dict[str, float]:
+        """리스크 지표 계산 (모두 0 ~ 1)
+
+        - dissipation: ε / (ε + dissipation_scale)
+        - transition: Re_λ / (Re_λ + transition_re_lambda)
+        - intermittency: 와도 평탄도의 가우시안(3) 초과분 (F - 3) / (F - 3 + 3)
+        - spectral_deviation: 관성 구간 기울기와 -5/3의 차이 |s + 5/3| / (|s + 5/3| + 1)
+
+        Args:
+            features: extract_features() 결과
+
+        Returns:
+            리스크 지표 {indicator_name: risk_value}
+        """
+        epsilon = max(float(features.get("dissipation_rate", 0.0)), 0.0)
+        indicators = {
+            "dissipation": epsilon / (epsilon + self.dissipation_scale),
+        }
+
+        transition = features.get("transition_detection") or {}
+        re_lambda = max(float(transition.get("re_lambda", 0.0)), 0.0)
+        indicators["transition"] = re_lambda / (re_lambda + self.transition_re_lambda)
+
+        flatness = (features.get("vorticity_stats") or {}).get("flatness")
+        if flatness is not None and np.isfinite(flatness):
+            excess = max(flatness - 3.0, 0.0)
+            indicators["intermittency"] = excess / (excess + 3.0)
+
+        slope = (features.get("instability_indicators") or {}).get("spectral_slope")
+        if slope is not None and np.isfinite(slope):
+            deviation = abs(slope + 5.0 / 3.0)
+            indicators["spectral_deviation"] = deviation / (deviation + 1.0)
+
+        return indicators
+
+    def reduce_tile_features(self, partials: Sequence[Dict[str, float]]) -> Dict[str, Any]:
+        """타일 부분 통계 축약 (PhysicsPipeline.process_tiled 연동)
+
+        유한 차분 통계를 축약한 뒤 전이 판정과 Kolmogorov 스케일을 추가.
+        스펙트럼 기반 지표(energy_spectrum, spectral_slope)는 계산하지 않음.
+
+        Args:
+            partials: physics_pipeline.tile_statistics() 결과 리스트
+
+        Returns:
+            특징 딕셔너리 (compute_risk_indicators 입력과 호환)
+        """
+        features = reduce_tile_statistics(list(partials), self.viscosity)
+        if not partials:
+            return features
+        kinetic_energy, dissipation = features["kinetic_energy"], features["dissipation_rate"]
+        features["transition_detection"] = self._transition(kinetic_energy, dissipation, partials[0]["dims"])
+        features["instability_indicators"] = {
+            "kolmogorov_scale": float((self.viscosity ** 3 / dissipation) ** 0.25) if dissipation > 0 else float("inf"),
+        }
+        return features
+
+    # ------------------------------------------------------------------
+    # 격자 캐시
+    # ------------------------------------------------------------------
+
+    def grid_for(self, shape: Tuple[int, ...]) -> SpectralGrid:
+        """격자 shape에 대한 파수 정보 반환 (캐시)"""
+        shape = tuple(int(n) for n in shape)
+        lengths = self._lengths(len(shape))
+        key = (shape, lengths)
+        grid = self._grids.get(key)
+        if grid is None:
+            if len(self._grids) >= self.max_cached_grids:
+                self._grids.pop(next(iter(self._grids)))
+            grid = self._grids[key] = SpectralGrid(shape, lengths)
+        return grid
+
+    def _lengths(self, ndim: int) -> Tuple[float, ...]:
+        if np.isscalar(self.domain_length):
+            return (float(self.domain_length),) * ndim
+        lengths = tuple(float(length) for length in self.domain_length)
+        if len(lengths) != ndim:
+            raise ValueError(f"domain_length 차원({len(lengths)})이 격자 차원({ndim})과 다릅니다.")
+        return lengths
+
+    # ------------------------------------------------------------------
+    # 내부 계산
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _velocity(field_data: Dict[str, np.ndarray]) -> np.ndarray:
+        """속도 장을 성분 우선 배열로 변환"""
+        if "velocity" not in field_data:
+            raise KeyError("field_data에 'velocity'가 없습니다.")
+        velocity = np.asarray(field_data["velocity"])
+        spatial = velocity.ndim - 1
+        if spatial not in (2, 3):
+            raise ValueError(f"2D/3D 속도 장만 지원합니다: shape {velocity.shape}")
+        if velocity.shape[0] != spatial and velocity.shape[-1] == spatial:
+            velocity = np.moveaxis(velocity, -1, 0)
+        if velocity.shape[0] != spatial:
+            raise ValueError(f"속도 성분 수({velocity.shape[0]})가 공간 차원({spatial})과 다릅니다.")
+        return velocity
+
+    def _vorticity_stats(
+        self,
+        u_hat: np.ndarray,
+        grid: SpectralGrid,
+        axes: Tuple[int, ...],
+    ) -> Dict[str, float]:
+        """스펙트럼 미분으로 와도 통계 계산"""
+        k = grid.axis_k
+        if len(k) == 2:
+            # ω = ∂v/∂x - ∂u/∂y (스칼라)
+            omega_hat = 1j * (k[0] * u_hat[1] - k[1] * u_hat[0])
+            omega_power = omega_hat.real ** 2 + omega_hat.imag ** 2
+        else:
+            # ω = ∇ × u
+            omega_hat = np.stack([
+                1j * (k[1] * u_hat[2] - k[2] * u_hat[1]),
+                1j * (k[2] * u_hat[0] - k[0] * u_hat[2]),
+                1j * (k[0] * u_hat[1] - k[1] * u_hat[0]),
+            ])
+            omega_power = np.sum(omega_hat.real ** 2 + omega_hat.imag ** 2, axis=0)
+
+        mean_square = float(np.sum(omega_power * grid.mode_weight))  # <|ω|²> (Parseval)
+        stats = {
+            "rms": float(np.sqrt(mean_square)),
+            "enstrophy": 0.5 * mean_square,
+        }
+
+        if self.compute_vorticity_field:
+            if omega_hat.ndim == len(axes):
+                magnitude = np.abs(np.fft.irfftn(
+                    omega_hat, s=grid.shape, axes=tuple(range(len(axes))), norm="forward",
+                ))
+            else:
+                field = np.fft.irfftn(omega_hat, s=grid.shape, axes=axes, norm="forward")
+                magnitude = np.sqrt(np.sum(field ** 2, axis=0))
+            squared = magnitude ** 2
+            second = float(squared.mean())
+            stats["mean"] = float(magnitude.mean())
+            stats["max"] = float(magnitude.max())
+            stats["flatness"] = float((squared ** 2).mean() / second ** 2) if second > 0 else float("nan")
+
+        return stats
+
+    def _transition(self, kinetic_energy: float, dissipation: float, dims: int) -> Dict[str, Any]:
+        """Taylor 마이크로스케일 기반 전이 판정"""
+        u_prime_sq = 2.0 * kinetic_energy / dims
+        if dissipation <= 0.0 or u_prime_sq <= 0.0:
+            return {"re_lambda": 0.0, "taylor_microscale": float("inf"), "turbulent": False}
+        taylor = float(np.sqrt(15.0 * self.viscosity * u_prime_sq / dissipation))
+        re_lambda = float(np.sqrt(u_prime_sq) * taylor / self.viscosity)
+        return {
+            "re_lambda": re_lambda,
+            "taylor_microscale": taylor,
+            "turbulent": re_lambda >= self.transition_re_lambda,
+        }
+
+    @staticmethod
+    def _convection(field_data: Dict[str, np.ndarray], velocity: np.ndarray) -> Optional[Dict[str, Any]]:
+        """온도 장이 있으면 대류 지표 계산 (마지막 속도 성분을 연직 방향으로 가정)"""
+        temperature = field_data.get("temperature")
+        if temperature is None:
+            return None
+        temperature = np.asarray(temperature)
+        fluctuation = temperature - temperature.mean()
+        heat_flux = float(np.mean(velocity[-1] * fluctuation))
+        return {
+            "heat_flux": heat_flux,
+            "temperature_variance": float(np.mean(fluctuation ** 2)),
+            "onset": heat_flux > 0.0,
+        }
+
+    def _instability(
+        self,
+        grid: SpectralGrid,
+        energy: np.ndarray,
+        kinetic_energy: float,
+        dissipation: float,
+    ) -> Dict[str, float]:
+        """스펙트럼 형태 및 특성 길이"""
+        k = grid.wavenumbers
+        # 관성 구간 근사: 2번째 셸 ~ 최대 셸의 1/3
+        upper = max(3, grid.n_shells // 3)
+        band = slice(2, upper)
+        k_band, e_band = k[band], energy[band]
+        mask = e_band > 0
+        if np.count_nonzero(mask) >= 2:
+            slope = float(np.polyfit(np.log(k_band[mask]), np.log(e_band[mask]), 1)[0])
+        else:
+            slope = float("nan")
+
+        nonzero = k > 0
+        integral = (
+            float(np.pi / (2.0 * kinetic_energy) * np.sum(energy[nonzero] / k[nonzero]))
+            if kinetic_energy > 0 else 0.0
+        )
+        kolmogorov = float((self.viscosity ** 3 / dissipation) ** 0.25) if dissipation > 0 else float("inf")
+        return {
+            "spectral_slope": slope,
+            "kolmogorov_scale": kolmogorov,
+            "integral_scale": integral,
+        }
@@ -0,0 +1,150 @@
+"""
+배치 사이클 / 요청 결합기 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+import threading
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core import BrainCore, GlobalState, CycleBatcher
+from brain_core.state_centric_execution_loop import StateCentricExecutionLoop
+
+
+class DecayEngine:
+    """상태 벡터를 0으로 감쇠시키는 결정적 엔진"""
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        state.state_vector = state.state_vector * 0.5
+        state.energy = float(np.sum(state.state_vector ** 2))
+        return state
+
+
+class BatchDecayEngine(DecayEngine):
+    """update_batch를 제공하는 엔진"""
+    
+    def __init__(self):
+        self.batch_sizes = []
+    
+    def update_batch(self, states):
+        self.batch_sizes.append(len(states))
+        return [self.update(state) for state in states]
+
+
+class TestRunBatch:
+    """StateCentricExecutionLoop.run_batch 테스트"""
+    
+    def test_matches_single_runs(self):
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        engines = {"decay": DecayEngine()}
+        states = [GlobalState(state_vector=np.full(3, float(i + 1))) for i in range(4)]
+        
+        batched = loop.run_batch(states, engines, max_steps=50, convergence_threshold=1e-3)
+        single = [loop.run_cycle(state, engines, max_steps=50, convergence_threshold=1e-3)[0] for state in states]
+        
+        for b, s in zip(batched, single):
+            np.testing.assert_allclose(b.state_vector, s.state_vector)
+            assert b.step == s.step
+    
+    def test_native_batch_method_used(self):
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        engine = BatchDecayEngine()
+        states = [GlobalState(state_vector=np.full(2, float(i + 1))) for i in range(3)]
+        
+        loop.run_batch(states, {"decay": engine}, max_steps=3)
+        
+        assert engine.batch_sizes[0] == 3
+
+    
+    def test_failed_batch_update_not_applied_twice(self):
+        """update_batch가 일부 상태를 변경한 뒤 실패해도 상태별로 재적용하지 않음"""
+        class PartialFailEngine(DecayEngine):
+            def update_batch(self, states):
+                self.update(states[0])
+                raise RuntimeError("partial failure")
+        
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        states = [GlobalState(state_vector=np.full(2, 4.0)) for _ in range(2)]
+        
+        final = loop.run_batch(states, {"decay": PartialFailEngine()}, max_steps=3)
+        
+        np.testing.assert_allclose(final[0].state_vector, np.full(2, 2.0))
+        np.testing.assert_allclose(final[1].state_vector, np.full(2, 4.0))
+        assert loop.last_cycle_info["status"] == "error"
+
+class TestCycleBatcher:
+    """CycleBatcher 테스트"""
+    
+    def test_concurrent_requests_coalesced(self):
+        core = BrainCore(mode="production", enable_logging=False)
+        core.register_engine("decay", DecayEngine(), priority=1)
+        results = {}
+        
+        with CycleBatcher(core, max_batch_size=8, max_wait=0.05) as batcher:
+            def worker(i):
+                state = GlobalState(state_vector=np.full(2, float(i + 1)))
+                results[i] = batcher.run_cycle(state, max_steps=5, timeout=5.0)
+            
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert len(results) == 8
+        for i, result in results.items():
+            assert result["success"] is True
+            np.testing.assert_allclose(result["final_state"].state_vector, np.full(2, (i + 1) * 0.5 ** 5))
+        assert batcher.get_stats()["batches"] < 8
+    
+    def test_deadline_passed_to_batch(self):
+        core = BrainCore(mode="production", enable_logging=False)
+        core.register_engine("decay", DecayEngine(), priority=1)
+        
+        with CycleBatcher(core, max_wait=0.0) as batcher:
+            result = batcher.run_cycle(GlobalState(state_vector=np.ones(2)), max_steps=5,
+                                       timeout=5.0, deadline=0.0)
+            relaxed = batcher.run_cycle(GlobalState(state_vector=np.ones(2)), max_steps=5,
+                                        timeout=5.0, deadline=10.0)
+        
+        assert result["deadline_exceeded"] is True
+        np.testing.assert_allclose(result["final_state"].state_vector, np.ones(2))
+        assert relaxed["deadline_exceeded"] is False
+        assert relaxed["timings"]["deadline"] == 10.0
+    
+    def test_malformed_request_fails_alone(self):
+        """잘못된 상태는 해당 요청만 실패하고 워커는 계속 실행"""
+        core = BrainCore(mode="production", enable_logging=False)
+        core.register_engine("decay", DecayEngine(), priority=1)
+        bad = GlobalState(state_vector=np.ones(2))
+        bad.state_vector = [[1.0, 2.0], [3.0]]  # ragged
+        
+        with CycleBatcher(core, max_wait=0.05) as batcher:
+            bad_future = batcher.submit(bad, max_steps=1)
+            good_future = batcher.submit(GlobalState(state_vector=np.ones(2)), max_steps=1)
+            with pytest.raises(ValueError):
+                bad_future.result(timeout=5.0)
+            assert good_future.result(timeout=5.0)["success"] is True
+            
+            later = batcher.run_cycle(GlobalState(state_vector=np.ones(2)), max_steps=1, timeout=5.0)
+            assert later["success"] is True
+            assert batcher._worker.is_alive()
+    
+    def test_submit_after_close(self):
+        core = BrainCore(mode="production", enable_logging=False)
+        batcher = CycleBatcher(core)
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit(GlobalState(state_vector=np.zeros(2)))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
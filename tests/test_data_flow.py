@@ -12,8 +12,10 @@ from pathlib import Path
 brain_core_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(brain_core_path))
 
-from brain_core.data_flow import DataFlowManager
-from brain_core.interfaces import DataConverter, StateSynchronizer
+import numpy as np
+
+from brain_core.data_flow import DataFlowManager, estimate_size
+from brain_core.interfaces import DataConverter, ConverterRegistry, StateSynchronizer
 
 
 class TestDataFlowManager:
@@ -83,6 +85,30 @@ class TestDataFlowManager:
         assert stats["total_transfers"] == 5
         assert "engine_stats" in stats
     
+    def test_bounded_history_with_cumulative_statistics(self):
+        """이력은 상한 유지, 통계는 누적"""
+        manager = DataFlowManager(mode="research", enable_logging=False, history_size=3)
+        
+        for i in range(10):
+            manager.transfer(
+                source_data={"value": 0.1},
+                source_engine="thalamus",
+                target_engine="amygdala" if i % 2 else "memory",
+            )
+        
+        stats = manager.get_flow_statistics()
+        assert len(manager.flow_history) == 3
+        assert stats["total_transfers"] == 10
+        assert stats["engine_stats"]["thalamus→amygdala"]["count"] == 5
+        assert stats["engine_stats"]["thalamus→memory"]["latency"]["count"] == 5
+    
+    def test_estimate_size(self):
+        """구조적 크기 근사"""
+        array = np.zeros(1000)
+        assert estimate_size(array) == 8000
+        assert estimate_size({"a": array}) >= 8000
+        assert estimate_size("abc") == 3
+    
     def test_reset(self):
         """리셋 테스트"""
         manager = DataFlowManager(mode="research")
@@ -134,6 +160,184 @@ class TestDataConverter:
         assert error is not None
 
 
+class TestCompiledSchemas:
+    """컴파일된 스키마 검사 테스트"""
+    
+    def test_compiled_validator(self):
+        """키/스칼라/배열 범위 검사"""
+        validator = DataConverter.compile_schema(
+            expected_keys=["value", "signal"],
+            value_ranges={"value": (0.0, 1.0), "signal": (-1.0, 1.0)},
+        )
+        
+        assert validator({"value": 0.5, "signal": np.linspace(-1, 1, 50)}) == (True, None)
+        assert validator({"value": 0.5})[0] is False
+        assert validator({"value": 1.5, "signal": np.zeros(3)})[0] is False
+        assert validator({"value": 0.5, "signal": np.array([0.0, 2.0])})[0] is False
+        assert validator({"value": 0.5, "signal": np.array([0.0, np.nan])})[0] is False
+    
+    def test_numpy_scalars_and_nan_rejected(self):
+        """numpy 스칼라도 범위 검사, NaN 스칼라는 위반"""
+        validator = DataConverter.compile_schema(value_ranges={"value": (0.0, 1.0)})
+        
+        assert validator({"value": np.float32(0.5)}) == (True, None)
+        assert validator({"value": np.float32(1.5)})[0] is False
+        assert validator({"value": np.int32(2)})[0] is False
+        assert validator({"value": float("nan")})[0] is False
+        assert validator({"value": np.float64("nan")})[0] is False
+        assert DataConverter.validate({"value": np.float32(1.5)}, value_ranges={"value": (0.0, 1.0)})[0] is False
+        assert DataConverter.validate({"value": float("nan")}, value_ranges={"value": (0.0, 1.0)})[0] is False
+    
+    def test_edge_schema_in_transfer(self):
+        """엔진 쌍별 스키마 적용"""
+        manager = DataFlowManager(mode="research", enable_logging=False)
+        manager.register_schema("thalamus", "amygdala", value_ranges={"value": (0.0, 1.0)})
+        
+        result = manager.transfer({"value": 1.5}, "thalamus", "amygdala")
+        assert "_validation_error" in result
+        
+        # 다른 edge에는 적용되지 않음
+        result = manager.transfer({"value": 1.5}, "thalamus", "memory")
+        assert "_validation_error" not in result
+    
+    def test_execution_loop_supplies_schemas(self):
+        """ExecutionLoop가 엔진 input_schema를 등록"""
+        from brain_core.execution_loop import ExecutionLoop
+        from brain_core.engine_adapters import MockEngineAdapter
+        
+        source = MockEngineAdapter("source", process_func=lambda x: {"value": 2.0})
+        target = MockEngineAdapter("target", process_func=lambda x: {"seen": x["value"]})
+        target.input_schema = {"value_ranges": {"value": (0.0, 1.0)}}
+        
+        manager = DataFlowManager(mode="research", enable_logging=False)
+        loop = ExecutionLoop(mode="production", enable_logging=False, data_flow=manager)
+        loop.execute({"value": 0.1}, {"source": source, "target": target})
+        
+        assert manager.has_schema("source", "target")
+        assert "_validation_error" in manager.transfer({"value": 2.0}, "source", "target")
+        assert "_validation_error" not in manager.transfer({"value": 0.5}, "source", "target")
+
+
+class TestZeroCopyHandoff:
+    """zero-copy 전달 테스트"""
+    
+    def test_arrays_shared_read_only(self):
+        """배열은 복사 없이 읽기 전용으로 전달"""
+        from brain_core.execution_loop import ExecutionLoop
+        from brain_core.engine_adapters import MockEngineAdapter
+        
+        payload = np.arange(1000.0)
+        seen = {}
+        
+        def reader(data):
+            seen["signal"] = data["signal"]
+            return {"signal": data["signal"]}
+        
+        source = MockEngineAdapter("source", process_func=lambda x: {"signal": payload})
+        target = MockEngineAdapter("target", process_func=reader)
+        loop = ExecutionLoop(mode="production", enable_logging=False, handoff="zero_copy")
+        result = loop.execute({}, {"source": source, "target": target})
+        
+        assert result["success"] is True
+        assert np.shares_memory(seen["signal"], payload)
+        assert not seen["signal"].flags.writeable
+        assert payload.flags.writeable  # 원본은 그대로
+        
+        # 최종 출력은 호출자가 수정할 수 있는 일반 dict
+        assert type(result["output"]) is dict
+        result["output"]["signal"][0] = -1.0
+        assert payload[0] == 0.0
+    
+    def test_mutation_requires_declaration(self):
+        """수정을 선언한 엔진만 복사본을 받음"""
+        from brain_core.execution_loop import ExecutionLoop
+        from brain_core.engine_adapters import MockEngineAdapter
+        
+        payload = np.zeros(4)
+        
+        def mutate(data):
+            data["signal"][0] = 1.0
+            return data
+        
+        source = MockEngineAdapter("source", process_func=lambda x: {"signal": payload})
+        undeclared = MockEngineAdapter("undeclared", process_func=mutate)
+        loop = ExecutionLoop(mode="production", enable_logging=False, handoff="zero_copy")
+        
+        result = loop.execute({}, {"source": source, "undeclared": undeclared})
+        assert result["output"]["error"] is True  # 읽기 전용 위반
+        
+        declared = MockEngineAdapter("declared", process_func=mutate)
+        declared.mutates_input = True
+        result = loop.execute({}, {"source": source, "declared": declared})
+        assert result["output"]["signal"][0] == 1.0
+        assert payload[0] == 0.0
+    
+    def test_reference_synchronizer(self):
+        """참조 + 버전 스탬프 기록"""
+        synchronizer = StateSynchronizer(record="reference")
+        state = {"value": 0.5}
+        
+        synchronizer.update_state("thalamus", state)
+        synchronizer.update_state("thalamus", state)
+        
+        assert synchronizer.engine_states["thalamus"] is state
+        assert synchronizer.get_synchronized_state()["versions"] == {"thalamus": 2}
+        assert "state" not in synchronizer.sync_history[-1]
+
+
+class TestConverterRegistry:
+    """엔진 쌍 변환 레지스트리 테스트"""
+    
+    def test_direct_converter_applied(self):
+        manager = DataFlowManager(mode="production", enable_logging=False)
+        manager.register_converter(
+            "thalamus", "amygdala",
+            lambda data: {"stimulus": data["filtered"], "salience": data.get("gain", 1.0)},
+        )
+        
+        result = manager.transfer({"filtered": [1, 2], "gain": 0.5}, "thalamus", "amygdala")
+        
+        assert result == {"stimulus": [1, 2], "salience": 0.5}
+        # 등록되지 않은 쌍은 기본 복사
+        other = {"value": 1}
+        assert manager.transfer(other, "amygdala", "memory") == other
+    
+    def test_shortest_chain_resolved(self):
+        registry = ConverterRegistry()
+        registry.register("a", "b", lambda d: {**d, "path": d["path"] + "b"})
+        registry.register("b", "c", lambda d: {**d, "path": d["path"] + "c"})
+        registry.register("c", "d", lambda d: {**d, "path": d["path"] + "d"})
+        registry.register("b", "d", lambda d: {**d, "path": d["path"] + "D"})
+        
+        plan = registry.resolve("a", "d")
+        
+        assert len(plan) == 2
+        assert DataConverter.convert({"path": "a"}, plan=plan) == {"path": "abD"}
+        assert registry.resolve("d", "a") == ()
+    
+    def test_plan_cached_and_invalidated(self):
+        registry = ConverterRegistry()
+        registry.register("a", "b", lambda d: d)
+        
+        plan = registry.resolve("a", "b")
+        assert registry.resolve("a", "b") is plan
+        
+        registry.register("a", "b", lambda d: {"replaced": True})
+        assert DataConverter.convert({}, plan=registry.resolve("a", "b")) == {"replaced": True}
+        
+        assert registry.unregister("a", "b")
+        assert registry.resolve("a", "b") == ()
+    
+    def test_converter_does_not_mutate_source(self):
+        manager = DataFlowManager(mode="production", enable_logging=False)
+        manager.register_converter("a", "b", lambda d: {"scaled": d["value"] * 2})
+        source = {"value": 3}
+        
+        manager.transfer(source, "a", "b", copy=False)
+        
+        assert source == {"value": 3}
+
+
 class TestStateSynchronizer:
     """StateSynchronizer 테스트"""
     
@@ -166,6 +370,48 @@ class TestStateSynchronizer:
         
         assert len(synchronizer.engine_states) == 0
         assert len(synchronizer.sync_history) == 0
+    
+    def test_history_stores_deltas(self):
+        """변경된 키만 이력에 기록"""
+        synchronizer = StateSynchronizer()
+        big = np.zeros(1000)
+        
+        synchronizer.update_state("thalamus", {"field": big, "value": 0.5, "tag": "a"})
+        synchronizer.update_state("thalamus", {"field": big, "value": 0.7})
+        
+        entry = synchronizer.sync_history[-1]
+        assert entry["delta"] == {"value": 0.7}
+        assert entry["removed"] == ("tag",)
+    
+    def test_history_bounded_and_reconstructs(self):
+        """이력 한도 초과 후에도 보관 범위 안의 과거 상태 복원"""
+        synchronizer = StateSynchronizer(history_size=5)
+        for i in range(1, 21):
+            state = {"step": i, "constant": "x"}
+            if i % 2 == 0:
+                state["even"] = True
+            synchronizer.update_state("memory", state)
+            synchronizer.update_state("other", {"step": i})
+        
+        assert len(synchronizer.sync_history) == 5
+        assert synchronizer.get_state_at("memory", 20) == {"step": 20, "constant": "x", "even": True}
+        assert synchronizer.get_state_at("memory", 19) == {"step": 19, "constant": "x"}
+        assert synchronizer.get_state_at("memory", 18) == {"step": 18, "constant": "x", "even": True}
+        assert synchronizer.get_state_at("memory", 17) is None
+        assert synchronizer.get_state_at("missing", 1) is None
+    
+    def test_incremental_synchronized_state(self):
+        """since 이후 바뀐 엔진만 반환"""
+        synchronizer = StateSynchronizer()
+        synchronizer.update_state("thalamus", {"value": 0.5})
+        synchronizer.update_state("amygdala", {"value": 0.6})
+        first = synchronizer.get_synchronized_state()
+        
+        synchronizer.update_state("amygdala", {"value": 0.9})
+        changed = synchronizer.get_synchronized_state(since=first["versions"])
+        
+        assert list(changed["engines"]) == ["amygdala"]
+        assert changed["versions"] == {"thalamus": 1, "amygdala": 2}
 
 
 if __name__ == "__main__":
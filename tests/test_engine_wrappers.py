@@ -21,6 +21,7 @@ from brain_core.engine_wrappers import (
     NeuralDynamicsCoreWrapper,
     HistoricalDataReconstructorWrapper,
     CingulateCortexEngineWrapper,
+    PhysicsPipelineBridge,
 )
 
 
@@ -195,6 +196,143 @@ class TestEngineWrappers:
         assert updated_state.risk >= 0.0
 
 
+class StubPipeline:
+    """시간에 비례하는 위험도를 내는 파이프라인 (호출 기록)"""
+
+    def __init__(self, fail_at=None):
+        self.calls = []
+        self.fail_at = fail_at
+
+    def process(self, parameters, time=0.0):
+        self.calls.append(time)
+        if time == self.fail_at:
+            raise RuntimeError("solver diverged")
+        risk = min(1.0, 0.1 * time * parameters.get("gain", 1.0))
+        return {
+            "risk_indicators": {"transition": risk},
+            "risk_map": {"transition": risk},
+            "failure_atlas": {"collapse_zones": {"transition": risk}.keys() if risk >= 0.7 else [],
+                              "stable_regions": [], "threshold": 0.7},
+        }
+
+
+class TestPhysicsPipelineBridge:
+    """PhysicsPipeline 브릿지 엔진 테스트"""
+
+    def _state(self):
+        state = GlobalState(state_vector=np.zeros(2))
+        state.set_extension("L1", {"risk_map": {"manifold_zone": 0.4}, "dimensions": {}})
+        return state
+
+    def test_publishes_latest_snapshot_into_l1(self):
+        bridge = PhysicsPipelineBridge(StubPipeline(), {"gain": 2.0}, times=[1.0, 4.0])
+        bridge.start()
+        bridge.stop(timeout=5.0)
+
+        state = bridge.update(self._state())
+
+        assert state.risk_map == {"manifold_zone": 0.4, "physics:transition": pytest.approx(0.8)}
+        l1 = state.get_extension("L1")
+        assert l1["failure_atlas"]["collapse_zones"] == ["transition"]
+        assert l1["physics"]["version"] == 2 and l1["physics"]["time"] == 4.0
+        assert "dimensions" in l1
+
+    def test_update_does_not_recompute_or_block(self):
+        pipeline = StubPipeline()
+        bridge = PhysicsPipelineBridge(pipeline, times=[1.0])
+        state = self._state()
+
+        state = bridge.update(state)  # 자동 시작, 결과 대기 안 함
+        assert bridge.wait_for_result(timeout=5.0)
+        for _ in range(5):
+            state = bridge.update(state.copy())
+
+        assert pipeline.calls == [1.0]
+        assert state.risk_map["physics:transition"] == pytest.approx(0.1)
+        bridge.stop(timeout=5.0)
+
+    def test_new_version_replaces_physics_entries(self):
+        bridge = PhysicsPipelineBridge(StubPipeline(), prefix="cfd:", autostart=False)
+        state = self._state()
+        bridge._latest = bridge._snapshot({"risk_map": {"a": 0.2, "b": 0.3}}, 0.0, 1)
+        state = bridge.update(state)
+        shared_l1 = state.get_extension("L1")
+
+        bridge._latest = bridge._snapshot({"risk_map": {"b": 0.9}}, 1.0, 2)
+        state = bridge.update(state)
+
+        assert state.risk_map == {"manifold_zone": 0.4, "cfd:b": 0.9}
+        assert shared_l1["risk_map"]["cfd:a"] == 0.2  # 이전 L1 dict는 변경되지 않음
+
+    def test_background_error_reported_once(self):
+        bridge = PhysicsPipelineBridge(StubPipeline(fail_at=2.0), times=[1.0, 2.0, 3.0])
+        bridge.start()
+        bridge.stop(timeout=5.0)
+
+        state = bridge.update(self._state())
+        assert isinstance(bridge.last_error, RuntimeError)
+        assert state.get_extension("L1")["physics"]["time"] == 3.0
+
+        bridge.update(state)
+        assert bridge.last_error is None
+        assert bridge.get_state()["errors"] == 1
+
+    def test_incremental_builder_snapshot_published(self):
+        from brain_core.failure_atlas import IncrementalRiskMap
+
+        class IncrementalStub(StubPipeline):
+            def __init__(self):
+                super().__init__()
+                self.atlas_builder = IncrementalRiskMap(threshold=0.5)
+
+            def process(self, parameters, time=0.0):
+                result = super().process(parameters, time)
+                return {"risk_indicators": result["risk_indicators"],
+                        "risk_update": self.atlas_builder.update(result["risk_indicators"])}
+
+        bridge = PhysicsPipelineBridge(IncrementalStub(), times=[2.0, 6.0])
+        bridge.start()
+        bridge.stop(timeout=5.0)
+
+        state = bridge.update(self._state())
+        assert state.risk_map["physics:transition"] == pytest.approx(0.6)
+        assert state.get_extension("L1")["failure_atlas"]["collapse_zones"] == ["transition"]
+
+    def test_unbounded_times_require_positive_interval(self):
+        assert PhysicsPipelineBridge(StubPipeline(), autostart=False).interval == 1.0
+        assert PhysicsPipelineBridge(StubPipeline(), times=[1.0], autostart=False).interval == 0.0
+        with pytest.raises(ValueError):
+            PhysicsPipelineBridge(StubPipeline(), interval=0.0)
+
+    def test_times_iterator_error_reported(self):
+        def times():
+            yield 1.0
+            raise RuntimeError("clock source failed")
+
+        bridge = PhysicsPipelineBridge(StubPipeline(), times=times(), autostart=False)
+        bridge.start()
+        bridge._thread.join(timeout=5.0)
+
+        assert not bridge.running
+        state = bridge.update(self._state())
+        assert isinstance(bridge.last_error, RuntimeError)
+        assert state.get_extension("L1")["physics"]["time"] == 1.0
+        assert bridge.get_state()["errors"] == 1
+
+    def test_in_state_centric_loop(self):
+        from brain_core.state_centric_execution_loop import StateCentricExecutionLoop
+
+        bridge = PhysicsPipelineBridge(StubPipeline(), times=[5.0], autostart=False)
+        bridge.start()
+        assert bridge.wait_for_result(timeout=5.0)
+        loop = StateCentricExecutionLoop(enable_logging=False)
+
+        final_state, _ = loop.run_cycle(self._state(), {"physics_bridge": bridge}, max_steps=3)
+
+        assert final_state.risk_map["physics:transition"] == pytest.approx(0.5)
+        bridge.stop(timeout=5.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
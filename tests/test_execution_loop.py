@@ -0,0 +1,187 @@
+"""
+ExecutionLoop 스트리밍 / EngineAdapter 배치 처리 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core.execution_loop import ExecutionLoop
+from brain_core.engine_adapters import EngineAdapter, MockEngineAdapter
+
+
+def _slow_stage(name, delay, active, overlap):
+    """처리 중인 엔진 수를 기록하는 느린 단계"""
+    def process(data):
+        with active["lock"]:
+            active["count"] += 1
+            overlap["max"] = max(overlap["max"], active["count"])
+        time.sleep(delay)
+        with active["lock"]:
+            active["count"] -= 1
+        return {"value": data["value"], "path": data.get("path", ()) + (name,)}
+    return MockEngineAdapter(name, process_func=process)
+
+
+class TestExecuteStream:
+    """execute_stream 테스트"""
+    
+    def test_order_preserved_and_stages_overlap(self):
+        active = {"count": 0, "lock": threading.Lock()}
+        overlap = {"max": 0}
+        engines = {
+            "thalamus": _slow_stage("thalamus", 0.01, active, overlap),
+            "amygdala": _slow_stage("amygdala", 0.01, active, overlap),
+            "memory": _slow_stage("memory", 0.01, active, overlap),
+        }
+        loop = ExecutionLoop(mode="production", enable_logging=False)
+        
+        results = list(loop.execute_stream(({"value": i} for i in range(10)), engines, queue_size=2))
+        
+        assert [r["output"]["value"] for r in results] == list(range(10))
+        assert all(r["output"]["path"] == ("thalamus", "amygdala", "memory") for r in results)
+        assert overlap["max"] > 1  # 서로 다른 단계가 동시에 실행됨
+    
+    def test_matches_execute(self):
+        engines = {
+            "double": MockEngineAdapter("double", process_func=lambda x: {"value": x["value"] * 2}),
+            "inc": MockEngineAdapter("inc", process_func=lambda x: {"value": x["value"] + 1}),
+        }
+        loop = ExecutionLoop(mode="production", enable_logging=False)
+        
+        streamed = list(loop.execute_stream(({"value": i} for i in range(5)), engines))
+        
+        assert streamed == [loop.execute({"value": i}, engines) for i in range(5)]
+    
+    def test_backpressure_bounds_consumption(self):
+        consumed = []
+        
+        def inputs():
+            for i in range(1000):
+                consumed.append(i)
+                yield {"value": i}
+        
+        engines = {"noop": MockEngineAdapter("noop")}
+        loop = ExecutionLoop(mode="production", enable_logging=False)
+        stream = loop.execute_stream(inputs(), engines, queue_size=2)
+        next(stream)
+        time.sleep(0.1)
+        
+        assert len(consumed) < 20
+        stream.close()
+    
+    def test_research_mode_raises(self):
+        def fail(data):
+            raise RuntimeError("boom")
+        
+        class RaisingEngine:
+            def process(self, data):
+                return fail(data)
+        
+        loop = ExecutionLoop(mode="research", enable_logging=False)
+        with pytest.raises(RuntimeError):
+            list(loop.execute_stream([{"value": 1}], {"bad": RaisingEngine()}))
+    
+    def test_production_error_isolated_per_input(self):
+        class FlakyEngine:
+            def process(self, data):
+                if data["value"] == 1:
+                    raise RuntimeError("boom")
+                return data
+        
+        loop = ExecutionLoop(mode="production", enable_logging=False)
+        results = list(loop.execute_stream([{"value": v} for v in range(3)], {"flaky": FlakyEngine()}))
+        
+        assert [r.get("error", False) for r in results] == [False, True, False]
+
+
+class TestProcessMany:
+    """EngineAdapter.process_many 테스트"""
+    
+    def test_uses_native_batch_method(self):
+        class BatchEngine:
+            def __init__(self):
+                self.batch_calls = 0
+            
+            def process(self, data):
+                raise AssertionError("배치 메서드가 있으면 단건 처리를 호출하지 않음")
+            
+            def process_batch(self, inputs):
+                self.batch_calls += 1
+                return [{"value": x["value"] * 10} for x in inputs]
+        
+        engine = BatchEngine()
+        adapter = EngineAdapter(engine, "batch", enable_logging=False)
+        
+        outputs = adapter.process_many([{"value": i} for i in range(4)])
+        
+        assert [o["value"] for o in outputs] == [0, 10, 20, 30]
+        assert engine.batch_calls == 1
+    
+    def test_loop_fallback_resolved_once(self):
+        class RunEngine:
+            def run(self, data):
+                return data["value"] + 1
+        
+        engine = RunEngine()
+        adapter = EngineAdapter(engine, "run", enable_logging=False)
+        engine.process = lambda data: {"late": True}  # 생성 후 추가된 메서드는 무시됨
+        
+        assert adapter.process_many([{"value": 1}, {"value": 2}]) == [{"output": 2}, {"output": 3}]
+        assert adapter.process({"value": 5}) == {"output": 6}
+    
+    def test_production_batch_error_not_retried(self):
+        """배치가 일부 적용 후 실패해도 건별 재처리하지 않음 (상태 이중 적용 방지)"""
+        class StatefulBatchEngine:
+            def __init__(self):
+                self.total = 0
+            
+            def process(self, data):
+                self.total += data["value"]
+                return {"total": self.total}
+            
+            def process_batch(self, inputs):
+                outputs = []
+                for data in inputs:
+                    if data["value"] < 0:
+                        raise ValueError("negative")
+                    outputs.append(self.process(data))
+                return outputs
+        
+        engine = StatefulBatchEngine()
+        adapter = EngineAdapter(engine, "stateful", enable_logging=False)
+        outputs = adapter.process_many([{"value": 1}, {"value": 2}, {"value": -1}, {"value": 4}])
+        
+        assert engine.total == 3  # 실패 전 적용분만 (재처리 없음)
+        assert all(output["error"] is True for output in outputs)
+        assert outputs[0] is not outputs[1]
+    
+    def test_research_batch_error_raises(self):
+        class BadBatchEngine:
+            def process(self, data):
+                return data
+            
+            def process_many(self, inputs):
+                return []  # 결과 수 불일치
+        
+        adapter = EngineAdapter(BadBatchEngine(), "bad", mode="research", enable_logging=False)
+        with pytest.raises(ValueError):
+            adapter.process_many([{"value": 1}])
+    
+    def test_default_process_many_on_base(self):
+        adapter = MockEngineAdapter("double", process_func=lambda x: {"value": x["value"] * 2})
+        
+        assert adapter.process_many([{"value": 1}, {"value": 3}]) == [{"value": 2}, {"value": 6}]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
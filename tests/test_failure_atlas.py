@@ -0,0 +1,183 @@
+"""
+Failure Atlas 테스트
+
+붕괴 영역 공간 인덱스 및 증분 위험 지형 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+import json
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core.physics_pipeline import PhysicsPipeline
+from brain_core.turbulence_features import SpectralTurbulenceExtractor
+from brain_core.failure_atlas import FailureAtlasIndex, IncrementalRiskMap
+
+
+def _taylor_green_2d(n: int = 16) -> np.ndarray:
+    x = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    return np.stack([np.sin(X) * np.cos(Y), -np.cos(X) * np.sin(Y)])
+
+
+class GrowingAdapter:
+    """시간에 비례해 진폭이 커지는 Taylor-Green 장"""
+
+    def __init__(self, n=16):
+        self.velocity = _taylor_green_2d(n)
+
+    def generate_field(self, parameters, time=0.0):
+        return {"velocity": self.velocity * time * parameters.get("scale", 1.0)}
+
+    def load_from_file(self, filepath):
+        raise NotImplementedError
+
+
+class TestFailureAtlasIndex:
+    """붕괴 영역 공간 인덱스 테스트"""
+
+    @staticmethod
+    def _random_index(dims, count=200, seed=0):
+        rng = np.random.default_rng(seed)
+        centers = rng.uniform(0, 50, (count, dims))
+        radii = rng.uniform(0, 2, count)
+        index = FailureAtlasIndex(dims)
+        for i, (center, radius) in enumerate(zip(centers, radii)):
+            index.add_zone(i, center, radius)
+        return index, centers, radii, rng
+
+    @pytest.mark.parametrize("dims", [1, 2, 3, 4])
+    def test_queries_match_brute_force(self, dims):
+        index, centers, radii, rng = self._random_index(dims)
+        points = rng.uniform(-10, 60, (500, dims))
+        distance = np.maximum(np.linalg.norm(points[:, None] - centers[None], axis=2) - radii[None], 0.0)
+
+        np.testing.assert_array_equal(index.contains(points), distance.min(axis=1) == 0)
+        _, nearest = index.nearest_many(points)
+        np.testing.assert_allclose(nearest, distance.min(axis=1), rtol=1e-12, atol=1e-12)
+        for point, row in zip(points[:50], distance[:50]):
+            zone_id, d = index.nearest(point)
+            assert d == pytest.approx(row.min())
+            assert sorted(z for z, _ in index.within(point, 3.0)) == np.flatnonzero(row <= 3.0).tolist()
+
+    def test_nearest_many_precise_far_from_origin(self):
+        index = FailureAtlasIndex(2, cell_size=1.0)
+        index.add_zone("far", [1e6, 1e6], 0.0)
+
+        _, distance = index.nearest_many([[1e6 + 1e-3, 1e6]])
+
+        assert distance[0] == pytest.approx(1e-3, rel=1e-6)
+
+    def test_containing_zone_prefers_deepest(self):
+        index = FailureAtlasIndex(2, cell_size=1.0)
+        index.add_zone("left", [0.0, 0.0], 2.0)
+        index.add_zone("right", [3.0, 0.0], 2.0)
+
+        hits = index.containing_zone([[1.8, 0.0], [1.2, 0.0], [9.0, 9.0]])
+
+        assert [index.zone_ids[i] if i >= 0 else None for i in hits] == ["right", "left", None]
+
+    def test_from_atlas_and_updates(self):
+        atlas = {"collapse_zones": ["re_high", {"id": "shear", "center": [0.0, 5.0], "radius": 0.5}]}
+        index = FailureAtlasIndex.from_atlas(
+            atlas, {"re_high": (3.0, 3.0)}, radius=1.0, risk_map={"re_high": 0.9},
+        )
+
+        assert index.zone("re_high")["risk"] == 0.9
+        assert index.nearest([3.0, 4.5]) == ("re_high", pytest.approx(0.5))
+        assert index.remove_zone("re_high") and not index.remove_zone("re_high")
+        assert index.nearest([3.0, 4.5])[0] == "shear"
+        assert not index.contains([3.0, 3.0])[0]
+
+    def test_empty_index(self):
+        index = FailureAtlasIndex(3)
+        assert index.nearest([0, 0, 0]) is None
+        assert not index.contains(np.zeros((4, 3))).any()
+        assert index.within([0, 0, 0], 10.0) == []
+        with pytest.raises(ValueError):
+            index.add_zone("bad", [0.0, 0.0])
+
+
+class TestIncrementalRiskMap:
+    """증분 위험 지형 테스트"""
+
+    def test_running_max_moves_only_crossings(self):
+        builder = IncrementalRiskMap(threshold=0.5)
+
+        first = builder.update({"a": 0.2, "b": 0.6})
+        second = builder.update({"a": 0.7, "b": 0.1})
+
+        assert first["entered"] == ["b"]
+        assert second == {"changed": {"a": 0.7}, "entered": ["a"], "exited": []}
+        assert builder.risk_map == {"a": 0.7, "b": 0.6}
+        assert list(builder.failure_atlas["collapse_zones"]) == ["b", "a"]
+        assert list(builder.failure_atlas["stable_regions"]) == []
+
+    def test_ewma_with_hysteresis(self):
+        builder = IncrementalRiskMap(mode="ewma", alpha=0.5, threshold=0.6, hysteresis=0.1)
+
+        builder.update({"x": 0.8})
+        assert builder.update({"x": 0.3})["exited"] == []  # 0.55 ≥ 0.5
+        update = builder.update({"x": 0.3})  # 0.425 < 0.5
+        assert update["exited"] == ["x"]
+        assert builder.risk_map["x"] == pytest.approx(0.425)
+        assert "x" in builder.failure_atlas["stable_regions"]
+
+    def test_condition_key_and_index_sync(self):
+        index = FailureAtlasIndex(1, cell_size=1.0)
+        builder = IncrementalRiskMap(
+            mode="ewma", alpha=1.0, threshold=0.5,
+            condition_key=lambda parameters, time: f"re={parameters['re']}",
+            index=index,
+            coordinates=lambda signature: [float(signature.split(":")[0][3:])],
+        )
+
+        builder.update({"transition": 0.9}, {"re": 100}, 0.0)
+        builder.update({"transition": 0.2}, {"re": 300}, 0.0)
+        assert "re=100:transition" in index and len(index) == 1
+        assert index.nearest([120.0])[0] == "re=100:transition"
+
+        builder.update({"transition": 0.1}, {"re": 100}, 1.0)
+        assert len(index) == 0
+
+    def test_pipeline_uses_incremental_update(self):
+        builder = IncrementalRiskMap(threshold=0.5)
+        pipeline = PhysicsPipeline(GrowingAdapter(), SpectralTurbulenceExtractor(viscosity=0.01), builder)
+
+        calm = pipeline.process({}, time=0.1)
+        before = builder.snapshot()
+        storm = pipeline.process({}, time=100.0)
+        after = builder.snapshot()
+
+        # 핫 경로 결과에는 변경 내역만 (전체 지형 복사 없음)
+        assert "risk_map" not in storm and "failure_atlas" not in storm
+        assert "transition" not in calm["risk_update"]["entered"]
+        assert "transition" in storm["risk_update"]["entered"]
+        # 스냅샷은 버전이 바뀔 때만 새로 만들고, 이전 스냅샷은 이후 갱신의 영향을 받지 않음
+        assert after is builder.snapshot() and after["version"] > before["version"]
+        assert "transition" not in before["failure_atlas"]["collapse_zones"]
+        assert "transition" in after["failure_atlas"]["collapse_zones"]
+        assert before["risk_map"]["transition"] < after["risk_map"]["transition"]
+        with pytest.raises(TypeError):
+            after["risk_map"]["transition"] = 0.0
+        assert json.loads(json.dumps(builder.failure_atlas))["collapse_zones"][0] in builder.risk_map
+
+    def test_protocol_methods(self):
+        builder = IncrementalRiskMap(threshold=0.5)
+        risk_map = builder.build_risk_map({}, {"a": 0.9, "b": 0.1})
+
+        assert list(builder.build_failure_atlas(risk_map)["collapse_zones"]) == ["a"]
+        assert builder.build_failure_atlas(builder.risk_map)["collapse_zones"] == ("a",)
+        assert builder.build_failure_atlas(risk_map, threshold=0.05)["collapse_zones"] == ["a", "b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,145 @@
+"""
+Feature Cache 테스트
+
+물리 특징 캐시 (정규 키, 메모리/디스크 tier) 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core.physics_pipeline import PhysicsPipeline
+from brain_core.turbulence_features import SpectralTurbulenceExtractor
+from brain_core.feature_cache import FeatureCache, canonical_key
+
+
+def _taylor_green_2d(n: int = 16) -> np.ndarray:
+    x = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    return np.stack([np.sin(X) * np.cos(Y), -np.cos(X) * np.sin(Y)])
+
+
+class GrowingAdapter:
+    """시간에 비례해 진폭이 커지는 Taylor-Green 장"""
+
+    def __init__(self, n=16):
+        self.velocity = _taylor_green_2d(n)
+
+    def generate_field(self, parameters, time=0.0):
+        return {"velocity": self.velocity * time * parameters.get("scale", 1.0)}
+
+    def load_from_file(self, filepath):
+        raise NotImplementedError
+
+
+class CountingAdapter(GrowingAdapter):
+    """generate_field 호출 횟수 기록"""
+
+    def __init__(self, n=16):
+        super().__init__(n)
+        self.calls = 0
+
+    def generate_field(self, parameters, time=0.0):
+        self.calls += 1
+        return super().generate_field(parameters, time)
+
+
+class TestFeatureCache:
+    """특징 캐시 테스트"""
+
+    def test_canonical_key(self):
+        base = canonical_key({"re": 100, "grid": [1.5, 2.0], "mesh": np.arange(4.0)}, 1)
+        assert base == canonical_key({"mesh": np.arange(4.0), "grid": (1.5, 2.0), "re": np.int64(100)}, 1.0)
+        assert base != canonical_key({"re": 100, "grid": [1.5, 2.0], "mesh": np.arange(4.0)}, 1.0 + 1e-12)
+        assert base != canonical_key({"re": 100, "grid": [1.5, 2.0], "mesh": np.arange(4.0) + 1}, 1)
+        assert base != canonical_key({"re": 100, "grid": [1.5, 2.0], "mesh": np.arange(4.0)}, 1, namespace="nu=0.01")
+        with pytest.raises(TypeError):
+            canonical_key({"callback": object()}, 0.0)
+
+    def test_canonical_key_numeric_and_mixed_keys(self):
+        assert canonical_key({"re": 100}, 0.0) == canonical_key({"re": 100.0}, 0.0)
+        assert canonical_key({"re": np.float32(0.5)}, 0.0) == canonical_key({"re": 0.5}, 0.0)
+        assert canonical_key({"n": 2 ** 60}, 0.0) != canonical_key({"n": 2 ** 60 + 1}, 0.0)
+        assert canonical_key({"re": True}, 0.0) != canonical_key({"re": 1}, 0.0)
+
+        mixed = {1: {"a": 1}, "1": {"a": 2}}
+        assert canonical_key(mixed, 0.0) == canonical_key({"1": {"a": 2}, 1: {"a": 1}}, 0.0)
+        assert canonical_key(mixed, 0.0) != canonical_key({1: {"a": 2}, "1": {"a": 1}}, 0.0)
+
+    def test_memory_lru(self):
+        cache = FeatureCache(max_entries=2)
+        for name in "abc":
+            cache.put(name, {"features": name})
+        assert cache.get("a") is None
+        assert cache.get("b") == {"features": "b"}
+        cache.put("d", {})
+        assert cache.get("c") is None  # b가 최근 사용됨
+        assert cache.stats["evicted"] == 2
+
+    def test_process_hit_skips_generate_field(self):
+        adapter = CountingAdapter()
+        pipeline = PhysicsPipeline(adapter, SpectralTurbulenceExtractor(), feature_cache=FeatureCache())
+
+        first = pipeline.process({"scale": 1.0}, time=2.0)
+        second = pipeline.process({"scale": 1.0}, time=2)
+
+        assert (first["cache_hit"], second["cache_hit"]) == (False, True)
+        assert adapter.calls == 1
+        assert "field_data" not in second
+        assert second["features"]["kinetic_energy"] == pytest.approx(first["features"]["kinetic_energy"])
+
+    def test_mutating_result_does_not_poison_cache(self):
+        pipeline = PhysicsPipeline(CountingAdapter(), SpectralTurbulenceExtractor(), feature_cache=FeatureCache())
+
+        first = pipeline.process({}, time=1.0)
+        first["features"]["kinetic_energy"] = 999.0
+        second = pipeline.process({}, time=1.0)
+        second["risk_indicators"].clear()
+        third = pipeline.process({}, time=1.0)
+
+        assert third["features"]["kinetic_energy"] == pytest.approx(0.25)
+        assert third["risk_indicators"]
+
+    def test_disk_tier_shared_across_instances(self, tmp_path):
+        adapter = CountingAdapter()
+        PhysicsPipeline(adapter, SpectralTurbulenceExtractor(),
+                        feature_cache=FeatureCache(cache_dir=str(tmp_path))).process({}, time=1.0)
+
+        cache = FeatureCache(max_entries=0, cache_dir=str(tmp_path))
+        result = PhysicsPipeline(adapter, SpectralTurbulenceExtractor(), feature_cache=cache).process({}, time=1.0)
+
+        assert result["cache_hit"] is True
+        assert adapter.calls == 1
+        assert cache.stats["disk_hits"] == 1
+        assert len(list(tmp_path.glob("*/*.pkl"))) == 1
+
+    def test_corrupt_disk_entry_is_miss(self, tmp_path):
+        cache = FeatureCache(max_entries=0, cache_dir=str(tmp_path), enable_logging=False)
+        key = cache.key({}, 0.0)
+        cache.put(key, {"features": {}})
+        next(tmp_path.glob("*/*.pkl")).write_bytes(b"broken")
+
+        assert cache.get(key) is None
+        assert cache.stats["misses"] == 1
+
+    def test_series_computes_only_misses(self):
+        adapter = CountingAdapter()
+        pipeline = PhysicsPipeline(adapter, SpectralTurbulenceExtractor(), feature_cache=FeatureCache())
+
+        pipeline.process_series({}, [0.0, 1.0, 2.0])
+        series = pipeline.process_series({}, [1.0, 2.0, 3.0])
+
+        assert adapter.calls == 4
+        np.testing.assert_allclose(series["features"]["kinetic_energy"], [0.25, 1.0, 2.25])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""
+GlobalState / CompactGlobalState 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.2.0
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core.global_state import GlobalState, CompactGlobalState, state_memory_report
+from brain_core.state_centric_execution_loop import StateCentricExecutionLoop
+
+
+class TestCompactGlobalState:
+    """CompactGlobalState 테스트"""
+    
+    def test_no_instance_dict(self):
+        """슬롯 기반 (인스턴스 __dict__ 없음)"""
+        state = CompactGlobalState(state_vector=np.zeros(4))
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1
+    
+    def test_lazy_containers(self):
+        """metadata/extensions 지연 할당"""
+        state = CompactGlobalState(state_vector=np.zeros(4))
+        assert state.get_extension("L0") is None
+        assert state.risk_map is None
+        assert state.memory_report()["extensions"] == 0
+        assert state.memory_report()["metadata"] == 0
+        
+        state.update_extension("L0", converged=True)
+        assert state.l0_converged is True
+        assert state.memory_report()["extensions"] > 0
+    
+    def test_dtype_and_memory_savings(self):
+        """float32 저장 및 메모리 절감"""
+        vector = np.random.randn(64)
+        full = GlobalState(state_vector=vector)
+        compact = CompactGlobalState.from_state(full, dtype=np.float32)
+        
+        assert compact.state_vector.dtype == np.float32
+        assert compact.memory_report()["total"] < state_memory_report(full)["total"]
+        assert compact.memory_report()["instance_dict"] == 0
+    
+    def test_copy_semantics(self):
+        """shallow/deep 복사"""
+        state = CompactGlobalState(state_vector=np.ones(3))
+        shallow = state.copy()
+        deep = state.copy(deep=True)
+        
+        assert shallow.state_vector is state.state_vector
+        assert deep.state_vector is not state.state_vector
+        assert deep.memory_report()["extensions"] == 0
+    
+    def test_round_trip(self):
+        """GlobalState 변환 왕복"""
+        state = GlobalState(state_vector=np.array([0.1, 0.2]), energy=0.5, risk=0.2)
+        state.set_extension("L1", {"risk_map": {"c": 0.3}})
+        back = CompactGlobalState.from_state(state).to_global_state()
+        
+        assert isinstance(back, GlobalState)
+        assert back.risk_map == {"c": 0.3}
+        assert back.energy == 0.5
+    
+    def test_runs_in_state_centric_loop(self):
+        """상태계 중심 루프에서 그대로 사용 가능"""
+        class Engine:
+            def update(self, state):
+                state.energy = max(0.0, state.energy - 0.1)
+                state.set_extension("engine", {"step": state.step})
+                return state
+        
+        initial_state = CompactGlobalState(state_vector=np.zeros(3), energy=1.0, dtype=np.float32)
+        final_state, _ = StateCentricExecutionLoop(enable_logging=False).run_cycle(
+            initial_state=initial_state,
+            engines={"engine": Engine()},
+            max_steps=5,
+        )
+        
+        assert isinstance(final_state, CompactGlobalState)
+        assert final_state.state_vector.dtype == np.float32
+        assert "engine" in final_state.extensions
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,481 @@
+"""
+Physics Pipeline 테스트
+
+난류 특징 추출 및 물리 입력 파이프라인 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+import threading
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core.physics_pipeline import (
+    PhysicsPipeline, PhysicsAdapter, TurbulenceFeatureExtractor, iter_tiles, read_tile,
+)
+from brain_core.physics_adapters import (
+    MemmapFieldAdapter, SyntheticTurbulenceAdapter, write_field_file, read_field_header,
+)
+from brain_core.turbulence_features import SpectralTurbulenceExtractor
+from brain_core.feature_cache import FeatureCache
+from brain_core.failure_atlas import IncrementalRiskMap
+
+
+def _taylor_green_2d(n: int = 32) -> np.ndarray:
+    x = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    return np.stack([np.sin(X) * np.cos(Y), -np.cos(X) * np.sin(Y)])
+
+
+def _taylor_green_3d(n: int = 16) -> np.ndarray:
+    x = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    X, Y, Z = np.meshgrid(x, x, x, indexing="ij")
+    u = np.sin(X) * np.cos(Y) * np.cos(Z)
+    v = -np.cos(X) * np.sin(Y) * np.cos(Z)
+    return np.stack([u, v, np.zeros_like(u)])
+
+
+class ArrayAdapter:
+    """고정 장을 돌려주는 어댑터"""
+
+    def __init__(self, velocity):
+        self.velocity = velocity
+
+    def generate_field(self, parameters, time=0.0):
+        return {"velocity": self.velocity * parameters.get("amplitude", 1.0)}
+
+    def load_from_file(self, filepath):
+        raise NotImplementedError
+
+
+class GrowingAdapter:
+    """시간에 비례해 진폭이 커지는 Taylor-Green 장 (pickle 가능)"""
+
+    def __init__(self, n=16):
+        self.velocity = _taylor_green_2d(n)
+
+    def generate_field(self, parameters, time=0.0):
+        return {"velocity": self.velocity * time * parameters.get("scale", 1.0)}
+
+    def load_from_file(self, filepath):
+        raise NotImplementedError
+
+
+class TestSpectralTurbulenceExtractor:
+    """FFT 기반 특징 추출기 테스트"""
+
+    def test_protocol(self):
+        assert isinstance(SpectralTurbulenceExtractor(), TurbulenceFeatureExtractor)
+
+    def test_taylor_green_2d_analytic(self):
+        extractor = SpectralTurbulenceExtractor(viscosity=0.01)
+        features = extractor.extract_features({"velocity": _taylor_green_2d()})
+
+        # KE = 1/4, ω = 2 sin x sin y → <ω²> = 1, ε = ν<ω²>
+        assert features["kinetic_energy"] == pytest.approx(0.25)
+        assert features["dissipation_rate"] == pytest.approx(0.01)
+        assert features["vorticity_stats"]["rms"] == pytest.approx(1.0)
+        assert features["vorticity_stats"]["max"] == pytest.approx(2.0)
+        spectrum = features["energy_spectrum"]
+        assert np.argmax(spectrum["energy"]) == 1  # |k| = √2 → 셸 1
+
+    def test_taylor_green_3d_analytic(self):
+        extractor = SpectralTurbulenceExtractor(viscosity=0.01)
+        velocity = _taylor_green_3d()
+        features = extractor.extract_features({"velocity": velocity})
+
+        assert features["kinetic_energy"] == pytest.approx(0.125)
+        assert features["dissipation_rate"] == pytest.approx(0.01 * 0.75)
+        # 성분이 마지막 축인 배열도 같은 결과
+        moved = extractor.extract_features({"velocity": np.moveaxis(velocity, 0, -1)})
+        assert moved["kinetic_energy"] == pytest.approx(features["kinetic_energy"])
+
+    def test_spectrum_parseval_on_random_field(self):
+        rng = np.random.default_rng(0)
+        velocity = rng.standard_normal((3, 12, 10, 9))
+        extractor = SpectralTurbulenceExtractor(compute_vorticity_field=False)
+
+        features = extractor.extract_features({"velocity": velocity})
+
+        expected = 0.5 * np.mean(np.sum(velocity ** 2, axis=0))
+        assert features["energy_spectrum"]["energy"].sum() == pytest.approx(expected)
+        assert "flatness" not in features["vorticity_stats"]
+
+    def test_grid_cached_across_calls(self):
+        extractor = SpectralTurbulenceExtractor()
+        extractor.extract_features({"velocity": _taylor_green_2d(16)})
+        grid = extractor.grid_for((16, 16))
+        extractor.extract_features({"velocity": _taylor_green_2d(16) * 2})
+
+        assert extractor.grid_for((16, 16)) is grid
+
+    def test_risk_indicators_bounded(self):
+        extractor = SpectralTurbulenceExtractor(viscosity=1e-3)
+        rng = np.random.default_rng(1)
+        features = extractor.extract_features({"velocity": rng.standard_normal((2, 32, 32))})
+        indicators = extractor.compute_risk_indicators(features)
+
+        assert {"dissipation", "transition"} <= set(indicators)
+        assert all(0.0 <= value <= 1.0 for value in indicators.values())
+
+    def test_convection_onset(self):
+        velocity = _taylor_green_2d(16)
+        temperature = velocity[-1] * 0.5 + 1.0  # 연직 속도와 양의 상관
+        features = SpectralTurbulenceExtractor().extract_features(
+            {"velocity": velocity, "temperature": temperature}
+        )
+
+        assert features["convection_onset"]["onset"] is True
+        assert features["convection_onset"]["heat_flux"] > 0
+
+    def test_pipeline_integration(self):
+        pipeline = PhysicsPipeline(
+            physics_adapter=ArrayAdapter(_taylor_green_2d(16)),
+            feature_extractor=SpectralTurbulenceExtractor(),
+        )
+
+        result = pipeline.process({"amplitude": 2.0})
+
+        assert result["features"]["kinetic_energy"] == pytest.approx(1.0)
+        assert "dissipation" in result["risk_indicators"]
+
+
+class TestMemmapFieldAdapter:
+    """메모리 매핑 CFD 로더 테스트"""
+
+    def test_bcfd_round_trip_is_memmapped_and_aligned(self, tmp_path):
+        velocity = np.random.default_rng(0).standard_normal((3, 8, 8, 8)).astype(np.float32)
+        temperature = np.arange(512.0).reshape(8, 8, 8)
+        path = tmp_path / "snap.bcfd"
+        write_field_file(str(path), {"velocity": velocity, "temperature": temperature}, {"time": 1.5})
+
+        header = read_field_header(str(path))
+        assert header["attributes"] == {"time": 1.5}
+        assert all(spec["offset"] % 4096 == 0 for spec in header["fields"].values())
+
+        adapter = MemmapFieldAdapter()
+        assert isinstance(adapter, PhysicsAdapter)
+        fields = adapter.load_from_file(str(path))
+        assert isinstance(fields["velocity"], np.memmap)
+        np.testing.assert_array_equal(fields["velocity"], velocity)
+        np.testing.assert_array_equal(fields["temperature"], temperature)
+        with pytest.raises(ValueError):
+            fields["velocity"][0, 0, 0, 0] = 1.0  # 읽기 전용
+
+    def test_npz_uncompressed_and_npy(self, tmp_path):
+        velocity = np.random.default_rng(1).standard_normal((2, 6, 5))
+        pressure = np.asfortranarray(np.arange(30.0).reshape(6, 5))
+        np.savez(tmp_path / "snap.npz", velocity=velocity, pressure=pressure)
+        np.save(tmp_path / "velocity.npy", velocity)
+
+        adapter = MemmapFieldAdapter()
+        fields = adapter.load_from_file(str(tmp_path / "snap.npz"))
+        assert isinstance(fields["velocity"], np.memmap)
+        np.testing.assert_array_equal(fields["velocity"], velocity)
+        np.testing.assert_array_equal(fields["pressure"], pressure)
+        np.testing.assert_array_equal(adapter.load_from_file(str(tmp_path / "velocity.npy"))["velocity"], velocity)
+
+    def test_compressed_npz_rejected(self, tmp_path):
+        np.savez_compressed(tmp_path / "packed.npz", velocity=np.zeros((2, 4, 4)))
+        with pytest.raises(ValueError):
+            MemmapFieldAdapter().load_from_file(str(tmp_path / "packed.npz"))
+
+    def test_raw_and_path_template(self, tmp_path):
+        velocity = np.arange(2 * 4 * 4, dtype=np.float32).reshape(2, 4, 4)
+        velocity.tofile(tmp_path / "raw.bin")
+        write_field_file(str(tmp_path / "snap_0.50.bcfd"), {"velocity": velocity, "extra": velocity[0]})
+
+        adapter = MemmapFieldAdapter(path_template=str(tmp_path / "snap_{time:.2f}.bcfd"), field_names=["velocity"])
+        np.testing.assert_array_equal(adapter.load_raw(str(tmp_path / "raw.bin"), velocity.shape)["velocity"], velocity)
+        fields = adapter.generate_field({}, time=0.5)
+        assert list(fields) == ["velocity"]
+
+    def test_pipeline_replay(self, tmp_path):
+        write_field_file(str(tmp_path / "tg.bcfd"), {"velocity": _taylor_green_2d(16)})
+        pipeline = PhysicsPipeline(
+            physics_adapter=MemmapFieldAdapter(),
+            feature_extractor=SpectralTurbulenceExtractor(),
+        )
+
+        result = pipeline.process({"filepath": str(tmp_path / "tg.bcfd")})
+        assert result["features"]["kinetic_energy"] == pytest.approx(0.25)
+
+
+class TestTiledProcessing:
+    """타일 스트리밍 모드 테스트"""
+
+    def test_iter_tiles_covers_grid_once(self):
+        covered = np.zeros((10, 7), dtype=int)
+        indices = []
+        for index, region in iter_tiles((10, 7), (4, 4)):
+            covered[region] += 1
+            indices.append(index)
+
+        assert np.all(covered == 1)
+        assert indices[-1] == (2, 1)
+
+    def test_read_tile_wraps_halo(self):
+        array = np.arange(2 * 6 * 6).reshape(2, 6, 6)
+        tile = read_tile(array, (slice(0, 3), slice(3, 6)), halo=1, leading_axes=1)
+
+        assert tile.shape == (2, 5, 5)
+        np.testing.assert_array_equal(tile[:, 0, 0], array[:, -1, 2])
+        np.testing.assert_array_equal(tile[:, -1, -1], array[:, 3, 0])
+
+    @pytest.mark.parametrize("tile_shape", [(64, 64), (16, 32), (10, 24)])
+    def test_tiled_matches_whole_field(self, tile_shape):
+        extractor = SpectralTurbulenceExtractor(viscosity=0.01)
+        pipeline = PhysicsPipeline(physics_adapter=ArrayAdapter(_taylor_green_2d(64)), feature_extractor=extractor)
+
+        tiled = pipeline.process_tiled({}, tile_shape=tile_shape)
+        whole = pipeline.process({})
+
+        features = tiled["features"]
+        assert features["kinetic_energy"] == pytest.approx(whole["features"]["kinetic_energy"])
+        # 2차 중앙 차분 오차 O(dx²)
+        assert features["dissipation_rate"] == pytest.approx(whole["features"]["dissipation_rate"], rel=1e-2)
+        assert features["vorticity_stats"]["max"] == pytest.approx(2.0, rel=1e-2)
+        assert tiled["risk_indicators"]["transition"] == pytest.approx(
+            whole["risk_indicators"]["transition"], rel=1e-2
+        )
+        expected_tiles = tuple(-(-64 // t) for t in tile_shape)
+        assert tiled["tile_risk"].shape == expected_tiles
+        assert features["tile_count"] == np.prod(expected_tiles)
+
+    def test_tiled_3d_memmap(self, tmp_path):
+        write_field_file(str(tmp_path / "tg3.bcfd"), {"velocity": _taylor_green_3d(16)})
+        pipeline = PhysicsPipeline(
+            physics_adapter=MemmapFieldAdapter(),
+            feature_extractor=SpectralTurbulenceExtractor(viscosity=0.01),
+        )
+
+        result = pipeline.process_tiled({"filepath": str(tmp_path / "tg3.bcfd")}, tile_shape=(8, 8, 8))
+
+        assert result["features"]["kinetic_energy"] == pytest.approx(0.125)
+        # n=16 격자의 중앙 차분 감쇠 (sin(dx)/dx)² ≈ 0.95
+        assert result["features"]["dissipation_rate"] == pytest.approx(0.01 * 0.75, rel=0.1)
+        assert result["tile_risk"].shape == (2, 2, 2)
+
+    def test_tile_risk_localizes_hotspot(self):
+        rng = np.random.default_rng(2)
+        velocity = np.zeros((2, 32, 32))
+        velocity[:, :16, :16] = rng.standard_normal((2, 16, 16))
+
+        class FallbackExtractor:
+            """extract_tile_features/reduce_tile_features가 없는 추출기"""
+
+            viscosity = 1e-3
+
+            def extract_features(self, field_data):
+                raise NotImplementedError
+
+            def compute_risk_indicators(self, features):
+                return {"dissipation": features["dissipation_rate"] / (features["dissipation_rate"] + 1.0)}
+
+        pipeline = PhysicsPipeline(physics_adapter=ArrayAdapter(velocity), feature_extractor=FallbackExtractor())
+        result = pipeline.process_tiled({}, tile_shape=(16, 16), halo=0)
+
+        assert np.argmax(result["tile_risk"]) == 0
+        assert result["tile_risk"][1, 1] == 0.0
+
+    def test_requires_adapter_and_extractor(self):
+        with pytest.raises(ValueError):
+            PhysicsPipeline().process_tiled({})
+
+
+class TestProcessSeries:
+    """시계열 병렬 처리 테스트"""
+
+    def _pipeline(self):
+        return PhysicsPipeline(
+            physics_adapter=GrowingAdapter(),
+            feature_extractor=SpectralTurbulenceExtractor(viscosity=0.01, transition_re_lambda=50.0),
+        )
+
+    def test_serial_time_indexed_arrays(self):
+        times = [0.0, 1.0, 2.0, 4.0]
+        series = self._pipeline().process_series({}, times)
+
+        np.testing.assert_array_equal(series["times"], times)
+        # KE = ¼ a², ε = ν a²
+        np.testing.assert_allclose(series["features"]["kinetic_energy"], 0.25 * np.square(times), atol=1e-12)
+        np.testing.assert_allclose(series["features"]["dissipation_rate"], 0.01 * np.square(times), atol=1e-12)
+        assert series["energy_spectrum"].shape == (4, len(series["wavenumbers"]))
+        assert series["risk_indicators"]["transition"].shape == (4,)
+        assert series["features"]["transition_detection.turbulent"].dtype == bool
+
+    def test_onset_index(self):
+        series = self._pipeline().process_series({}, [0.0, 0.1, 1.0, 2.0])
+
+        re_lambda = series["features"]["transition_detection.re_lambda"]
+        assert series["onset_index"] == int(np.argmax(re_lambda >= 50.0))
+        assert self._pipeline().process_series({}, [0.0])["onset_index"] is None
+
+    def test_process_pool_matches_serial(self):
+        times = np.linspace(0.0, 3.0, 7)
+        pipeline = self._pipeline()
+
+        serial = pipeline.process_series({"scale": 2.0}, times)
+        parallel = pipeline.process_series({"scale": 2.0}, times, workers=2, chunksize=2)
+
+        np.testing.assert_allclose(parallel["energy_spectrum"], serial["energy_spectrum"])
+        for name, values in serial["features"].items():
+            np.testing.assert_array_equal(parallel["features"][name], values)
+
+    def test_requires_adapter_and_extractor(self):
+        with pytest.raises(ValueError):
+            PhysicsPipeline(physics_adapter=GrowingAdapter()).process_series({}, [0.0])
+
+
+class CountingAdapter(GrowingAdapter):
+    """generate_field 호출 횟수 기록"""
+
+    def __init__(self, n=16):
+        super().__init__(n)
+        self.calls = 0
+
+    def generate_field(self, parameters, time=0.0):
+        self.calls += 1
+        return super().generate_field(parameters, time)
+
+
+class TestProcessStream:
+    """단계 파이프라인 테스트"""
+
+    def test_matches_process_in_order(self):
+        pipeline = PhysicsPipeline(GrowingAdapter(), SpectralTurbulenceExtractor(viscosity=0.01))
+        times = [0.5, 1.0, 1.5, 2.0, 2.5]
+
+        streamed = list(pipeline.process_stream({}, iter(times), queue_size=1))
+
+        assert [r["time"] for r in streamed] == times
+        for result, t in zip(streamed, times):
+            assert "field_data" not in result
+            assert result["features"]["kinetic_energy"] == pytest.approx(pipeline.process({}, t)["features"]["kinetic_energy"])
+
+    def test_loading_overlaps_extraction(self):
+        loaded = {t: threading.Event() for t in (0.0, 1.0, 2.0)}
+
+        class SignallingAdapter(GrowingAdapter):
+            def generate_field(self, parameters, time=0.0):
+                loaded[time].set()
+                return super().generate_field(parameters, time)
+
+        class WaitingExtractor(SpectralTurbulenceExtractor):
+            def extract_features(self, field_data):
+                # 스텝 0 분석은 스텝 1 로딩이 끝날 때까지 기다림 (겹치지 않으면 타임아웃)
+                if not field_data["velocity"].any():
+                    assert loaded[1.0].wait(timeout=5.0)
+                return super().extract_features(field_data)
+
+        pipeline = PhysicsPipeline(SignallingAdapter(), WaitingExtractor())
+        results = list(pipeline.process_stream({}, [0.0, 1.0, 2.0]))
+
+        assert len(results) == 3
+
+    def test_process_pool_extraction_with_incremental_atlas(self):
+        builder = IncrementalRiskMap(threshold=0.5)
+        pipeline = PhysicsPipeline(GrowingAdapter(), SpectralTurbulenceExtractor(viscosity=0.01), builder)
+        times = np.linspace(0.0, 50.0, 6)
+
+        streamed = list(pipeline.process_stream({}, times, extract_workers=2))
+        serial = PhysicsPipeline(GrowingAdapter(), SpectralTurbulenceExtractor(viscosity=0.01)).process_series({}, times)
+
+        np.testing.assert_allclose([r["features"]["dissipation_rate"] for r in streamed],
+                                   serial["features"]["dissipation_rate"])
+        assert "transition" in builder.failure_atlas["collapse_zones"]
+        assert builder.snapshot()["risk_map"] == builder.risk_map
+        assert "transition" not in streamed[0]["risk_update"]["entered"]
+        assert any("transition" in r["risk_update"]["entered"] for r in streamed)
+
+    def test_cache_hits_skip_loading(self):
+        adapter = CountingAdapter()
+        pipeline = PhysicsPipeline(adapter, SpectralTurbulenceExtractor(), feature_cache=FeatureCache())
+
+        list(pipeline.process_stream({}, [1.0, 2.0]))
+        again = list(pipeline.process_stream({}, [1.0, 2.0, 3.0]))
+
+        assert [r["cache_hit"] for r in again] == [True, True, False]
+        assert adapter.calls == 3
+
+    def test_stage_error_propagates(self):
+        class FailingAdapter(GrowingAdapter):
+            def generate_field(self, parameters, time=0.0):
+                if time == 1.0:
+                    raise RuntimeError("snapshot missing")
+                return super().generate_field(parameters, time)
+
+        pipeline = PhysicsPipeline(FailingAdapter(), SpectralTurbulenceExtractor())
+        stream = pipeline.process_stream({}, [0.0, 1.0, 2.0])
+
+        assert next(stream)["time"] == 0.0
+        with pytest.raises(RuntimeError, match="snapshot missing"):
+            next(stream)
+
+
+class TestSyntheticTurbulenceAdapter:
+    """합성 난류 장 생성기 테스트"""
+
+    def test_divergence_free_and_energy(self):
+        adapter = SyntheticTurbulenceAdapter((32, 32, 32), energy=0.5, seed=3)
+        assert isinstance(adapter, PhysicsAdapter)
+
+        velocity = adapter.generate_field({})["velocity"]
+
+        assert velocity.shape == (3, 32, 32, 32) and velocity.dtype == np.float32
+        assert 0.5 * np.mean(np.sum(velocity.astype(np.float64) ** 2, axis=0)) == pytest.approx(0.5, rel=1e-5)
+        u_hat = np.fft.fftn(velocity.astype(np.float64), axes=(1, 2, 3))
+        k = np.fft.fftfreq(32, d=1.0 / 32)
+        grid = np.meshgrid(k, k, k, indexing="ij")
+        divergence = sum(ki * u_hat[i] for i, ki in enumerate(grid))
+        assert np.abs(divergence).max() < 1e-5 * np.abs(u_hat).max()
+
+    def test_reproducible_by_seed_and_time(self):
+        adapter = SyntheticTurbulenceAdapter((16, 16, 16), seed=7)
+
+        first = adapter.generate_field({}, time=0.5)["velocity"]
+        np.testing.assert_array_equal(first, SyntheticTurbulenceAdapter((16, 16, 16), seed=7).generate_field({}, 0.5)["velocity"])
+        assert not np.array_equal(first, adapter.generate_field({}, time=1.0)["velocity"])
+        assert not np.array_equal(first, adapter.generate_field({"seed": 8}, time=0.5)["velocity"])
+
+    def test_spectrum_follows_kolmogorov_slope(self):
+        adapter = SyntheticTurbulenceAdapter((64, 64, 64), k_peak=1.0)
+        features = SpectralTurbulenceExtractor().extract_features(adapter.generate_field({}))
+
+        spectrum = features["energy_spectrum"]
+        band = slice(8, 21)
+        slope = np.polyfit(np.log(spectrum["wavenumbers"][band]), np.log(spectrum["energy"][band]), 1)[0]
+        assert slope == pytest.approx(-5.0 / 3.0, abs=0.2)
+        assert features["kinetic_energy"] == pytest.approx(1.0, rel=1e-5)
+
+    def test_dissipation_cutoff_and_2d(self):
+        adapter = SyntheticTurbulenceAdapter((64, 64), k_peak=2.0, dtype=np.float64)
+        extractor = SpectralTurbulenceExtractor()
+
+        full = extractor.extract_features(adapter.generate_field({}))
+        damped = extractor.extract_features(adapter.generate_field({"k_dissipation": 4.0}))
+
+        assert full["kinetic_energy"] == pytest.approx(damped["kinetic_energy"])
+        assert damped["energy_spectrum"]["energy"][16:].sum() < 1e-3 * full["energy_spectrum"]["energy"][16:].sum()
+
+    def test_benchmark_through_pipeline(self):
+        pipeline = PhysicsPipeline(
+            SyntheticTurbulenceAdapter((32, 32, 32)),
+            SpectralTurbulenceExtractor(viscosity=1e-3),
+        )
+
+        series = pipeline.process_series({}, [0.0, 1.0, 2.0])
+
+        np.testing.assert_allclose(series["features"]["kinetic_energy"], 1.0, rtol=1e-5)
+        assert np.all(series["risk_indicators"]["transition"] > 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
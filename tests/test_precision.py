@@ -0,0 +1,148 @@
+"""
+정밀도 정책 / 상태 직렬화 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core import BrainCore, GlobalState, CompactGlobalState
+from brain_core.precision import PrecisionPolicy, hopfield_energy
+from brain_core.state_io import serialize_state, deserialize_state
+from brain_core.engine_wrappers import WellFormationEngineWrapper, NeuralDynamicsCoreWrapper
+
+
+class MockWellFormationEngine:
+    """Mock WellFormationEngine"""
+    
+    def generate_well(self, episodes):
+        class WellResult:
+            W = [[0.5, -0.3], [-0.3, 0.5]]
+            b = [0.1, 0.1]
+            analysis = {}
+        return WellResult()
+
+
+class MockDynamicsCoreWithoutEnergy:
+    """hopfield_energy가 없는 Mock NeuralDynamicsCore"""
+    
+    def run(self, x0, W, b):
+        x = np.asarray(x0, dtype=np.float64)
+        return [list(x), list(0.5 * x + 0.1)]
+
+
+def _initial_state():
+    state = GlobalState(state_vector=np.array([0.5, -0.25]), energy=1.0)
+    state.set_extension("well_formation", {"episodes": [object()]})
+    return state
+
+
+class TestPrecisionPolicy:
+    """PrecisionPolicy 테스트"""
+    
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            PrecisionPolicy("int8")
+    
+    def test_apply_does_not_touch_original(self):
+        state = GlobalState(state_vector=np.ones(2))
+        state.set_extension("L0", {"weights": np.eye(2), "bias": np.zeros(2)})
+        casted = PrecisionPolicy("float32").apply(state.copy())
+        
+        assert casted.state_vector.dtype == np.float32
+        assert casted.l0_weights.dtype == np.float32
+        assert state.l0_weights.dtype == np.float64
+    
+    def test_hopfield_energy(self):
+        x = np.array([1.0, -1.0])
+        W = np.array([[0.0, 1.0], [1.0, 0.0]])
+        b = np.array([0.5, 0.5])
+        assert hopfield_energy(x, W, b) == pytest.approx(1.0)
+    
+    def test_wrappers_follow_policy(self):
+        core = BrainCore(mode="production", enable_logging=False, precision="float32")
+        core.register_engine("well_formation", WellFormationEngineWrapper(MockWellFormationEngine()), priority=1)
+        core.register_engine("neural_dynamics", NeuralDynamicsCoreWrapper(MockDynamicsCoreWithoutEnergy()), priority=2)
+        
+        initial_state = _initial_state()
+        final_state = core.run_cycle(initial_state, max_steps=20)["final_state"]
+        
+        assert final_state.state_vector.dtype == np.float32
+        assert final_state.l0_weights.dtype == np.float32
+        assert initial_state.state_vector.dtype == np.float64
+        assert core.get_system_state()["precision"] == "float32"
+    
+    def test_precision_report(self):
+        core = BrainCore(mode="production", enable_logging=False)
+        core.register_engine("well_formation", WellFormationEngineWrapper(MockWellFormationEngine()), priority=1)
+        core.register_engine("neural_dynamics", NeuralDynamicsCoreWrapper(MockDynamicsCoreWithoutEnergy()), priority=2)
+        
+        report = core.precision_report(_initial_state(), max_steps=20)
+        
+        assert report["reference"]["precision"] == "float64"
+        assert report["float32"]["rel_error"] < 1e-5
+        assert report["float16"]["abs_error"] < 1e-2
+        assert core.precision.precision == "float64"
+
+    
+    def test_precision_report_does_not_swap_shared_policy(self):
+        """보고 중에도 공유 정책은 그대로 (동시 실행 사이클이 다른 정책을 보지 않음)"""
+        core = BrainCore(mode="production", enable_logging=False, precision="float32")
+        seen = []
+        
+        class ObservingEngine:
+            def update(self, state):
+                seen.append(core.precision.precision)
+                state.energy -= 0.1
+                return state
+        
+        core.register_engine("observer", ObservingEngine(), priority=1)
+        report = core.precision_report(_initial_state(), precisions=["float16"], max_steps=2)
+        
+        assert set(seen) == {"float32"}
+        assert report["reference"]["precision"] == "float64"
+
+class TestStateSerialization:
+    """바이너리 상태 포맷 테스트"""
+    
+    def test_round_trip(self):
+        state = GlobalState(state_vector=np.array([0.1, 0.2, 0.3]), energy=-1.5, risk=0.25, step=7)
+        state.set_extension("L1", {"risk_map": {"c": 0.4}})
+        restored = deserialize_state(serialize_state(state))
+        
+        assert isinstance(restored, GlobalState)
+        np.testing.assert_array_equal(restored.state_vector, state.state_vector)
+        assert restored.energy == -1.5
+        assert restored.step == 7
+        assert restored.risk_map == {"c": 0.4}
+        restored.state_vector[0] = 1.0  # 쓰기 가능
+    
+    def test_precision_applied(self):
+        state = GlobalState(state_vector=np.arange(4, dtype=np.float64))
+        data = serialize_state(state, precision=PrecisionPolicy("float16"))
+        
+        assert deserialize_state(data).state_vector.dtype == np.float16
+        assert len(data) < len(serialize_state(state))
+    
+    def test_compact_state_stays_compact(self):
+        state = CompactGlobalState(state_vector=np.zeros(3), dtype=np.float32)
+        restored = deserialize_state(serialize_state(state))
+        
+        assert isinstance(restored, CompactGlobalState)
+        assert restored.memory_report()["extensions"] == 0
+    
+    def test_bad_magic(self):
+        with pytest.raises(ValueError):
+            deserialize_state(b"XXXX" + bytes(16))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+세션 풀 테스트
+
+Author: GNJz (Qquarts)
+Version: 0.1.0
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# BrainCore 경로 추가
+brain_core_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(brain_core_path))
+
+from brain_core import BrainCore, GlobalState
+
+
+class CountingEngine:
+    """호출 순서를 기록하는 Mock 엔진"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        self.calls.append(state.metadata.get("tenant"))
+        state.state_vector = state.state_vector + 1.0
+        state.energy = state.energy - 0.1
+        return state
+
+
+def _make_pool(**kwargs):
+    core = BrainCore(mode="production", enable_logging=False)
+    engine = CountingEngine()
+    core.register_engine("counter", engine, priority=1)
+    return core.create_session_pool(**kwargs), engine
+
+
+def _state(tenant):
+    state = GlobalState(state_vector=np.zeros(3), energy=1.0)
+    state.metadata["tenant"] = tenant
+    return state
+
+
+class TestSessionPool:
+    """SessionPool 테스트"""
+    
+    def test_run_cycle_persists_state(self):
+        pool, _ = _make_pool()
+        pool.open_session("a", _state("a"))
+        
+        pool.run_cycle("a", max_steps=1)
+        pool.run_cycle("a", max_steps=1)
+        
+        np.testing.assert_array_equal(pool.get_state("a").state_vector, np.full(3, 2.0))
+    
+    def test_buffer_reused_in_place(self):
+        pool, _ = _make_pool()
+        pool.open_session("a", _state("a"))
+        buffer = pool._sessions["a"].state_vector
+        
+        pool.run_cycle("a", max_steps=1)
+        
+        assert pool._sessions["a"].state_vector is buffer
+        assert pool.get_stats()["buffer_allocations"] == 1
+    
+    def test_get_state_not_aliased_to_recycled_buffer(self):
+        """반환된 상태는 축출 후 재사용되는 풀 버퍼와 메모리를 공유하지 않음"""
+        pool, _ = _make_pool(max_sessions=1)
+        pool.open_session("a", GlobalState(state_vector=np.zeros(4)))
+        held = pool.get_state("a")
+        
+        pool.open_session("b", GlobalState(state_vector=np.full(4, 5.0)))
+        pool.open_session("c", GlobalState(state_vector=np.full(4, 9.0)))
+        
+        np.testing.assert_array_equal(held.state_vector, np.zeros(4))
+        assert not np.shares_memory(held.state_vector, pool._sessions["c"].state_vector)
+        assert pool.get_stats()["buffer_reuses"] >= 1
+    
+    def test_lru_eviction_without_spill(self):
+        pool, _ = _make_pool(max_sessions=2)
+        for tenant in ["a", "b", "c"]:
+            pool.open_session(tenant, _state(tenant))
+        
+        assert not pool.has_session("a")
+        assert pool.get_stats()["dropped"] == 1
+        
+        # 축출된 버퍼는 새 세션에서 재사용
+        pool.open_session("d", _state("d"))
+        assert pool.get_stats()["buffer_reuses"] >= 1
+    
+    def test_spill_and_restore(self, tmp_path):
+        pool, _ = _make_pool(max_sessions=1, spill_dir=str(tmp_path))
+        pool.open_session("a", _state("a"))
+        pool.run_cycle("a", max_steps=1)
+        pool.open_session("b", _state("b"))  # a 스필
+        
+        assert pool.get_stats()["spilled_sessions"] == 1
+        restored = pool.get_state("a")  # b 스필, a 복원
+        
+        np.testing.assert_array_equal(restored.state_vector, np.ones(3))
+        assert restored.metadata["tenant"] == "a"
+        assert pool.get_stats()["restored"] == 1
+    
+    def test_round_robin_fairness(self):
+        pool, engine = _make_pool()
+        pool.open_session("a", _state("a"))
+        pool.open_session("b", _state("b"))
+        for _ in range(3):
+            pool.submit("a", max_steps=1)
+        pool.submit("b", max_steps=1)
+        
+        results = pool.run_pending()
+        
+        assert [sid for sid, _ in results] == ["a", "b", "a", "a"]
+        assert pool.pending_count() == 0
+    
+    def test_open_session_not_evicted_by_pending_sessions(self):
+        pool, _ = _make_pool(max_sessions=1)
+        pool.open_session("a", _state("a"))
+        pool.submit("a", max_steps=1)
+        
+        pool.open_session("b", _state("b"))
+        
+        assert pool.has_session("b")
+        assert not pool.has_session("a")
+    
+    def test_session_not_evicted_while_cycle_runs(self):
+        core = BrainCore(mode="production", enable_logging=False)
+        pool = core.create_session_pool(max_sessions=1)
+        
+        class OpeningEngine:
+            """사이클 도중 다른 세션을 열어 축출 압력을 만드는 엔진"""
+            
+            def update(self, state):
+                if state.metadata.get("tenant") == "a" and not pool.has_session("b"):
+                    pool.open_session("b", _state("b"))
+                state.state_vector = state.state_vector + 1.0
+                state.energy = state.energy - 0.1
+                return state
+        
+        core.register_engine("opener", OpeningEngine(), priority=1)
+        pool.open_session("a", _state("a"))
+        
+        pool.run_cycle("a", max_steps=1)
+        
+        # a는 실행 중이라 남고, 사이클 종료 후 상한 복구 시 b가 축출됨 (a의 결과 보존)
+        assert pool.has_session("a")
+        np.testing.assert_array_equal(pool.get_state("a").state_vector, np.ones(3))
+        assert pool.stats["evicted"] == 1
+    
+    def test_submit_unknown_session(self):
+        pool, _ = _make_pool()
+        with pytest.raises(KeyError):
+            pool.submit("missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
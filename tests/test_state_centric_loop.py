@@ -17,6 +17,9 @@ sys.path.insert(0, str(brain_core_path))
 from brain_core.global_state import GlobalState
 from brain_core.state_centric_execution_loop import StateCentricExecutionLoop
 from brain_core.execution_modes import SelfOrganizingEngine
+from brain_core.instrumentation import EngineProfiler
+from brain_core.event_sink import EventSink
+from brain_core.circuit_breaker import CircuitBreaker, CircuitBreakerSet
 
 
 class MockSelfOrganizingEngine:
@@ -126,5 +129,396 @@ class TestStateCentricExecutionLoop:
         assert trajectory[-1].energy == final_state.energy
 
 
+class FailingEngine:
+    """항상 실패하는 엔진"""
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        raise RuntimeError("broken")
+
+
+class TestEngineProfiler:
+    """엔진별 계측 테스트"""
+    
+    def test_calls_and_histograms(self):
+        """호출 수 및 시간 히스토그램 기록"""
+        profiler = EngineProfiler()
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler)
+        
+        final_state, _ = loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0),
+            engines={"engine": MockSelfOrganizingEngine("engine", energy_reduction=0.1)},
+            max_steps=3,
+            convergence_threshold=1e-9,
+        )
+        
+        stats = profiler.to_dict()["engines"]["engine"]
+        assert stats["calls"] == final_state.step
+        assert stats["wall_time"]["count"] == stats["calls"]
+        assert stats["cpu_time"]["count"] == stats["calls"]
+        assert sum(stats["wall_time"]["buckets"].values()) == stats["calls"]
+    
+    def test_errors_and_skips(self):
+        """오류 및 스킵 사유 기록"""
+        profiler = EngineProfiler()
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler)
+        
+        loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3])),
+            engines={"broken": FailingEngine(), "after": MockSelfOrganizingEngine("after")},
+            max_steps=3,
+        )
+        
+        engines = profiler.to_dict()["engines"]
+        assert engines["broken"]["errors"] == 1
+        assert engines["after"]["skips"] == {"cycle_aborted": 1}
+    
+    def test_allocation_tracing_and_json(self):
+        """tracemalloc 할당 계측 및 JSON 내보내기"""
+        import json
+        
+        class AllocatingEngine:
+            def update(self, state):
+                state.set_extension("buffer", np.ones(10000))
+                return state
+        
+        profiler = EngineProfiler(trace_allocations=True)
+        try:
+            loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler)
+            loop.run_cycle(
+                initial_state=GlobalState(state_vector=np.array([0.5])),
+                engines={"alloc": AllocatingEngine()},
+                max_steps=1,
+            )
+        finally:
+            profiler.close()
+        
+        exported = json.loads(profiler.to_json())
+        assert exported["engines"]["alloc"]["alloc_peak_bytes"] >= 80000
+    
+    def test_brain_core_system_state(self):
+        """BrainCore.get_system_state()로 조회"""
+        from brain_core import BrainCore
+        
+        core = BrainCore(mode="production", enable_logging=False, enable_profiling=True)
+        core.register_engine("engine", MockSelfOrganizingEngine("engine"), priority=1)
+        core.run_cycle(GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0), max_steps=2)
+        
+        assert core.get_system_state()["instrumentation"]["engines"]["engine"]["calls"] > 0
+        assert "instrumentation" not in BrainCore(enable_logging=False).get_system_state()
+
+
+class SoftFailingEngine:
+    """오류를 삼키고 last_error로만 알리는 엔진 (래퍼 패턴)"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.last_error = None
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        self.calls += 1
+        self.last_error = RuntimeError("core failed")
+        state.state_vector = state.state_vector + 0.01
+        state.energy -= 0.01
+        return state
+
+
+class TestCircuitBreaker:
+    """엔진 차단기 테스트"""
+    
+    def test_state_transitions(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10.0, clock=lambda: now[0])
+        
+        breaker.record_failure(ValueError("a"))
+        assert breaker.allow()
+        breaker.record_failure(ValueError("b"))
+        assert breaker.state == "open" and not breaker.allow()
+        
+        now[0] = 10.0
+        assert breaker.allow() and breaker.state == "half_open"
+        assert not breaker.allow()  # 시험 호출은 한 번만
+        breaker.record_failure("again")
+        assert breaker.state == "open"
+        
+        now[0] = 25.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed" and breaker.consecutive_failures == 0
+    
+    def test_soft_failures_open_and_skip(self):
+        """last_error로 보고된 실패도 집계 → 차단 후 호출 중단"""
+        profiler = EngineProfiler()
+        breakers = CircuitBreakerSet(failure_threshold=3, cooldown=60.0)
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler, circuit_breakers=breakers)
+        engine = SoftFailingEngine()
+        
+        loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0),
+            engines={"soft": engine, "healthy": MockSelfOrganizingEngine("healthy", energy_reduction=0.01)},
+            max_steps=10,
+            convergence_threshold=1e-9,
+        )
+        
+        assert engine.calls == 3
+        assert breakers.degraded() == ["soft"]
+        assert profiler.to_dict()["engines"]["soft"]["skips"]["circuit_open"] == 7
+    
+    def test_raising_engine_skipped_in_later_cycles(self):
+        breakers = CircuitBreakerSet(failure_threshold=2, cooldown=60.0)
+        loop = StateCentricExecutionLoop(enable_logging=False, circuit_breakers=breakers)
+        broken = FailingEngine()
+        engines = {"broken": broken, "after": MockSelfOrganizingEngine("after")}
+        state = GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0)
+        
+        for _ in range(2):
+            loop.run_cycle(state, engines, max_steps=3, convergence_threshold=1e-9)
+        assert breakers.get("broken").state == "open"
+        
+        final_state, _ = loop.run_cycle(state, engines, max_steps=3, convergence_threshold=1e-9)
+        assert final_state.step == 3
+        assert final_state.get_extension("after") is not None
+        assert loop.last_cycle_info["failed_engines"] == []  # open 상태라 호출 안 함
+    
+    def test_cycle_completes_while_engine_raises(self):
+        """차단기 사용 시 예외 엔진은 그 사이클에서 제외되고 사이클은 계속 진행"""
+        profiler = EngineProfiler()
+        breakers = CircuitBreakerSet(failure_threshold=5, cooldown=60.0)
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler, circuit_breakers=breakers)
+        engines = {"broken": FailingEngine(), "after": MockSelfOrganizingEngine("after", energy_reduction=0.01)}
+        
+        final_state, _ = loop.run_cycle(
+            GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0), engines,
+            max_steps=4, convergence_threshold=1e-9,
+        )
+        
+        info = loop.last_cycle_info
+        assert final_state.step == 4
+        assert info["status"] == "max_steps"
+        assert info["failed_engines"] == ["broken"]
+        assert breakers.get("broken").consecutive_failures == 1  # 사이클당 한 번만 호출
+        assert profiler.to_dict()["engines"]["broken"]["skips"]["engine_failed"] == 3
+    
+    def test_without_breakers_error_aborts_cycle(self):
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        engines = {"broken": FailingEngine(), "after": MockSelfOrganizingEngine("after")}
+        
+        final_state, _ = loop.run_cycle(GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0), engines)
+        
+        assert final_state.step == 0
+        assert loop.last_cycle_info["status"] == "error"
+    
+    def test_brain_core_reports_degraded_engines(self):
+        from brain_core import BrainCore
+        
+        core = BrainCore(mode="production", enable_logging=False, failure_threshold=2)
+        core.register_engine("soft", SoftFailingEngine(), priority=1)
+        result = core.run_cycle(
+            GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0),
+            max_steps=5,
+            convergence_threshold=1e-9,
+        )
+        
+        assert result["degraded_engines"] == ["soft"]
+        assert core.get_system_state()["circuit_breakers"]["engines"]["soft"]["state"] == "open"
+        assert "degraded_engines" not in BrainCore(enable_logging=False).run_cycle(
+            GlobalState(state_vector=np.array([0.5])), max_steps=1,
+        )
+        assert BrainCore(enable_logging=False).circuit_breakers is None  # 기본값은 차단기 없음
+    
+    def test_half_open_batch_sends_single_probe(self):
+        """run_batch에서 half_open 엔진은 상태 하나로만 시험 호출"""
+        now = [0.0]
+        breakers = CircuitBreakerSet(failure_threshold=1, cooldown=10.0, clock=lambda: now[0])
+        breakers.record_failure("soft", "earlier")
+        now[0] = 10.0
+        loop = StateCentricExecutionLoop(enable_logging=False, circuit_breakers=breakers)
+        engine = SoftFailingEngine()
+        states = [GlobalState(state_vector=np.array([0.5]), energy=1.0) for _ in range(4)]
+        
+        loop.run_batch(states, {"soft": engine}, max_steps=1)
+        
+        assert engine.calls == 1
+        assert breakers.get("soft").state == "open"
+
+
+class SlowEngine(MockSelfOrganizingEngine):
+    """호출마다 지연되는 엔진"""
+    
+    def __init__(self, name: str, delay: float):
+        super().__init__(name, energy_reduction=0.01)
+        self.delay = delay
+        self.calls = 0
+    
+    def update(self, state: GlobalState) -> GlobalState:
+        import time
+        self.calls += 1
+        time.sleep(self.delay)
+        return super().update(state)
+
+
+class TestCycleDeadlines:
+    """사이클 시간 상한 / 엔진별 예산 테스트"""
+    
+    def test_deadline_returns_best_state(self):
+        profiler = EngineProfiler()
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler)
+        
+        final_state, _ = loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3]), energy=10.0),
+            engines={"slow": SlowEngine("slow", 0.01), "fast": MockSelfOrganizingEngine("fast", 0.01)},
+            max_steps=1000,
+            convergence_threshold=1e-12,
+            deadline=0.05,
+        )
+        
+        info = loop.last_cycle_info
+        assert info["deadline_exceeded"] is True
+        assert info["status"] == "deadline_exceeded"
+        assert info["elapsed"] < 0.05 + 0.05  # 엔진 호출 하나 분량 이내로 초과
+        assert 0 < info["steps"] < 1000
+        assert final_state.energy < 10.0
+        engines = profiler.to_dict()["engines"]
+        assert sum(stats["skips"].get("deadline_exceeded", 0) for stats in engines.values()) >= 1
+    
+    def test_engine_budget_skips_remaining_calls(self):
+        profiler = EngineProfiler()
+        loop = StateCentricExecutionLoop(enable_logging=False, profiler=profiler)
+        slow = SlowEngine("slow", 0.005)
+        
+        final_state, _ = loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3]), energy=10.0),
+            engines={"slow": slow, "fast": MockSelfOrganizingEngine("fast", 0.01)},
+            max_steps=20,
+            convergence_threshold=1e-12,
+            engine_budgets={"slow": 0.012},
+        )
+        
+        info = loop.last_cycle_info
+        assert slow.calls < 20
+        assert info["over_budget"] == ["slow"]
+        assert info["deadline_exceeded"] is False
+        assert info["steps"] == 20
+        assert profiler.to_dict()["engines"]["slow"]["skips"]["budget_exceeded"] == 20 - slow.calls
+        assert info["engine_time"]["slow"] > 0.012
+    
+    def test_brain_core_reports_timings(self):
+        from brain_core import BrainCore
+        
+        core = BrainCore(mode="production", enable_logging=False, cycle_deadline=0.02)
+        core.register_engine("slow", SlowEngine("slow", 0.01), priority=1)
+        
+        result = core.run_cycle(GlobalState(state_vector=np.array([0.5, 0.3]), energy=10.0),
+                                max_steps=100, convergence_threshold=1e-12)
+        assert result["deadline_exceeded"] is True
+        assert "slow" in result["timings"]["engine_time"]
+        
+        relaxed = core.run_cycle(GlobalState(state_vector=np.array([0.5, 0.3]), energy=10.0),
+                                 max_steps=2, deadline=10.0)
+        assert relaxed["deadline_exceeded"] is False
+        assert relaxed["timings"]["deadline"] == 10.0
+    
+    def test_cycle_info_is_per_thread(self):
+        """다른 스레드의 사이클이 이 스레드의 last_cycle_info를 덮어쓰지 않음"""
+        import threading
+        
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        engines = {"a": MockSelfOrganizingEngine("a", 0.01)}
+        loop.run_cycle(GlobalState(state_vector=np.array([0.5]), energy=10.0), engines,
+                       max_steps=3, convergence_threshold=1e-12, deadline=7.0)
+        
+        other = threading.Thread(target=loop.run_cycle, kwargs={
+            "initial_state": GlobalState(state_vector=np.array([0.5]), energy=10.0),
+            "engines": engines, "max_steps": 1, "deadline": 1.0,
+        })
+        other.start()
+        other.join()
+        
+        assert loop.last_cycle_info["deadline"] == 7.0
+        assert loop.last_cycle_info["steps"] == 3
+    
+    def test_run_batch_honours_deadline_and_budgets(self):
+        from brain_core import BrainCore
+        
+        core = BrainCore(mode="production", enable_logging=False, cycle_deadline=0.03)
+        core.register_engine("slow", SlowEngine("slow", 0.01), priority=1)
+        states = [GlobalState(state_vector=np.array([0.5, 0.3]), energy=10.0) for _ in range(2)]
+        
+        results = core.run_batch(states, max_steps=1000, convergence_threshold=1e-12)
+        assert all(result["deadline_exceeded"] for result in results)
+        assert results[0]["timings"]["status"] == "deadline_exceeded"
+        assert 0 < results[0]["timings"]["steps"] < 1000
+        
+        slow = SlowEngine("slow", 0.005)
+        loop = StateCentricExecutionLoop(enable_logging=False)
+        loop.run_batch(states, {"slow": slow, "fast": MockSelfOrganizingEngine("fast", 0.01)},
+                       max_steps=10, convergence_threshold=1e-12, engine_budgets={"slow": 0.012})
+        assert loop.last_cycle_info["over_budget"] == ["slow"]
+        assert slow.calls < 20
+
+
+class TestZeroCostLogging:
+    """레벨 인식 지연 로깅 / 이벤트 싱크 테스트"""
+    
+    def test_debug_messages_not_formatted_when_disabled(self, caplog):
+        """DEBUG 비활성 시 로그 인자를 포맷하지 않음"""
+        import logging
+        
+        class CountingRisk(float):
+            formatted = 0
+            
+            def __format__(self, spec):
+                CountingRisk.formatted += 1
+                return float.__format__(self, spec)
+            
+            def __float__(self):
+                CountingRisk.formatted += 1
+                return float(self.real)
+        
+        class RiskEngine:
+            def update(self, state):
+                state.risk = CountingRisk(0.5)
+                state.energy -= 0.1
+                return state
+        
+        # caplog가 테스트 종료 후 로거 레벨을 원래대로 복원
+        caplog.set_level(logging.INFO, logger="StateCentricExecutionLoop")
+        loop = StateCentricExecutionLoop(enable_logging=True)
+        loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5]), energy=1.0),
+            engines={"risk": RiskEngine()},
+            max_steps=3,
+            convergence_threshold=1e-9,
+        )
+        
+        assert CountingRisk.formatted == 0
+    
+    def test_event_sink_records_and_flushes(self):
+        """이벤트 튜플 기록 및 flush"""
+        received = []
+        sink = EventSink(capacity=4, handler=received.extend)
+        loop = StateCentricExecutionLoop(enable_logging=False, event_sink=sink)
+        
+        loop.run_cycle(
+            initial_state=GlobalState(state_vector=np.array([0.5, 0.3]), energy=1.0),
+            engines={"engine": MockSelfOrganizingEngine("engine")},
+            max_steps=5,
+            convergence_threshold=1e-9,
+        )
+        sink.close()
+        
+        assert len(received) == 4  # 링 버퍼 용량만큼 최신 이벤트 유지
+        assert sink.dropped == sink.emitted - 4
+        assert {event for _, _, event, _ in received} <= {"engine_update", "step"}
+    
+    def test_event_sink_background_flush(self):
+        """백그라운드 스레드 flush"""
+        import threading
+        
+        flushed = threading.Event()
+        with EventSink(flush_interval=0.01, handler=lambda events: flushed.set()) as sink:
+            sink.emit("test", "event", 1)
+            assert flushed.wait(2.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])